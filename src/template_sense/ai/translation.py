@@ -135,11 +135,13 @@ def translate_labels(
     Behavior:
     1. Validate inputs (empty list check)
     2. Deduplicate labels internally (efficiency)
-    3. Loop over unique labels:
+    3. If the provider exposes translate_texts(), translate all unique labels
+       in one batch request; on failure fall back to per-label requests
+    4. Loop over any remaining unique labels:
        - Call ai_provider.translate_text() for each
        - Handle individual failures (fallback to original)
-    4. Map results back to original positions
-    5. Log summary statistics
+    5. Map results back to original positions
+    6. Log summary statistics
 
     Args:
         ai_provider: Configured AIProvider instance
@@ -184,7 +186,42 @@ def translate_labels(
     successful_count = 0
     failed_count = 0
 
+    # Batch path: providers exposing translate_texts() bundle every unique
+    # label into a single request instead of one round-trip per label. Any
+    # labels the batch does not cover fall through to the per-label loop.
+    translate_batch = getattr(ai_provider, "translate_texts", None)
+    if translate_batch is not None:
+        try:
+            translated_texts = translate_batch(
+                unique_labels,
+                source_language or "auto",
+                target_language,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batch translation failed ({str(e)}). Falling back to per-label requests."
+            )
+        else:
+            if len(translated_texts) == len(unique_labels):
+                for label, translated_text in zip(unique_labels, translated_texts, strict=True):
+                    translations_map[label] = TranslatedLabel(
+                        original_text=label,
+                        translated_text=translated_text,
+                        detected_source_language=source_language,
+                        target_language=target_language,
+                        model_confidence=None,
+                        metadata={"provider": ai_provider.provider_name},
+                    )
+                    successful_count += 1
+            else:
+                logger.warning(
+                    f"Batch translation returned {len(translated_texts)} results for "
+                    f"{len(unique_labels)} labels. Falling back to per-label requests."
+                )
+
     for label in unique_labels:
+        if label in translations_map:
+            continue
         try:
             # Call AI provider to translate text
             translated_text = ai_provider.translate_text(
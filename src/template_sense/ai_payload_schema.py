@@ -57,10 +57,18 @@ Usage Example:
 """
 
 import logging
-from dataclasses import asdict, dataclass
-from typing import Any
-
-from template_sense.constants import DEFAULT_ADJACENT_CELL_RADIUS, DEFAULT_AI_SAMPLE_ROWS
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, ClassVar, TypedDict
+
+from template_sense.constants import (
+    DEFAULT_ADJACENT_CELL_RADIUS,
+    DEFAULT_AI_SAMPLE_ROWS,
+    DEFAULT_MAX_SAMPLE_CELL_CHARS,
+)
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -102,6 +110,19 @@ class AIHeaderCandidate:
     score: float
     adjacent_cells: dict[str, Any] | None = None
 
+    _AI_FIELDS: ClassVar[tuple[str, ...]] = (
+        "row",
+        "col",
+        "label",
+        "value",
+        "score",
+        "adjacent_cells",
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict via the cached field tuple (no reflection)."""
+        return {name: getattr(self, name) for name in self._AI_FIELDS}
+
 
 @dataclass
 class AITableHeaderCell:
@@ -128,6 +149,12 @@ class AITableHeaderCell:
     value: Any
     score: float
 
+    _AI_FIELDS: ClassVar[tuple[str, ...]] = ("col", "value", "score")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict via the cached field tuple (no reflection)."""
+        return {name: getattr(self, name) for name in self._AI_FIELDS}
+
 
 @dataclass
 class AITableHeaderInfo:
@@ -157,6 +184,14 @@ class AITableHeaderInfo:
     cells: list[AITableHeaderCell]
     detected_pattern: str
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict, recursing into header cells."""
+        return {
+            "row_index": self.row_index,
+            "cells": [cell.to_dict() for cell in self.cells],
+            "detected_pattern": self.detected_pattern,
+        }
+
 
 @dataclass
 class AITableCandidate:
@@ -173,7 +208,10 @@ class AITableCandidate:
         start_col: 1-based start column (inclusive)
         end_col: 1-based end column (inclusive)
         header_row: Detected header row info (None if no header detected)
-        sample_data_rows: First N rows of data (excluding header), as dense 2D array
+        sample_data_rows: First N rows of data (excluding header). Emitted in
+                         columnar {header_label: [values...]} form when a usable
+                         header row exists (fewer prompt tokens), otherwise as a
+                         dense 2D row array
         total_data_rows: Total number of data rows in the table (for context)
         score: Confidence score from table detection heuristics (0.0-1.0)
         detected_pattern: Pattern used to detect this table (e.g., "high_numeric_density")
@@ -200,11 +238,28 @@ class AITableCandidate:
     start_col: int
     end_col: int
     header_row: AITableHeaderInfo | None
-    sample_data_rows: list[list[Any]]
+    sample_data_rows: dict[str, list[Any]] | list[list[Any]]
     total_data_rows: int
     score: float
     detected_pattern: str
 
+    _AI_FIELDS: ClassVar[tuple[str, ...]] = (
+        "start_row",
+        "end_row",
+        "start_col",
+        "end_col",
+        "sample_data_rows",
+        "total_data_rows",
+        "score",
+        "detected_pattern",
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict, recursing into the header row."""
+        result = {name: getattr(self, name) for name in self._AI_FIELDS}
+        result["header_row"] = self.header_row.to_dict() if self.header_row else None
+        return result
+
 
 @dataclass
 class AIPayload:
@@ -242,6 +297,71 @@ class AIPayload:
     table_candidates: list[AITableCandidate]
     field_dictionary: dict[str, dict[str, list[str]]]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict, recursing into candidates."""
+        return {
+            "sheet_name": self.sheet_name,
+            "header_candidates": [candidate.to_dict() for candidate in self.header_candidates],
+            "table_candidates": [candidate.to_dict() for candidate in self.table_candidates],
+            "field_dictionary": self.field_dictionary,
+        }
+
+
+class AIHeaderCandidateDict(TypedDict):
+    """Dict form of AIHeaderCandidate as emitted by build_ai_payload()."""
+
+    row: int
+    col: int
+    label: str
+    value: Any
+    score: float
+    adjacent_cells: dict[str, Any] | None
+
+
+class AITableHeaderCellDict(TypedDict):
+    """Dict form of AITableHeaderCell as emitted by build_ai_payload()."""
+
+    col: int
+    value: Any
+    score: float
+
+
+class AITableHeaderInfoDict(TypedDict):
+    """Dict form of AITableHeaderInfo as emitted by build_ai_payload()."""
+
+    row_index: int
+    cells: list[AITableHeaderCellDict]
+    detected_pattern: str
+
+
+class AITableCandidateDict(TypedDict):
+    """Dict form of AITableCandidate as emitted by build_ai_payload()."""
+
+    start_row: int
+    end_row: int
+    start_col: int
+    end_col: int
+    header_row: AITableHeaderInfoDict | None
+    sample_data_rows: dict[str, list[Any]] | list[list[Any]]
+    total_data_rows: int
+    score: float
+    detected_pattern: str
+
+
+class AIPayloadDict(TypedDict):
+    """
+    Dict form of the complete AI payload returned by build_ai_payload().
+
+    Mirrors the AIPayload dataclass field-for-field; the dataclasses remain
+    the documented schema while this TypedDict types the JSON-ready dict that
+    actually flows to the AI providers.
+    """
+
+    sheet_name: str
+    header_candidates: list[AIHeaderCandidateDict]
+    table_candidates: list[AITableCandidateDict]
+    field_dictionary: dict[str, dict[str, list[str]]]
+
 
 def _extract_adjacent_cells(
     grid: list[list[Any]],
@@ -363,7 +483,11 @@ def _convert_header_candidates(
         >>> len(candidates)
         2
     """
-    candidates = []
+    candidates: list[AIHeaderCandidate] = []
+    # Bind hot attribute lookups to locals; these loops can run over
+    # thousands of cells and LOAD_FAST beats repeated LOAD_ATTR
+    append = candidates.append
+    make_candidate = AIHeaderCandidate
 
     for block in header_blocks:
         block_score = block.get("score", 0.0)
@@ -379,15 +503,77 @@ def _convert_header_candidates(
                     radius=adjacent_cell_radius,
                 )
 
-            candidate = AIHeaderCandidate(
+            label = pair["label"]
+            candidate = make_candidate(
                 row=pair["row"],
                 col=pair["col"],
-                label=pair["label"],
+                label=sys.intern(label) if isinstance(label, str) else label,
                 value=pair["value"],
                 score=block_score,
                 adjacent_cells=adjacent_cells,
             )
-            candidates.append(candidate)
+            append(candidate)
+
+    logger.debug(
+        "Converted %d header blocks to %d header candidates (grid_provided=%s)",
+        len(header_blocks),
+        len(candidates),
+        grid is not None,
+    )
+
+    return candidates
+
+
+def _convert_header_candidates_to_dicts(
+    header_blocks: list[dict[str, Any]],
+    grid: list[list[Any]] | None = None,
+    adjacent_cell_radius: int = DEFAULT_ADJACENT_CELL_RADIUS,
+) -> list[AIHeaderCandidateDict]:
+    """
+    Convert header blocks from sheet summary directly to JSON-ready dicts.
+
+    Dict-emitting counterpart of _convert_header_candidates() used on the
+    payload-building hot path. Produces the same keys as asdict(AIHeaderCandidate)
+    without allocating intermediate dataclass instances.
+
+    Args:
+        header_blocks: List of header block dicts from build_sheet_summary()
+        grid: Optional 2D grid of cell values for adjacent cell extraction
+        adjacent_cell_radius: Number of adjacent cells to extract in each direction
+
+    Returns:
+        List of dicts matching the AIHeaderCandidate schema
+    """
+    candidates: list[AIHeaderCandidateDict] = []
+    # Bind hot attribute lookups to locals; these loops can run over
+    # thousands of cells and LOAD_FAST beats repeated LOAD_ATTR
+    append = candidates.append
+
+    for block in header_blocks:
+        block_score = block.get("score", 0.0)
+
+        for pair in block.get("label_value_pairs", []):
+            # Extract adjacent cells if grid is provided
+            adjacent_cells = None
+            if grid is not None:
+                adjacent_cells = _extract_adjacent_cells(
+                    grid=grid,
+                    row=pair["row"],
+                    col=pair["col"],
+                    radius=adjacent_cell_radius,
+                )
+
+            label = pair["label"]
+            append(
+                {
+                    "row": pair["row"],
+                    "col": pair["col"],
+                    "label": sys.intern(label) if isinstance(label, str) else label,
+                    "value": pair["value"],
+                    "score": block_score,
+                    "adjacent_cells": adjacent_cells,
+                }
+            )
 
     logger.debug(
         "Converted %d header blocks to %d header candidates (grid_provided=%s)",
@@ -433,7 +619,11 @@ def _convert_table_header_info(header_row: dict[str, Any] | None) -> AITableHead
 
     # Create a cell for each header value
     cells = [
-        AITableHeaderCell(col=col_start + i, value=value, score=score)
+        AITableHeaderCell(
+            col=col_start + i,
+            value=sys.intern(value) if isinstance(value, str) else value,
+            score=score,
+        )
         for i, value in enumerate(values)
     ]
 
@@ -444,6 +634,63 @@ def _convert_table_header_info(header_row: dict[str, Any] | None) -> AITableHead
     )
 
 
+def _convert_table_header_info_to_dict(
+    header_row: dict[str, Any] | None,
+) -> AITableHeaderInfoDict | None:
+    """
+    Convert table header row dict directly to a JSON-ready dict.
+
+    Dict-emitting counterpart of _convert_table_header_info() used on the
+    payload-building hot path. Produces the same keys as asdict(AITableHeaderInfo)
+    without allocating intermediate dataclass instances.
+
+    Args:
+        header_row: Header row dict from sheet summary (or None)
+
+    Returns:
+        Dict matching the AITableHeaderInfo schema (or None if input is None)
+    """
+    if header_row is None:
+        return None
+
+    col_start = header_row["col_start"]
+    score = header_row["score"]
+
+    return {
+        "row_index": header_row["row_index"],
+        "cells": [
+            {
+                "col": col_start + i,
+                "value": sys.intern(value) if isinstance(value, str) else value,
+                "score": score,
+            }
+            for i, value in enumerate(header_row["values"])
+        ],
+        "detected_pattern": header_row["detected_pattern"],
+    }
+
+
+def _clip_cell_value(value: Any, max_chars: int) -> Any:
+    """
+    Truncate oversized string cells for the AI payload.
+
+    A single long free-text cell can inflate prompt tokens massively, so
+    string values above max_chars are clipped with an ellipsis marker.
+    Non-string values pass through unchanged.
+
+    Args:
+        value: Cell value of any type
+        max_chars: Maximum characters to keep for string values
+
+    Returns:
+        The original value, or a truncated string ending in "..." if it
+        exceeded the limit
+    """
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + "..."
+    return value
+
+
 def _extract_sample_data_rows(
     table_content: list[list[Any]],
     header_row_index: int | None,
@@ -452,12 +699,17 @@ def _extract_sample_data_rows(
     start_col: int,
     end_col: int,
     max_rows: int,
+    max_cell_chars: int = DEFAULT_MAX_SAMPLE_CELL_CHARS,
 ) -> tuple[list[list[Any]], int]:
     """
     Extract sample data rows from table content.
 
     Converts sparse [row, col, value] format to dense 2D array and extracts
-    the first N data rows (excluding header row).
+    the first N data rows (excluding header row). Only the sampled rows are
+    bucketed and densified, so memory stays O(max_rows x columns) even for
+    very tall tables. Row-major content (the usual sheet-summary order) is
+    walked linearly with itertools.groupby and the scan stops after the last
+    sampled row; unsorted content falls back to a dict-bucketing pass.
 
     Args:
         table_content: List of [row, col, value] tuples from sheet summary
@@ -467,6 +719,7 @@ def _extract_sample_data_rows(
         start_col: Table start column (1-based, inclusive)
         end_col: Table end column (1-based, inclusive)
         max_rows: Maximum number of sample rows to extract
+        max_cell_chars: Maximum characters to keep for string cell values
 
     Returns:
         Tuple of (sample_data_rows, total_data_rows):
@@ -489,11 +742,6 @@ def _extract_sample_data_rows(
         >>> total
         2
     """
-    # Build a sparse dict: (row, col) -> value
-    sparse_grid: dict[tuple[int, int], Any] = {}
-    for row, col, value in table_content:
-        sparse_grid[(row, col)] = value
-
     # Determine which rows are data rows (exclude header if present)
     data_row_indices = []
     for row in range(start_row, end_row + 1):
@@ -506,14 +754,50 @@ def _extract_sample_data_rows(
     # Extract first N data rows
     sample_row_indices = data_row_indices[:max_rows]
 
-    # Convert to dense 2D array
-    sample_data_rows = []
-    for row in sample_row_indices:
-        dense_row = []
-        for col in range(start_col, end_col + 1):
-            value = sparse_grid.get((row, col), None)
-            dense_row.append(value)
-        sample_data_rows.append(dense_row)
+    # Bucket cells by row, keeping only the rows we will actually emit.
+    # Avoids materializing a (row, col) dict for the entire table when only
+    # the first few rows are sampled. The sampled rows are the contiguous
+    # leading slice of the data rows, so membership reduces to two integer
+    # comparisons plus the header exclusion - cheaper than set hashing in
+    # this per-cell loop on 10k+ row tables.
+    last_sample_row = sample_row_indices[-1] if sample_row_indices else start_row - 1
+    width = end_col - start_col + 1
+    clip = _clip_cell_value
+
+    # Sheet-summary content is normally emitted in row-major (row, col) order.
+    # When the first two cells confirm that ordering, walk the rows linearly
+    # with groupby and stop once past the last sampled row - no per-cell dict
+    # inserts and no scan of the table's tail. Unsorted content (e.g. hand
+    # built summaries) falls back to the dict-bucketing path below.
+    row_major = len(table_content) < 2 or tuple(table_content[0][:2]) <= tuple(table_content[1][:2])
+
+    dense_by_row: dict[int, list[Any]] = {}
+    if row_major:
+        for row, cells in groupby(table_content, key=itemgetter(0)):
+            if row > last_sample_row:
+                break
+            if row < start_row or row == header_row_index:
+                continue
+            dense_row = dense_by_row.get(row)
+            if dense_row is None:
+                dense_row = dense_by_row[row] = [None] * width
+            for _, col, value in cells:
+                if start_col <= col <= end_col:
+                    dense_row[col - start_col] = clip(value, max_cell_chars)
+    else:
+        row_cells: dict[int, list[tuple[int, Any]]] = defaultdict(list)
+        for row, col, value in table_content:
+            if start_row <= row <= last_sample_row and row != header_row_index:
+                row_cells[row].append((col, value))
+        for row, cells_for_row in row_cells.items():
+            dense_row = dense_by_row[row] = [None] * width
+            for col, value in cells_for_row:
+                if start_col <= col <= end_col:
+                    dense_row[col - start_col] = clip(value, max_cell_chars)
+
+    sample_data_rows: list[list[Any]] = [
+        dense_by_row[row] if row in dense_by_row else [None] * width for row in sample_row_indices
+    ]
 
     logger.debug(
         "Extracted %d sample rows from table R%d:R%d (total data rows: %d)",
@@ -526,13 +810,53 @@ def _extract_sample_data_rows(
     return sample_data_rows, total_data_rows
 
 
+def _columnarize_sample_rows(
+    sample_data_rows: list[list[Any]],
+    header_row: AITableHeaderInfoDict,
+    start_col: int,
+) -> dict[str, list[Any]] | None:
+    """
+    Convert row-major sample rows to a columnar dict keyed by header label.
+
+    The columnar (structure-of-arrays) layout serializes each header label
+    once instead of forcing the model to re-associate every row's cells with
+    the header, which shrinks prompt tokens when header names are long.
+
+    Args:
+        sample_data_rows: Dense row-major sample rows
+        header_row: Detected header row info dict
+        start_col: Table start column (1-based, inclusive)
+
+    Returns:
+        Dict mapping header labels to column value lists, or None when the
+        header labels cannot serve as unique keys (caller keeps row layout)
+    """
+    labels_by_offset: dict[int, str] = {}
+    for cell in header_row["cells"]:
+        value = cell["value"]
+        if not isinstance(value, str) or not value.strip():
+            return None
+        labels_by_offset[cell["col"] - start_col] = value
+
+    width = len(sample_data_rows[0]) if sample_data_rows else 0
+    if len(labels_by_offset) != width or len(set(labels_by_offset.values())) != width:
+        return None  # Missing or duplicate labels - keep the row layout
+
+    columns: dict[str, list[Any]] = {
+        labels_by_offset[offset]: [row[offset] for row in sample_data_rows]
+        for offset in range(width)
+    }
+    return columns
+
+
 def build_ai_payload(
     sheet_summary: dict[str, Any],
     field_dictionary: dict[str, dict[str, list[str]]],
     grid: list[list[Any]] | None = None,
     max_sample_rows: int = DEFAULT_AI_SAMPLE_ROWS,
     adjacent_cell_radius: int = DEFAULT_ADJACENT_CELL_RADIUS,
-) -> dict[str, Any]:
+    max_cell_chars: int = DEFAULT_MAX_SAMPLE_CELL_CHARS,
+) -> AIPayloadDict:
     """
     Build AI payload from sheet summary and field dictionary.
 
@@ -546,9 +870,10 @@ def build_ai_payload(
         grid: Optional 2D grid of cell values for adjacent cell context extraction
         max_sample_rows: Maximum number of sample data rows to include per table (default: 5)
         adjacent_cell_radius: Number of adjacent cells to extract in each direction (default: 3)
+        max_cell_chars: Truncation limit for string cells in sample data rows (default: 200)
 
     Returns:
-        JSON-serializable dict with AI payload structure matching AIPayload schema
+        JSON-serializable AIPayloadDict matching the AIPayload schema
 
     Raises:
         ValueError: If max_sample_rows is not positive
@@ -584,25 +909,25 @@ def build_ai_payload(
     # Extract sheet name
     sheet_name = sheet_summary.get("sheet_name", "")
 
-    # Convert header blocks to header candidates
+    # Convert header blocks directly to JSON-ready header candidate dicts
     header_blocks = sheet_summary.get("header_blocks", [])
-    header_candidates = _convert_header_candidates(
+    header_candidates = _convert_header_candidates_to_dicts(
         header_blocks=header_blocks,
         grid=grid,
         adjacent_cell_radius=adjacent_cell_radius,
     )
 
-    # Convert table blocks to table candidates
+    # Convert table blocks directly to JSON-ready table candidate dicts
     table_blocks = sheet_summary.get("table_blocks", [])
-    table_candidates = []
+    table_candidates: list[AITableCandidateDict] = []
 
     for table_block in table_blocks:
         # Convert header row (if present)
         header_row_dict = table_block.get("header_row")
-        header_row = _convert_table_header_info(header_row_dict)
+        header_row = _convert_table_header_info_to_dict(header_row_dict)
 
         # Extract sample data rows
-        header_row_index = header_row.row_index if header_row else None
+        header_row_index = header_row["row_index"] if header_row else None
         sample_data_rows, total_data_rows = _extract_sample_data_rows(
             table_content=table_block["content"],
             header_row_index=header_row_index,
@@ -611,29 +936,32 @@ def build_ai_payload(
             start_col=table_block["col_start"],
             end_col=table_block["col_end"],
             max_rows=max_sample_rows,
+            max_cell_chars=max_cell_chars,
         )
 
-        # Build AITableCandidate
-        table_candidate = AITableCandidate(
-            start_row=table_block["row_start"],
-            end_row=table_block["row_end"],
-            start_col=table_block["col_start"],
-            end_col=table_block["col_end"],
-            header_row=header_row,
-            sample_data_rows=sample_data_rows,
-            total_data_rows=total_data_rows,
-            score=table_block["score"],
-            detected_pattern=table_block["detected_pattern"],
+        # Prefer the token-lean columnar layout when the header labels can
+        # key it; fall back to row-major otherwise
+        sample_data: dict[str, list[Any]] | list[list[Any]] = sample_data_rows
+        if header_row is not None and sample_data_rows:
+            columnar = _columnarize_sample_rows(
+                sample_data_rows, header_row, table_block["col_start"]
+            )
+            if columnar is not None:
+                sample_data = columnar
+
+        table_candidates.append(
+            {
+                "start_row": table_block["row_start"],
+                "end_row": table_block["row_end"],
+                "start_col": table_block["col_start"],
+                "end_col": table_block["col_end"],
+                "header_row": header_row,
+                "sample_data_rows": sample_data,
+                "total_data_rows": total_data_rows,
+                "score": table_block["score"],
+                "detected_pattern": table_block["detected_pattern"],
+            }
         )
-        table_candidates.append(table_candidate)
-
-    # Build AIPayload
-    payload = AIPayload(
-        sheet_name=sheet_name,
-        header_candidates=header_candidates,
-        table_candidates=table_candidates,
-        field_dictionary=field_dictionary,
-    )
 
     logger.info(
         "AI payload built: %d header candidates, %d table candidates",
@@ -641,8 +969,13 @@ def build_ai_payload(
         len(table_candidates),
     )
 
-    # Convert to JSON-serializable dict
-    return asdict(payload)
+    # Assemble the payload dict directly (same shape as asdict(AIPayload))
+    return {
+        "sheet_name": sheet_name,
+        "header_candidates": header_candidates,
+        "table_candidates": table_candidates,
+        "field_dictionary": field_dictionary,
+    }
 
 
 __all__ = [
@@ -651,5 +984,10 @@ __all__ = [
     "AITableHeaderInfo",
     "AITableCandidate",
     "AIPayload",
+    "AIHeaderCandidateDict",
+    "AITableHeaderCellDict",
+    "AITableHeaderInfoDict",
+    "AITableCandidateDict",
+    "AIPayloadDict",
     "build_ai_payload",
 ]
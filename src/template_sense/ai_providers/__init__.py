@@ -29,11 +29,11 @@ Usage Example:
     result = provider.classify_fields(payload)
 """
 
-from template_sense.ai_providers.anthropic_provider import AnthropicProvider
+from typing import Any
+
 from template_sense.ai_providers.config import AIConfig, load_ai_config
 from template_sense.ai_providers.factory import get_ai_provider
 from template_sense.ai_providers.interface import AIProvider
-from template_sense.ai_providers.openai_provider import OpenAIProvider
 
 __all__ = [
     "AIProvider",
@@ -43,3 +43,26 @@ __all__ = [
     "OpenAIProvider",
     "AnthropicProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily resolve the concrete provider classes (PEP 562).
+
+    The provider modules import their vendor SDKs (openai, anthropic) at
+    module level, which costs ~100ms of import time and several MB of RSS
+    each. Deferring the import until the class is actually referenced means
+    a process that only ever uses one provider - the normal case, selected
+    via get_ai_provider() - never pays for the other SDK. The factory
+    already imports provider modules lazily; this keeps the package-level
+    re-exports from undoing that.
+    """
+    if name == "OpenAIProvider":
+        from template_sense.ai_providers.openai_provider import OpenAIProvider
+
+        return OpenAIProvider
+    if name == "AnthropicProvider":
+        from template_sense.ai_providers.anthropic_provider import AnthropicProvider
+
+        return AnthropicProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
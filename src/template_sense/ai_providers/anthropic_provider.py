@@ -8,24 +8,88 @@ for Anthropic's API (Claude models). It handles:
 - Error handling and timeout management
 """
 
+import asyncio
 import logging
-
-from anthropic import Anthropic
-
-from template_sense.ai_providers.base_provider import BaseAIProvider
+import random
+import time
+from typing import Any
+
+from anthropic import Anthropic, AsyncAnthropic
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - SDK builds that bundle their own HTTP stack
+    httpx = None
+
+from template_sense.ai_providers.base_provider import (
+    _CLASSIFY_SYSTEM_PREFIX,
+    _TRANSLATE_SYSTEM_PREFIX,
+    _TRANSLATE_SYSTEM_TEMPLATE,
+    BaseAIProvider,
+    _wrap_provider_errors,
+)
 from template_sense.ai_providers.config import AIConfig
+from template_sense.ai_providers.response_cache import (
+    response_cache_get,
+    response_cache_key,
+    response_cache_put,
+)
 from template_sense.constants import (
     AI_CLASSIFICATION_TEMPERATURE,
+    AI_HTTP_MAX_CONNECTIONS,
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    AI_RETRY_MAX_ATTEMPTS,
+    AI_RETRY_MAX_BACKOFF_SECONDS,
+    AI_RETRYABLE_STATUS_CODES,
+    AI_STREAMING_MIN_PAYLOAD_BYTES,
     AI_TRANSLATION_TEMPERATURE,
     ANTHROPIC_CLASSIFICATION_MAX_TOKENS,
     ANTHROPIC_TRANSLATION_MAX_TOKENS,
     DEFAULT_AI_TIMEOUT_SECONDS,
     DEFAULT_ANTHROPIC_MODEL,
+    DEFAULT_MAX_CONCURRENT_AI_REQUESTS,
 )
 from template_sense.errors import AIProviderError
 
 logger = logging.getLogger(__name__)
 
+# Module-level sync client cache keyed by (api_key, timeout). Provider
+# instances constructed with the same credentials (common in per-request web
+# contexts) share one client and its warm connection pool instead of paying
+# httpx startup and TLS setup each time. dict.setdefault is atomic in
+# CPython, so concurrent construction is safe. Async clients are deliberately
+# NOT cached here: httpx pools bind their connections to the event loop they
+# were opened under, so a client shared across asyncio.run() calls fails with
+# "Event loop is closed" in the second loop (see _build_async_client).
+_client_cache: dict[tuple[str, float], Anthropic] = {}
+
+
+def _pooled_http_client_kwargs(timeout: float, is_async: bool) -> dict[str, Any]:
+    """
+    Build http_client kwargs with tuned connection-pool limits.
+
+    Keeping a pool of warm keep-alive connections avoids re-paying TCP/TLS
+    handshakes (tens of ms each) on every request, which matters when the
+    pipeline fires many classification and translation calls back to back.
+    Returns an empty dict when httpx is not importable (some SDK builds
+    bundle their own HTTP stack), leaving the SDK's default client in place.
+
+    Args:
+        timeout: Request timeout in seconds, mirrored onto the HTTP client
+        is_async: Whether to build an AsyncClient instead of a sync Client
+
+    Returns:
+        Kwargs dict with an "http_client" entry, or empty when unavailable
+    """
+    if httpx is None:
+        return {}
+    limits = httpx.Limits(
+        max_keepalive_connections=AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=AI_HTTP_MAX_CONNECTIONS,
+    )
+    client_cls = httpx.AsyncClient if is_async else httpx.Client
+    return {"http_client": client_cls(limits=limits, timeout=timeout)}
+
 
 class AnthropicProvider(BaseAIProvider):
     """
@@ -55,10 +119,23 @@ class AnthropicProvider(BaseAIProvider):
             )
 
         try:
-            self.client = Anthropic(
-                api_key=config.api_key,
-                timeout=config.timeout_seconds or DEFAULT_AI_TIMEOUT_SECONDS,
-            )
+            # The SDK's underlying HTTP client is persistent; caching clients
+            # at module scope shares TLS/connection state across provider
+            # instances created with the same credentials.
+            cache_key = (config.api_key, config.timeout_seconds or DEFAULT_AI_TIMEOUT_SECONDS)
+            client = _client_cache.get(cache_key)
+            if client is None:
+                client = _client_cache.setdefault(
+                    cache_key,
+                    Anthropic(
+                        api_key=cache_key[0],
+                        timeout=cache_key[1],
+                        **_pooled_http_client_kwargs(cache_key[1], is_async=False),
+                    ),
+                )
+            self.client = client
+
+            self.async_client = self._build_async_client()
             logger.debug("Anthropic client initialized successfully")
         except Exception as e:
             raise AIProviderError(
@@ -67,6 +144,50 @@ class AnthropicProvider(BaseAIProvider):
                 request_type="initialization",
             ) from e
 
+        # Precompute the kwargs shared by every messages.create() call so the
+        # hot path only adds the per-call system/messages arguments.
+        self._classify_create_kwargs = {
+            "model": self.model,
+            "max_tokens": ANTHROPIC_CLASSIFICATION_MAX_TOKENS,
+            "temperature": AI_CLASSIFICATION_TEMPERATURE,
+        }
+        self._translate_create_kwargs = {
+            "model": self.model,
+            "max_tokens": ANTHROPIC_TRANSLATION_MAX_TOKENS,
+            "temperature": AI_TRANSLATION_TEMPERATURE,
+        }
+
+    def _build_async_client(self) -> AsyncAnthropic:
+        """
+        Construct a fresh AsyncAnthropic client with pooled HTTP limits.
+
+        Async clients are built per provider instance (and rebuilt after each
+        classify_batch run) rather than cached at module scope: httpx pools
+        bind their connections to the event loop they were opened under, so a
+        client carried across asyncio.run() calls raises "Event loop is
+        closed" on its pooled connections in the next loop.
+
+        Returns:
+            New AsyncAnthropic client for this provider's credentials
+        """
+        timeout = self.config.timeout_seconds or DEFAULT_AI_TIMEOUT_SECONDS
+        return AsyncAnthropic(
+            api_key=self.config.api_key,
+            timeout=timeout,
+            **_pooled_http_client_kwargs(timeout, is_async=True),
+        )
+
+    async def _reset_async_client(self) -> None:
+        """
+        Close the loop-bound async client and hand the next run a fresh one.
+
+        Must run while the event loop that served the client is still alive,
+        so pooled connections close cleanly instead of leaking into a dead
+        loop.
+        """
+        client, self.async_client = self.async_client, self._build_async_client()
+        await client.close()
+
     @property
     def provider_name(self) -> str:
         """Returns 'anthropic'."""
@@ -77,6 +198,240 @@ class AnthropicProvider(BaseAIProvider):
         """Returns the configured model or default 'claude-3-sonnet-20240229'."""
         return self.config.model or DEFAULT_ANTHROPIC_MODEL
 
+    @staticmethod
+    def _build_cached_system_blocks(system_message: str) -> list[dict[str, Any]]:
+        """
+        Wrap a system prompt in cache_control content blocks.
+
+        The system prompts are identical across calls, so marking them with
+        ephemeral cache_control lets the Anthropic API serve the repeated
+        prefix tokens from its prompt cache instead of re-processing them on
+        every request (lower cost and faster TTFT).
+
+        Prompts built from a known shared prefix (the classification
+        boilerplate or the translation instruction) are split into two
+        blocks - invariant prefix first, context/language-specific remainder
+        second - so the first block stays warm even when the context or
+        language pair changes between calls.
+
+        Args:
+            system_message: System prompt text
+
+        Returns:
+            List of text blocks carrying cache_control metadata
+        """
+        blocks: list[dict[str, Any]] = []
+        for prefix in (_CLASSIFY_SYSTEM_PREFIX, _TRANSLATE_SYSTEM_PREFIX):
+            if system_message.startswith(prefix) and len(system_message) > len(prefix):
+                blocks.append(
+                    {
+                        "type": "text",
+                        "text": prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                )
+                system_message = system_message[len(prefix) :]
+                break
+        blocks.append(
+            {
+                "type": "text",
+                "text": system_message,
+                "cache_control": {"type": "ephemeral"},
+            }
+        )
+        return blocks
+
+    @staticmethod
+    def _log_cache_usage(response: Any) -> None:
+        """
+        Log prompt-cache statistics at DEBUG to verify cache hits.
+
+        The API reports cache_read_input_tokens (tokens served from the
+        prompt cache) and cache_creation_input_tokens (tokens written to it)
+        on responses; surfacing them makes it easy to confirm the ephemeral
+        system blocks are actually being reused across calls.
+
+        Args:
+            response: Anthropic API response (usage fields are optional
+                     across SDK versions)
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        cache_created = getattr(usage, "cache_creation_input_tokens", None)
+        if cache_read is not None or cache_created is not None:
+            logger.debug(
+                "Anthropic prompt cache usage: read=%s tokens, created=%s tokens",
+                cache_read,
+                cache_created,
+            )
+
+    @staticmethod
+    def _is_retryable_error(e: Exception) -> bool:
+        """
+        Check whether an API error is transient and worth retrying.
+
+        Matches on status_code rather than exception class so the check works
+        across SDK versions (same approach as BaseAIProvider._wrap_api_error).
+
+        Args:
+            e: Exception raised by the Anthropic SDK
+
+        Returns:
+            True for rate-limit/overload/server errors, False otherwise
+        """
+        return getattr(e, "status_code", None) in AI_RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _retry_delay(e: Exception, attempt: int) -> float:
+        """
+        Compute the backoff delay before the next retry attempt.
+
+        Honors the server's Retry-After header when the SDK exposes it on
+        the error response (rate-limit replies usually include one), and
+        otherwise falls back to exponential backoff with jitter so
+        concurrent workers do not retry in lockstep.
+
+        Args:
+            e: The retryable exception from the Anthropic SDK
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds, capped at AI_RETRY_MAX_BACKOFF_SECONDS
+        """
+        response = getattr(e, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                retry_after = float(headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+            if retry_after is not None and retry_after >= 0:
+                return min(retry_after, AI_RETRY_MAX_BACKOFF_SECONDS)
+        return min(2**attempt + random.random(), AI_RETRY_MAX_BACKOFF_SECONDS)
+
+    def _create_with_retry(self, **create_kwargs: Any) -> Any:
+        """
+        Call messages.create with exponential backoff on transient errors.
+
+        A single 429/529 would otherwise bubble up as AIProviderError and
+        force the caller to redo all upstream work (workbook parse, summary,
+        payload build). Retrying here preserves that compute at the cost of a
+        few bounded sleeps.
+
+        Args:
+            **create_kwargs: Keyword arguments for messages.create()
+
+        Returns:
+            Anthropic API response
+
+        Raises:
+            The last API exception once attempts are exhausted (wrapped into
+            AIProviderError by BaseAIProvider)
+        """
+        for attempt in range(AI_RETRY_MAX_ATTEMPTS):
+            try:
+                return self.client.messages.create(**create_kwargs)
+            except Exception as e:
+                if attempt == AI_RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(
+                    "Transient Anthropic API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    AI_RETRY_MAX_ATTEMPTS,
+                    delay,
+                    type(e).__name__,
+                )
+                time.sleep(delay)
+        raise AIProviderError(  # pragma: no cover - loop always returns or raises
+            provider_name="anthropic",
+            error_details="Retry loop exited unexpectedly",
+            request_type="api_call",
+        )
+
+    def _stream_with_retry(self, **create_kwargs: Any) -> str:
+        """
+        Stream a messages response, with the same retry policy as create.
+
+        Large classification payloads (many candidates, long line_items
+        output) produce responses running to thousands of tokens; streaming
+        lets bytes accumulate as they are generated instead of buffering the
+        whole body server-side, and avoids tripping long-request timeouts.
+        Chunks are joined once at the end (O(n), unlike repeated +=).
+
+        Args:
+            **create_kwargs: Keyword arguments for messages.stream()
+
+        Returns:
+            Full accumulated response text
+
+        Raises:
+            The last API exception once attempts are exhausted (wrapped into
+            AIProviderError by BaseAIProvider)
+        """
+        for attempt in range(AI_RETRY_MAX_ATTEMPTS):
+            try:
+                chunks: list[str] = []
+                with self.client.messages.stream(**create_kwargs) as stream:
+                    for text in stream.text_stream:
+                        chunks.append(text)
+                    final_message = stream.get_final_message()
+                self._log_cache_usage(final_message)
+                return "".join(chunks)
+            except Exception as e:
+                if attempt == AI_RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(
+                    "Transient Anthropic API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    AI_RETRY_MAX_ATTEMPTS,
+                    delay,
+                    type(e).__name__,
+                )
+                time.sleep(delay)
+        raise AIProviderError(  # pragma: no cover - loop always returns or raises
+            provider_name="anthropic",
+            error_details="Retry loop exited unexpectedly",
+            request_type="api_call",
+        )
+
+    async def _create_with_retry_async(self, **create_kwargs: Any) -> Any:
+        """
+        Async counterpart of _create_with_retry using the async client.
+
+        Args:
+            **create_kwargs: Keyword arguments for messages.create()
+
+        Returns:
+            Anthropic API response
+
+        Raises:
+            The last API exception once attempts are exhausted
+        """
+        for attempt in range(AI_RETRY_MAX_ATTEMPTS):
+            try:
+                return await self.async_client.messages.create(**create_kwargs)
+            except Exception as e:
+                if attempt == AI_RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(
+                    "Transient Anthropic API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    AI_RETRY_MAX_ATTEMPTS,
+                    delay,
+                    type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+        raise AIProviderError(  # pragma: no cover - loop always returns or raises
+            provider_name="anthropic",
+            error_details="Retry loop exited unexpectedly",
+            request_type="api_call",
+        )
+
     def _call_classify_api(self, system_message: str, user_message: str) -> str:
         """
         Execute Anthropic API call for classification.
@@ -91,19 +446,35 @@ class AnthropicProvider(BaseAIProvider):
         Raises:
             Anthropic API exceptions (will be wrapped by BaseAIProvider)
         """
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=ANTHROPIC_CLASSIFICATION_MAX_TOKENS,
-            temperature=AI_CLASSIFICATION_TEMPERATURE,
-            system=system_message,
-            messages=[{"role": "user", "content": user_message}],
-        )
-
-        if not response.content:
-            return ""
+        # Only cache deterministic calls (anti-pattern: caching at temperature > 0)
+        cacheable = self._classify_create_kwargs["temperature"] == 0.0
+        if cacheable:
+            cache_key = response_cache_key(self.model, system_message, user_message)
+            cached = response_cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Anthropic response cache hit (classification)")
+                return cached
+
+        if len(user_message) >= AI_STREAMING_MIN_PAYLOAD_BYTES:
+            # Large payloads imply large responses - stream them
+            content = self._stream_with_retry(
+                **self._classify_create_kwargs,
+                system=self._build_cached_system_blocks(system_message),
+                messages=[{"role": "user", "content": user_message}],
+            )
+        else:
+            response = self._create_with_retry(
+                **self._classify_create_kwargs,
+                system=self._build_cached_system_blocks(system_message),
+                messages=[{"role": "user", "content": user_message}],
+            )
+            self._log_cache_usage(response)
+            content = response.content[0].text if response.content else ""
 
-        content = response.content[0].text
-        return content or ""
+        content = content or ""
+        if cacheable and content:
+            response_cache_put(cache_key, content)
+        return content
 
     def _call_batch_classify_api(self, system_message: str, user_message: str) -> str:
         """
@@ -119,13 +490,12 @@ class AnthropicProvider(BaseAIProvider):
         Raises:
             Anthropic API exceptions (will be wrapped by BaseAIProvider)
         """
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=ANTHROPIC_CLASSIFICATION_MAX_TOKENS,
-            temperature=AI_CLASSIFICATION_TEMPERATURE,
-            system=system_message,
+        response = self._create_with_retry(
+            **self._classify_create_kwargs,
+            system=self._build_cached_system_blocks(system_message),
             messages=[{"role": "user", "content": user_message}],
         )
+        self._log_cache_usage(response)
 
         if not response.content:
             return ""
@@ -147,13 +517,12 @@ class AnthropicProvider(BaseAIProvider):
         Raises:
             Anthropic API exceptions (will be wrapped by BaseAIProvider)
         """
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=ANTHROPIC_TRANSLATION_MAX_TOKENS,
-            temperature=AI_TRANSLATION_TEMPERATURE,
-            system=system_message,
+        response = self._create_with_retry(
+            **self._translate_create_kwargs,
+            system=self._build_cached_system_blocks(system_message),
             messages=[{"role": "user", "content": user_message}],
         )
+        self._log_cache_usage(response)
 
         if not response.content:
             return ""
@@ -161,6 +530,188 @@ class AnthropicProvider(BaseAIProvider):
         content = response.content[0].text
         return content or ""
 
+    async def _call_classify_api_async(self, system_message: str, user_message: str) -> str:
+        """
+        Execute async Anthropic API call for classification.
+
+        Args:
+            system_message: System prompt for classification
+            user_message: User prompt with payload data
+
+        Returns:
+            Raw response text from Anthropic API
+
+        Raises:
+            Anthropic API exceptions (will be wrapped by classify_fields_async)
+        """
+        # Only cache deterministic calls (anti-pattern: caching at temperature > 0)
+        cacheable = self._classify_create_kwargs["temperature"] == 0.0
+        if cacheable:
+            cache_key = response_cache_key(self.model, system_message, user_message)
+            cached = response_cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Anthropic response cache hit (classification)")
+                return cached
+
+        response = await self._create_with_retry_async(
+            **self._classify_create_kwargs,
+            system=self._build_cached_system_blocks(system_message),
+            messages=[{"role": "user", "content": user_message}],
+        )
+        self._log_cache_usage(response)
+
+        content = response.content[0].text if response.content else ""
+        content = content or ""
+        if cacheable and content:
+            response_cache_put(cache_key, content)
+        return content
+
+    @_wrap_provider_errors("classify_fields")
+    async def classify_fields_async(
+        self, payload: dict[str, Any], context: str = "headers"
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of classify_fields().
+
+        Mirrors the sync classification path (context validation, prompt
+        building, response parsing) but issues the API call through the
+        AsyncAnthropic client so multiple classifications can overlap their
+        network I/O.
+
+        Args:
+            payload: AI payload dict from build_ai_payload()
+            context: Classification context - "headers", "columns", or "line_items"
+
+        Returns:
+            Dict with classification results (structure depends on context)
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+            ValueError: If context is not a supported value
+        """
+        self._validate_context(context)
+
+        system_message = self._build_system_prompt(context)
+        user_message = self._build_user_prompt(payload, context)
+
+        logger.debug(
+            "Sending async classify_fields request (provider=%s, model=%s, context=%s)",
+            self.provider_name,
+            self.model,
+            context,
+        )
+
+        response_text = await self._call_classify_api_async(system_message, user_message)
+
+        return self._parse_and_validate_response(response_text, context, "classify_fields")
+
+    @_wrap_provider_errors("translate_text")
+    async def translate_text_async(
+        self, text: str, source_lang: str, target_lang: str = "en"
+    ) -> str:
+        """
+        Async counterpart of translate_text().
+
+        Mirrors the sync translation path (prompt building, empty-response
+        validation, error wrapping) but issues the API call through the
+        AsyncAnthropic client so many label translations can overlap their
+        network I/O instead of paying one round-trip each, serially.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code (e.g., "ja", "zh")
+            target_lang: Target language code (default: "en")
+
+        Returns:
+            Translated text
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+        """
+        system_message = _TRANSLATE_SYSTEM_TEMPLATE.format(
+            source_lang=source_lang, target_lang=target_lang
+        )
+
+        logger.debug(
+            "Sending async translate_text request (provider=%s, model=%s, %s→%s)",
+            self.provider_name,
+            self.model,
+            source_lang,
+            target_lang,
+        )
+
+        response = await self._create_with_retry_async(
+            **self._translate_create_kwargs,
+            system=self._build_cached_system_blocks(system_message),
+            messages=[{"role": "user", "content": text}],
+        )
+
+        translated = response.content[0].text if response.content else ""
+        if not translated:
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details="Empty translation response from API",
+                request_type="translate_text",
+            )
+
+        return translated.strip()
+
+    def classify_batch(
+        self,
+        payloads: list[dict[str, Any]],
+        context: str = "headers",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_AI_REQUESTS,
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Classify multiple payloads concurrently (e.g., multi-sheet workbooks).
+
+        Fires all classification requests through the async client with
+        bounded concurrency, turning N sequential round-trips into overlapped
+        network I/O. Failures do not abort the batch: each failed payload
+        yields an AIProviderError in its result slot instead of a dict, so
+        callers can recover per-sheet.
+
+        Args:
+            payloads: List of AI payload dicts from build_ai_payload()
+            context: Classification context applied to all payloads
+            max_concurrency: Maximum simultaneous in-flight requests
+
+        Returns:
+            List aligned with payloads; each item is either a classification
+            result dict or the exception raised for that payload
+
+        Raises:
+            ValueError: If context is not a supported value
+        """
+        self._validate_context(context)
+
+        async def _run_batch() -> list[dict[str, Any] | Exception]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _classify_one(payload: dict[str, Any]) -> dict[str, Any]:
+                async with semaphore:
+                    return await self.classify_fields_async(payload, context)
+
+            try:
+                return await asyncio.gather(
+                    *(_classify_one(payload) for payload in payloads),
+                    return_exceptions=True,
+                )
+            finally:
+                # This asyncio.run-owned loop dies when the batch returns;
+                # close the client's loop-bound connections now so the next
+                # batch does not fail on a pool tied to a closed loop
+                await self._reset_async_client()
+
+        logger.info(
+            "Classifying batch of %d payloads (context=%s, max_concurrency=%d)",
+            len(payloads),
+            context,
+            max_concurrency,
+        )
+
+        return asyncio.run(_run_batch())
+
     def _call_generate_api(
         self,
         prompt: str,
@@ -205,7 +756,7 @@ class AnthropicProvider(BaseAIProvider):
         if final_system_message:
             request_params["system"] = final_system_message
 
-        response = self.client.messages.create(**request_params)
+        response = self._create_with_retry(**request_params)
 
         if not response.content:
             return ""
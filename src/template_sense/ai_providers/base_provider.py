@@ -16,17 +16,318 @@ Classes:
     BaseAIProvider: Abstract base class with shared provider logic
 """
 
+import functools
+import inspect
 import json
 import logging
+import os
+import re
 from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from template_sense.ai_providers.interface import AIProvider
+from template_sense.constants import (
+    AI_BATCH_TRANSLATION_MAX_TOKENS,
+    AI_TRANSLATION_TEMPERATURE,
+    MAX_AI_PAYLOAD_BYTES,
+    SEMANTIC_CACHE_ENV_VAR,
+    TRANSLATION_CACHE_MAX_ENTRIES,
+)
 from template_sense.errors import AIProviderError
-from template_sense.serialization import serialize_to_json
+from template_sense.serialization import deserialize_from_json, serialize_to_json
 
 logger = logging.getLogger(__name__)
 
+# Cross-call translation cache shared by all provider instances.
+#
+# Invoice templates repeat header vocabulary heavily ("小計", "合計", "数量"),
+# so byte-identical (model, language pair, text) requests are always deduped -
+# each hit replaces a full API round-trip with a dict lookup.
+#
+# With TEMPLATE_SENSE_SEMANTIC_CACHE=1, keys are additionally normalized
+# (whitespace collapsed, case folded, edge punctuation stripped) so cosmetic
+# variants like "請求書番号:" and " 請求書番号 " collapse onto one entry. An
+# embedding-based nearest-neighbor cache would catch paraphrases too, but that
+# needs heavyweight optional dependencies (sentence encoders, a vector index);
+# normalized exact matching covers the variants seen in practice with zero
+# extra cost.
+_translation_cache: OrderedDict[tuple[str, str, str, str], str] = OrderedDict()
+
+# Punctuation commonly glued onto labels (trailing colons, bullets, pipes)
+_TRANSLATION_KEY_EDGE_CHARS = ":：;；,，.。|・=-–—"
+_TRANSLATION_KEY_EDGE_RE = re.compile(
+    f"^[{re.escape(_TRANSLATION_KEY_EDGE_CHARS)}\\s]+|[{re.escape(_TRANSLATION_KEY_EDGE_CHARS)}\\s]+$"
+)
+
+
+def _normalized_cache_enabled() -> bool:
+    """Check whether the opt-in normalized (semantic) cache key is switched on."""
+    return os.environ.get(SEMANTIC_CACHE_ENV_VAR) == "1"
+
+
+def _translation_cache_key(
+    model: str, text: str, source_lang: str, target_lang: str
+) -> tuple[str, str, str, str]:
+    """
+    Build the cache key for a translation request.
+
+    Byte-exact by default (stripped text only). When the semantic cache is
+    enabled, internal whitespace is collapsed, case is folded, and edge
+    punctuation stripped so cosmetic variants of the same label share one
+    cache entry.
+
+    Args:
+        model: Model name serving the translation
+        text: Source text being translated
+        source_lang: Source language code
+        target_lang: Target language code
+
+    Returns:
+        (model, source_lang, target_lang, key_text) tuple
+    """
+    if _normalized_cache_enabled():
+        normalized = _TRANSLATION_KEY_EDGE_RE.sub("", " ".join(text.split())).casefold()
+        return (model, source_lang, target_lang, normalized or text)
+    return (model, source_lang, target_lang, text.strip())
+
+
+def _translation_cache_put(key: tuple[str, str, str, str], translated: str) -> None:
+    """Store a translation, evicting the least recently used entry when full."""
+    _translation_cache[key] = translated
+    _translation_cache.move_to_end(key)
+    while len(_translation_cache) > TRANSLATION_CACHE_MAX_ENTRIES:
+        _translation_cache.popitem(last=False)
+
+
+def _wrap_provider_errors(request_type: str) -> Callable:
+    """
+    Decorator mapping provider SDK exceptions to AIProviderError.
+
+    Every public template method used to repeat the same ~10-line except
+    chain (re-raise AIProviderError and ValueError, wrap everything else via
+    _wrap_api_error). Consolidating it here keeps the error-handling policy
+    in one place, so the request_type label cannot drift from the method it
+    annotates, and the method bodies stay on the happy path.
+
+    Works on both sync and async methods of BaseAIProvider subclasses.
+
+    Args:
+        request_type: Operation label recorded on the raised AIProviderError
+            (e.g., "classify_fields", "translate_text")
+
+    Returns:
+        Decorator that wraps the method with the shared exception mapping
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(self, *args, **kwargs)
+                except (AIProviderError, ValueError):
+                    raise
+                except Exception as e:
+                    raise self._wrap_api_error(e, request_type) from e
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, *args, **kwargs)
+            except (AIProviderError, ValueError):
+                raise
+            except Exception as e:
+                raise self._wrap_api_error(e, request_type) from e
+
+        return wrapper
+
+    return decorator
+
+
+# Static system prompts, built once at import time. These strings are identical
+# for every request, so rebuilding them per call only burns CPU on the hot path.
+#
+# Each full prompt is the invariant _CLASSIFY_SYSTEM_PREFIX followed by a
+# context-specific body. Keeping the shared boilerplate as a byte-identical
+# leading block lets providers with prefix-based prompt caching (Anthropic)
+# keep one warm cache entry across headers/columns/line_items calls instead
+# of invalidating it whenever the context switches.
+_CLASSIFY_SYSTEM_PREFIX = (
+    "You are a classification assistant for invoice templates. "
+    "Analyze the provided input and classify it semantically. "
+    "Return your response as valid JSON matching the exact schema in the "
+    "instructions below - no explanations, no markdown fences, JSON only."
+)
+
+_HEADERS_SYSTEM_PROMPT = _CLASSIFY_SYSTEM_PREFIX + (
+    "\n\nYou are a field classification assistant for invoice templates. "
+    "Analyze the provided header fields and classify each field "
+    "semantically based on common invoice terminology.\n\n"
+    "PATTERN DETECTION:\n"
+    "1. Multi-cell patterns: Label in one cell, value in adjacent cell\n"
+    "   - Check adjacent_cells to find related values\n"
+    "   - Common patterns: label on left, value on right (or above/below)\n"
+    '   - Example: "Invoice:" in col 1, "12345" in col 3 (right_2)\n'
+    "2. Same-cell patterns: Label and value in same cell with delimiter\n"
+    '   - Common delimiters: ":", "-", "=", "|"\n'
+    '   - Example: "Invoice Number: INV-12345"\n\n'
+    "When you detect these patterns, populate both raw_label and raw_value fields. "
+    "Set label_col_offset and value_col_offset to indicate where label/value are "
+    "relative to the main cell (0 = same cell, positive = cells to the right).\n\n"
+    "Return your response as valid JSON matching this exact schema:\n"
+    "{\n"
+    '  "headers": [\n'
+    "    {\n"
+    '      "raw_label": "Invoice Number",  // The label text (or null)\n'
+    '      "raw_value": "INV-12345",       // The value text (or null)\n'
+    '      "block_index": 0,               // Header block index (integer)\n'
+    '      "row_index": 1,                 // Row position (integer)\n'
+    '      "col_index": 1,                 // Column position (integer)\n'
+    '      "label_col_offset": 0,          // Offset from main cell to label (optional, default 0)\n'
+    '      "value_col_offset": 2,          // Offset from main cell to value (optional, default 0)\n'
+    '      "pattern_type": "multi_cell",   // "multi_cell", "same_cell", or null (optional)\n'
+    '      "model_confidence": 0.95        // Confidence 0.0-1.0 (optional)\n'
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+    "Required fields: raw_label, raw_value, block_index, row_index, col_index.\n"
+    "Optional fields: label_col_offset, value_col_offset, pattern_type, model_confidence."
+)
+
+_COLUMNS_SYSTEM_PROMPT = _CLASSIFY_SYSTEM_PREFIX + (
+    "\n\nYou are a table column classification assistant for invoice templates. "
+    "Analyze the provided table columns and classify each column "
+    "semantically based on common invoice table structures.\n\n"
+    "Return your response as valid JSON matching this exact schema:\n"
+    "{\n"
+    '  "columns": [\n'
+    "    {\n"
+    '      "raw_label": "Item Code",        // Column header text (or null)\n'
+    '      "raw_position": 0,               // Column position in table (integer)\n'
+    '      "table_block_index": 0,          // Table block index (integer)\n'
+    '      "row_index": 5,                  // Header row position (integer)\n'
+    '      "col_index": 2,                  // Column position in sheet (integer)\n'
+    '      "sample_values": ["A", "B"],     // Sample values from column (array)\n'
+    '      "model_confidence": 0.95         // Confidence 0.0-1.0 (optional)\n'
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+    "All fields except model_confidence are required. sample_values must be an array."
+)
+
+_LINE_ITEMS_SYSTEM_PROMPT = _CLASSIFY_SYSTEM_PREFIX + (
+    "\n\nYou are a line item extraction assistant for invoice templates. "
+    "Analyze the provided table rows and extract individual line items.\n\n"
+    "Return your response as valid JSON matching this exact schema:\n"
+    "{\n"
+    '  "line_items": [\n'
+    "    {\n"
+    '      "table_index": 0,                // Table index (integer)\n'
+    '      "row_index": 6,                  // Row position (integer)\n'
+    '      "is_subtotal": false,            // True if subtotal row (boolean)\n'
+    '      "columns": {"item": "Widget"},   // Column values (object)\n'
+    '      "model_confidence": 0.90         // Confidence 0.0-1.0 (optional)\n'
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+    "All fields except model_confidence are required."
+)
+
+_SYSTEM_PROMPTS = {
+    "headers": _HEADERS_SYSTEM_PROMPT,
+    "columns": _COLUMNS_SYSTEM_PROMPT,
+    "line_items": _LINE_ITEMS_SYSTEM_PROMPT,
+}
+
+# Translation prompt: invariant instruction first, language pair last, so the
+# shared prefix stays cacheable across different language pairs.
+_TRANSLATE_SYSTEM_PREFIX = (
+    "You are a professional translator. Return only the translated text, nothing else."
+)
+
+_TRANSLATE_SYSTEM_TEMPLATE = (
+    _TRANSLATE_SYSTEM_PREFIX + " Translate the given text from {source_lang} to {target_lang}."
+)
+
+_TRANSLATE_BATCH_SYSTEM_TEMPLATE = (
+    "You are a professional translator. Translate each string in the input"
+    ' JSON array "texts" from {source_lang} to {target_lang}. Return JSON:'
+    ' {{"translations": [...]}} preserving order and length.'
+)
+
+# Hot-path lookup tables, built once at import time instead of per call
+_VALID_CONTEXTS = frozenset({"headers", "columns", "line_items"})
+
+_CONTEXT_DESCRIPTIONS = {
+    "headers": "invoice template header fields",
+    "columns": "invoice table columns",
+    "line_items": "invoice table line items",
+}
+
+_CONTEXT_INSTRUCTIONS = {
+    "headers": (
+        "Analyze header fields and classify each field semantically.\n\n"
+        "PATTERN DETECTION:\n"
+        "1. Multi-cell patterns: Label in one cell, value in adjacent cell\n"
+        "2. Same-cell patterns: Label and value in same cell with delimiter\n\n"
+        "Required fields: raw_label, raw_value, block_index, row_index, col_index\n"
+        "Optional fields: label_col_offset, value_col_offset, pattern_type, model_confidence"
+    ),
+    "columns": (
+        "Analyze table columns and classify each column semantically.\n\n"
+        "Required fields: raw_label, raw_position, table_block_index, row_index, col_index, sample_values\n"
+        "Optional fields: model_confidence"
+    ),
+    "line_items": (
+        "Extract individual line items from table rows.\n\n"
+        "Required fields: table_index, row_index, is_subtotal, columns\n"
+        "Optional fields: model_confidence"
+    ),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _batch_system_prompt(contexts: tuple[str, ...]) -> str:
+    """
+    Assemble the combined system prompt for a batch-classification call.
+
+    Args:
+        contexts: Contexts to include, as a hashable tuple
+
+    Returns:
+        Combined system prompt with instructions for all contexts
+    """
+    prompt_parts = [
+        "You are a multi-task field classification assistant for invoice templates. ",
+        "You will classify multiple types of invoice data in a single response.\n\n",
+    ]
+
+    # Add context-specific instructions
+    for context in contexts:
+        instructions = _CONTEXT_INSTRUCTIONS.get(context, "")
+        prompt_parts.append(f"## {context.upper()}\n{instructions}\n\n")
+
+    # Add combined response schema
+    prompt_parts.append("## RESPONSE FORMAT\n")
+    prompt_parts.append("Return a single JSON object with the following structure:\n")
+    prompt_parts.append("{\n")
+
+    for i, context in enumerate(contexts):
+        comma = "," if i < len(contexts) - 1 else ""
+        prompt_parts.append(f'  "{context}": [...]  // Array of classified items{comma}\n')
+
+    prompt_parts.append("}\n\n")
+    prompt_parts.append(
+        "All fields must be included. If a section has no items, use an empty array []."
+    )
+
+    return "".join(prompt_parts)
+
 
 class BaseAIProvider(AIProvider):
     """
@@ -55,6 +356,13 @@ class BaseAIProvider(AIProvider):
         ...         return response.choices[0].message.content
     """
 
+    # Classification prompts, shared by all instances via the class attribute
+    # (built once at import time - no per-call or per-init string assembly).
+    # A subclass or an individual instance can rebind this to customize
+    # prompts without touching the template methods.
+    _system_prompts: dict[str, str] = _SYSTEM_PROMPTS
+
+    @_wrap_provider_errors("classify_fields")
     def classify_fields(self, payload: dict[str, Any], context: str = "headers") -> dict[str, Any]:
         """
         Classify header fields and table columns using AI.
@@ -79,34 +387,236 @@ class BaseAIProvider(AIProvider):
         # Validate context
         self._validate_context(context)
 
-        try:
-            # Build context-aware prompts (shared logic)
-            system_message = self._build_system_prompt(context)
-            user_message = self._build_user_prompt(payload, context)
+        # Build context-aware prompts (shared logic)
+        system_message = self._build_system_prompt(context)
+        user_message = self._build_user_prompt(payload, context)
+
+        # Cheap size guard: shard oversized payloads instead of paying
+        # latency for a request the API will reject or process slowly
+        payload_bytes = len(user_message.encode("utf-8"))
+        if payload_bytes > MAX_AI_PAYLOAD_BYTES:
+            shard_key = "header_candidates" if context == "headers" else "table_candidates"
+            if len(payload.get(shard_key, [])) > 1:
+                logger.warning(
+                    "Payload is %d bytes (limit %d); sharding %s before sending",
+                    payload_bytes,
+                    MAX_AI_PAYLOAD_BYTES,
+                    shard_key,
+                )
+                return self._classify_fields_sharded(payload, context, shard_key)
+            logger.warning(
+                "Payload is %d bytes (limit %d) but cannot be sharded further",
+                payload_bytes,
+                MAX_AI_PAYLOAD_BYTES,
+            )
 
-            logger.debug(
-                "Sending classify_fields request (provider=%s, model=%s, context=%s)",
-                self.provider_name,
-                self.model,
-                context,
+        logger.debug(
+            "Sending classify_fields request (provider=%s, model=%s, context=%s)",
+            self.provider_name,
+            self.model,
+            context,
+        )
+
+        # Call provider-specific API (delegated to subclass)
+        response_text = self._call_classify_api(system_message, user_message)
+
+        # Parse and validate response (shared logic)
+        return self._parse_and_validate_response(response_text, context, "classify_fields")
+
+    def _classify_fields_sharded(
+        self, payload: dict[str, Any], context: str, shard_key: str
+    ) -> dict[str, Any]:
+        """
+        Split an oversized payload in half and classify each shard.
+
+        Recursion through classify_fields() keeps halving until each shard
+        fits under MAX_AI_PAYLOAD_BYTES or can no longer be split. Table
+        indices in the second shard's results are re-offset so merged output
+        matches what a single request would have returned.
+
+        Args:
+            payload: AI payload dict that exceeded the size limit
+            context: Classification context
+            shard_key: Payload key being split ("header_candidates" or
+                "table_candidates")
+
+        Returns:
+            Merged classification results dict
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+        """
+        items = payload[shard_key]
+        mid = len(items) // 2
+
+        first_result = self.classify_fields({**payload, shard_key: items[:mid]}, context)
+        second_result = self.classify_fields({**payload, shard_key: items[mid:]}, context)
+
+        expected_key = self._get_expected_response_key(context)
+        second_items = second_result.get(expected_key, [])
+
+        # Results in the second shard index into its truncated candidate
+        # list, so shift them back to absolute positions
+        if shard_key == "table_candidates":
+            index_key = "table_index" if context == "line_items" else "table_block_index"
+            for item in second_items:
+                if isinstance(item, dict) and isinstance(item.get(index_key), int):
+                    item[index_key] += mid
+
+        return {expected_key: first_result.get(expected_key, []) + second_items}
+
+    @_wrap_provider_errors("classify_fields_batch")
+    def classify_fields_batch(
+        self, payloads: list[dict[str, Any]], context: str = "headers"
+    ) -> list[dict[str, Any]]:
+        """
+        Classify multiple payloads in a single row-marshaled API request.
+
+        Marshals N payloads into one numbered JSON array in the user prompt,
+        amortizing the per-request overhead (connection, system prompt
+        processing, response startup) across all of them instead of paying it
+        once per payload. Useful when many sheets/templates need the same
+        classification context and rate limits make parallel single calls
+        impractical.
+
+        Args:
+            payloads: List of AI payload dicts from build_ai_payload()
+            context: Classification context applied to every payload
+
+        Returns:
+            List aligned with payloads; each item is the classification
+            result dict for the corresponding payload
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+            ValueError: If context is not a supported value
+        """
+        self._validate_context(context)
+
+        if not payloads:
+            return []
+        if len(payloads) == 1:
+            return [self.classify_fields(payloads[0], context)]
+
+        expected_key = self._get_expected_response_key(context)
+
+        system_message = self._build_system_prompt(context)
+        count = len(payloads)
+        user_message = (
+            f"Classify each of the following {count} invoice inputs independently. "
+            f"Return a JSON array of exactly {count} objects, in input order. "
+            f"Each object must match the response schema above (including its "
+            f"'{expected_key}' key) for the corresponding input.\n\n"
+            + serialize_to_json(
+                [
+                    {"input_index": index, "payload": payload}
+                    for index, payload in enumerate(payloads)
+                ]
+            )
+        )
+
+        # Same size guard as classify_fields: an oversized batch request
+        # would be rejected or processed slowly, so split it in half and
+        # recurse until each sub-batch fits
+        payload_bytes = len(user_message.encode("utf-8"))
+        if payload_bytes > MAX_AI_PAYLOAD_BYTES:
+            logger.warning(
+                "Batch payload is %d bytes (limit %d); splitting %d payloads into sub-batches",
+                payload_bytes,
+                MAX_AI_PAYLOAD_BYTES,
+                count,
+            )
+            mid = count // 2
+            return self.classify_fields_batch(payloads[:mid], context) + self.classify_fields_batch(
+                payloads[mid:], context
             )
 
-            # Call provider-specific API (delegated to subclass)
-            response_text = self._call_classify_api(system_message, user_message)
+        logger.debug(
+            "Sending classify_fields_batch request (provider=%s, model=%s, "
+            "context=%s, batch_size=%d)",
+            self.provider_name,
+            self.model,
+            context,
+            count,
+        )
+
+        response_text = self._call_batch_classify_api(system_message, user_message)
+
+        return self._parse_and_validate_batch_list_response(
+            response_text, context, count, "classify_fields_batch"
+        )
+
+    def _parse_and_validate_batch_list_response(
+        self, content: str, context: str, expected_count: int, request_type: str
+    ) -> list[dict[str, Any]]:
+        """
+        Parse a row-marshaled batch response into per-payload result dicts.
 
-            # Parse and validate response (shared logic)
-            return self._parse_and_validate_response(response_text, context, "classify_fields")
+        Args:
+            content: Raw response text from API (expected: JSON array)
+            context: Classification context
+            expected_count: Number of results the array must contain
+            request_type: Type of request (for error messages)
 
-        except AIProviderError:
-            # Re-raise our own errors
-            raise
-        except ValueError:
-            # Re-raise validation errors
-            raise
-        except Exception as e:
-            # Wrap provider-specific exceptions
-            raise self._wrap_api_error(e, "classify_fields") from e
+        Returns:
+            List of parsed and validated result dicts
+
+        Raises:
+            AIProviderError: If response is empty, invalid JSON, the wrong
+                            length, or any item is missing the expected key
+        """
+        if not content:
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details="Empty response from API",
+                request_type=request_type,
+            )
 
+        try:
+            result = deserialize_from_json(content)
+        except json.JSONDecodeError as e:
+            # Tolerate a text preamble before the JSON array (same recovery
+            # strategy as _parse_and_validate_response)
+            json_start = content.find("[")
+            if json_start > 0:
+                try:
+                    result = deserialize_from_json(content[json_start:])
+                except json.JSONDecodeError:
+                    raise AIProviderError(
+                        provider_name=self.provider_name,
+                        error_details=f"Invalid JSON in response: {str(e)}",
+                        request_type=request_type,
+                    ) from e
+            else:
+                raise AIProviderError(
+                    provider_name=self.provider_name,
+                    error_details=f"Invalid JSON in response: {str(e)}",
+                    request_type=request_type,
+                ) from e
+
+        if not isinstance(result, list) or len(result) != expected_count:
+            received = len(result) if isinstance(result, list) else type(result).__name__
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details=(f"Expected JSON array of {expected_count} results, got {received}"),
+                request_type=request_type,
+            )
+
+        expected_key = self._get_expected_response_key(context)
+        for index, item in enumerate(result):
+            if not isinstance(item, dict) or expected_key not in item:
+                raise AIProviderError(
+                    provider_name=self.provider_name,
+                    error_details=(
+                        f"Batch result {index} missing '{expected_key}' key "
+                        f"for context '{context}'"
+                    ),
+                    request_type=request_type,
+                )
+
+        return result
+
+    @_wrap_provider_errors("classify_all_fields")
     def classify_all_fields(
         self, payload: dict[str, Any], contexts: list[str] = None
     ) -> dict[str, Any]:
@@ -138,36 +648,26 @@ class BaseAIProvider(AIProvider):
         for context in contexts:
             self._validate_context(context)
 
-        try:
-            # Build batch system prompt (shared logic)
-            system_message = self._build_batch_system_prompt(contexts)
-            user_message = self._build_batch_user_prompt(payload, contexts)
-
-            logger.debug(
-                "Sending classify_all_fields request (provider=%s, model=%s, contexts=%s)",
-                self.provider_name,
-                self.model,
-                contexts,
-            )
+        # Build batch system prompt (shared logic)
+        system_message = self._build_batch_system_prompt(contexts)
+        user_message = self._build_batch_user_prompt(payload, contexts)
 
-            # Call provider-specific batch API (delegated to subclass)
-            response_text = self._call_batch_classify_api(system_message, user_message)
+        logger.debug(
+            "Sending classify_all_fields request (provider=%s, model=%s, contexts=%s)",
+            self.provider_name,
+            self.model,
+            contexts,
+        )
 
-            # Parse and validate batch response (shared logic)
-            return self._parse_and_validate_batch_response(
-                response_text, contexts, "classify_all_fields"
-            )
+        # Call provider-specific batch API (delegated to subclass)
+        response_text = self._call_batch_classify_api(system_message, user_message)
 
-        except AIProviderError:
-            # Re-raise our own errors
-            raise
-        except ValueError:
-            # Re-raise validation errors
-            raise
-        except Exception as e:
-            # Wrap provider-specific exceptions
-            raise self._wrap_api_error(e, "classify_all_fields") from e
+        # Parse and validate batch response (shared logic)
+        return self._parse_and_validate_batch_response(
+            response_text, contexts, "classify_all_fields"
+        )
 
+    @_wrap_provider_errors("translate_text")
     def translate_text(self, text: str, source_lang: str, target_lang: str = "en") -> str:
         """
         Translate text using AI.
@@ -188,43 +688,173 @@ class BaseAIProvider(AIProvider):
         Raises:
             AIProviderError: On API errors, timeouts, or invalid responses
         """
-        try:
-            # Build translation prompt (shared logic)
-            system_message = (
-                f"You are a professional translator. Translate the given text "
-                f"from {source_lang} to {target_lang}. "
-                f"Return only the translated text, nothing else."
+        cache_key = _translation_cache_key(self.model, text, source_lang, target_lang)
+        cached = _translation_cache.get(cache_key)
+        if cached is not None:
+            _translation_cache.move_to_end(cache_key)
+            logger.debug("Translation cache hit (%s→%s)", source_lang, target_lang)
+            return cached
+
+        # Build translation prompt (shared logic)
+        system_message = _TRANSLATE_SYSTEM_TEMPLATE.format(
+            source_lang=source_lang, target_lang=target_lang
+        )
+        user_message = text
+
+        logger.debug(
+            "Sending translate_text request (provider=%s, model=%s, %s→%s)",
+            self.provider_name,
+            self.model,
+            source_lang,
+            target_lang,
+        )
+
+        # Call provider-specific API (delegated to subclass)
+        translated = self._call_translate_api(system_message, user_message)
+
+        if not translated:
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details="Empty translation response from API",
+                request_type="translate_text",
             )
-            user_message = text
 
+        logger.debug("Successfully translated text")
+        translated = translated.strip()
+        _translation_cache_put(cache_key, translated)
+        return translated
+
+    @_wrap_provider_errors("translate_texts")
+    def translate_texts(
+        self, texts: list[str], source_lang: str, target_lang: str = "en"
+    ) -> list[str]:
+        """
+        Translate a batch of texts in a single AI request.
+
+        Header and column labels are typically 1-4 tokens each, so per-label
+        translate_text() calls pay the fixed request overhead (network
+        round-trip, system prompt tokens) once per label. This method bundles
+        all labels into one request that returns a JSON array of translations,
+        turning N round-trips into one.
+
+        Inputs are deduplicated against the shared translation cache first,
+        so repeated labels and previously translated text cost nothing. If the
+        provider returns the wrong number of translations, the batch is split
+        in half and retried, isolating the problematic input.
+
+        Args:
+            texts: Texts to translate (order is preserved in the result)
+            source_lang: Source language code (e.g., "ja", "zh")
+            target_lang: Target language code (default: "en")
+
+        Returns:
+            Translated texts, one per input, in input order
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+        """
+        if not texts:
+            return []
+
+        results: list[str | None] = [None] * len(texts)
+        # Cache key -> input positions awaiting that translation. Dict order
+        # matches first-seen order, which keeps the request payload aligned
+        # with the responses we zip back onto it.
+        pending: dict[tuple[str, str, str, str], list[int]] = {}
+        pending_texts: list[str] = []
+        for index, text in enumerate(texts):
+            cache_key = _translation_cache_key(self.model, text, source_lang, target_lang)
+            cached = _translation_cache.get(cache_key)
+            if cached is not None:
+                _translation_cache.move_to_end(cache_key)
+                results[index] = cached
+            elif cache_key in pending:
+                pending[cache_key].append(index)
+            else:
+                pending[cache_key] = [index]
+                pending_texts.append(text)
+
+        if pending_texts:
             logger.debug(
-                "Sending translate_text request (provider=%s, model=%s, %s→%s)",
+                "Sending translate_texts request (provider=%s, model=%s, %s→%s, "
+                "%d unique of %d texts)",
                 self.provider_name,
                 self.model,
                 source_lang,
                 target_lang,
+                len(pending_texts),
+                len(texts),
             )
+            translations = self._translate_batch(pending_texts, source_lang, target_lang)
+            for (cache_key, indices), translated in zip(pending.items(), translations, strict=True):
+                _translation_cache_put(cache_key, translated)
+                for index in indices:
+                    results[index] = translated
 
-            # Call provider-specific API (delegated to subclass)
-            translated = self._call_translate_api(system_message, user_message)
+        return [result if result is not None else "" for result in results]
 
-            if not translated:
-                raise AIProviderError(
-                    provider_name=self.provider_name,
-                    error_details="Empty translation response from API",
-                    request_type="translate_text",
-                )
+    def _translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+        """
+        Translate one batch of texts via a single JSON-mode request.
+
+        Args:
+            texts: Unique texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Translated texts aligned with the input order
 
-            logger.debug("Successfully translated text")
-            return translated.strip()
+        Raises:
+            AIProviderError: If a single-text batch still returns an invalid
+                or misaligned response
+        """
+        system_message = _TRANSLATE_BATCH_SYSTEM_TEMPLATE.format(
+            source_lang=source_lang, target_lang=target_lang
+        )
+        user_message = serialize_to_json({"texts": texts})
+
+        response_text = self._call_generate_api(
+            prompt=user_message,
+            system_message=system_message,
+            max_tokens=AI_BATCH_TRANSLATION_MAX_TOKENS,
+            temperature=AI_TRANSLATION_TEMPERATURE,
+            json_mode=True,
+        )
+
+        translations: list[str] | None = None
+        try:
+            parsed = deserialize_from_json(response_text)
+        except (json.JSONDecodeError, ValueError):
+            parsed = None
+        if isinstance(parsed, dict) and isinstance(parsed.get("translations"), list):
+            candidate = parsed["translations"]
+            if len(candidate) == len(texts):
+                translations = [str(item).strip() for item in candidate]
+
+        if translations is not None:
+            return translations
+
+        if len(texts) == 1:
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details="Batch translation response is not aligned with the input",
+                request_type="translate_texts",
+            )
 
-        except AIProviderError:
-            # Re-raise our own errors
-            raise
-        except Exception as e:
-            # Wrap provider-specific exceptions
-            raise self._wrap_api_error(e, "translate_text") from e
+        # Misaligned or malformed response: split in half and retry so one
+        # problematic input cannot sink the whole batch.
+        logger.warning(
+            "Batch translation returned a misaligned response for %d texts; "
+            "splitting and retrying",
+            len(texts),
+        )
+        midpoint = len(texts) // 2
+        return self._translate_batch(
+            texts[:midpoint], source_lang, target_lang
+        ) + self._translate_batch(texts[midpoint:], source_lang, target_lang)
 
+    @_wrap_provider_errors("generate_text")
     def generate_text(
         self,
         prompt: str,
@@ -259,41 +889,30 @@ class BaseAIProvider(AIProvider):
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
-        try:
-            logger.debug(
-                "Sending generate_text request (provider=%s, model=%s)",
-                self.provider_name,
-                self.model,
-            )
-
-            # Call provider-specific API (delegated to subclass)
-            response_text = self._call_generate_api(
-                prompt=prompt,
-                system_message=system_message,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                json_mode=json_mode,
-            )
+        logger.debug(
+            "Sending generate_text request (provider=%s, model=%s)",
+            self.provider_name,
+            self.model,
+        )
 
-            if not response_text:
-                raise AIProviderError(
-                    provider_name=self.provider_name,
-                    error_details="Empty response from API",
-                    request_type="generate_text",
-                )
+        # Call provider-specific API (delegated to subclass)
+        response_text = self._call_generate_api(
+            prompt=prompt,
+            system_message=system_message,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            json_mode=json_mode,
+        )
 
-            logger.debug("Successfully generated text response")
-            return response_text
+        if not response_text:
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details="Empty response from API",
+                request_type="generate_text",
+            )
 
-        except AIProviderError:
-            # Re-raise our own errors
-            raise
-        except ValueError:
-            # Re-raise validation errors
-            raise
-        except Exception as e:
-            # Wrap provider-specific exceptions
-            raise self._wrap_api_error(e, "generate_text") from e
+        logger.debug("Successfully generated text response")
+        return response_text
 
     @abstractmethod
     def _call_classify_api(self, system_message: str, user_message: str) -> str:
@@ -385,17 +1004,23 @@ class BaseAIProvider(AIProvider):
         """
         raise NotImplementedError
 
-    def _validate_context(self, context: str) -> None:
+    @staticmethod
+    def _validate_context(context: str) -> None:
         """
         Validate classification context parameter.
 
+        A single hashed membership test against the module-level frozenset,
+        so it stays on in every path, including the batch drivers - a
+        skip-validation flag would cost as much to check as the test it
+        skips.
+
         Args:
             context: Context to validate
 
         Raises:
             ValueError: If context is not a supported value
         """
-        if context not in ["headers", "columns", "line_items"]:
+        if context not in _VALID_CONTEXTS:
             raise ValueError(
                 f"Invalid context: {context}. Must be 'headers', 'columns', or 'line_items'"
             )
@@ -410,81 +1035,7 @@ class BaseAIProvider(AIProvider):
         Returns:
             System prompt string tailored to the context
         """
-        if context == "headers":
-            return (
-                "You are a field classification assistant for invoice templates. "
-                "Analyze the provided header fields and classify each field "
-                "semantically based on common invoice terminology.\n\n"
-                "PATTERN DETECTION:\n"
-                "1. Multi-cell patterns: Label in one cell, value in adjacent cell\n"
-                "   - Check adjacent_cells to find related values\n"
-                "   - Common patterns: label on left, value on right (or above/below)\n"
-                '   - Example: "Invoice:" in col 1, "12345" in col 3 (right_2)\n'
-                "2. Same-cell patterns: Label and value in same cell with delimiter\n"
-                '   - Common delimiters: ":", "-", "=", "|"\n'
-                '   - Example: "Invoice Number: INV-12345"\n\n'
-                "When you detect these patterns, populate both raw_label and raw_value fields. "
-                "Set label_col_offset and value_col_offset to indicate where label/value are "
-                "relative to the main cell (0 = same cell, positive = cells to the right).\n\n"
-                "Return your response as valid JSON matching this exact schema:\n"
-                "{\n"
-                '  "headers": [\n'
-                "    {\n"
-                '      "raw_label": "Invoice Number",  // The label text (or null)\n'
-                '      "raw_value": "INV-12345",       // The value text (or null)\n'
-                '      "block_index": 0,               // Header block index (integer)\n'
-                '      "row_index": 1,                 // Row position (integer)\n'
-                '      "col_index": 1,                 // Column position (integer)\n'
-                '      "label_col_offset": 0,          // Offset from main cell to label (optional, default 0)\n'
-                '      "value_col_offset": 2,          // Offset from main cell to value (optional, default 0)\n'
-                '      "pattern_type": "multi_cell",   // "multi_cell", "same_cell", or null (optional)\n'
-                '      "model_confidence": 0.95        // Confidence 0.0-1.0 (optional)\n'
-                "    }\n"
-                "  ]\n"
-                "}\n\n"
-                "Required fields: raw_label, raw_value, block_index, row_index, col_index.\n"
-                "Optional fields: label_col_offset, value_col_offset, pattern_type, model_confidence."
-            )
-        if context == "columns":
-            return (
-                "You are a table column classification assistant for invoice templates. "
-                "Analyze the provided table columns and classify each column "
-                "semantically based on common invoice table structures.\n\n"
-                "Return your response as valid JSON matching this exact schema:\n"
-                "{\n"
-                '  "columns": [\n'
-                "    {\n"
-                '      "raw_label": "Item Code",        // Column header text (or null)\n'
-                '      "raw_position": 0,               // Column position in table (integer)\n'
-                '      "table_block_index": 0,          // Table block index (integer)\n'
-                '      "row_index": 5,                  // Header row position (integer)\n'
-                '      "col_index": 2,                  // Column position in sheet (integer)\n'
-                '      "sample_values": ["A", "B"],     // Sample values from column (array)\n'
-                '      "model_confidence": 0.95         // Confidence 0.0-1.0 (optional)\n'
-                "    }\n"
-                "  ]\n"
-                "}\n\n"
-                "All fields except model_confidence are required. sample_values must be an array."
-            )
-        if context == "line_items":
-            return (
-                "You are a line item extraction assistant for invoice templates. "
-                "Analyze the provided table rows and extract individual line items.\n\n"
-                "Return your response as valid JSON matching this exact schema:\n"
-                "{\n"
-                '  "line_items": [\n'
-                "    {\n"
-                '      "table_index": 0,                // Table index (integer)\n'
-                '      "row_index": 6,                  // Row position (integer)\n'
-                '      "is_subtotal": false,            // True if subtotal row (boolean)\n'
-                '      "columns": {"item": "Widget"},   // Column values (object)\n'
-                '      "model_confidence": 0.90         // Confidence 0.0-1.0 (optional)\n'
-                "    }\n"
-                "  ]\n"
-                "}\n\n"
-                "All fields except model_confidence are required."
-            )
-        return ""
+        return self._system_prompts.get(context, "")
 
     def _build_user_prompt(self, payload: dict[str, Any], context: str) -> str:
         """
@@ -497,17 +1048,11 @@ class BaseAIProvider(AIProvider):
         Returns:
             User prompt string tailored to the context
         """
-        context_descriptions = {
-            "headers": "invoice template header fields",
-            "columns": "invoice table columns",
-            "line_items": "invoice table line items",
-        }
-
-        description = context_descriptions.get(context, "invoice template fields")
+        description = _CONTEXT_DESCRIPTIONS.get(context, "invoice template fields")
 
         return (
             f"Please classify the following {description}:\n\n"
-            f"{serialize_to_json(payload, indent=2)}\n\n"
+            f"{serialize_to_json(payload)}\n\n"
             "Respond with a JSON object containing your classifications."
         )
 
@@ -515,37 +1060,17 @@ class BaseAIProvider(AIProvider):
         """
         Build combined system prompt for batch classification.
 
+        The prompt depends only on the context combination, so assembly is
+        memoized at module level; repeat calls with the same contexts (the
+        common case - every sheet uses the default trio) are a cache lookup.
+
         Args:
             contexts: List of contexts to process
 
         Returns:
             Combined system prompt with instructions for all contexts
         """
-        prompt_parts = [
-            "You are a multi-task field classification assistant for invoice templates. ",
-            "You will classify multiple types of invoice data in a single response.\n\n",
-        ]
-
-        # Add context-specific instructions
-        for context in contexts:
-            instructions = self._get_context_specific_instructions(context)
-            prompt_parts.append(f"## {context.upper()}\n{instructions}\n\n")
-
-        # Add combined response schema
-        prompt_parts.append("## RESPONSE FORMAT\n")
-        prompt_parts.append("Return a single JSON object with the following structure:\n")
-        prompt_parts.append("{\n")
-
-        for i, context in enumerate(contexts):
-            comma = "," if i < len(contexts) - 1 else ""
-            prompt_parts.append(f'  "{context}": [...]  // Array of classified items{comma}\n')
-
-        prompt_parts.append("}\n\n")
-        prompt_parts.append(
-            "All fields must be included. If a section has no items, use an empty array []."
-        )
-
-        return "".join(prompt_parts)
+        return _batch_system_prompt(tuple(contexts))
 
     def _build_batch_user_prompt(self, payload: dict[str, Any], contexts: list[str]) -> str:
         """
@@ -561,7 +1086,7 @@ class BaseAIProvider(AIProvider):
         context_list = ", ".join(contexts)
         return (
             f"Please classify the following invoice template data for these tasks: {context_list}\n\n"
-            f"{serialize_to_json(payload, indent=2)}\n\n"
+            f"{serialize_to_json(payload)}\n\n"
             "Respond with a single JSON object containing all classifications."
         )
 
@@ -575,28 +1100,7 @@ class BaseAIProvider(AIProvider):
         Returns:
             Instruction text for the context
         """
-        if context == "headers":
-            return (
-                "Analyze header fields and classify each field semantically.\n\n"
-                "PATTERN DETECTION:\n"
-                "1. Multi-cell patterns: Label in one cell, value in adjacent cell\n"
-                "2. Same-cell patterns: Label and value in same cell with delimiter\n\n"
-                "Required fields: raw_label, raw_value, block_index, row_index, col_index\n"
-                "Optional fields: label_col_offset, value_col_offset, pattern_type, model_confidence"
-            )
-        if context == "columns":
-            return (
-                "Analyze table columns and classify each column semantically.\n\n"
-                "Required fields: raw_label, raw_position, table_block_index, row_index, col_index, sample_values\n"
-                "Optional fields: model_confidence"
-            )
-        if context == "line_items":
-            return (
-                "Extract individual line items from table rows.\n\n"
-                "Required fields: table_index, row_index, is_subtotal, columns\n"
-                "Optional fields: model_confidence"
-            )
-        return ""
+        return _CONTEXT_INSTRUCTIONS.get(context, "")
 
     def _parse_and_validate_batch_response(
         self, content: str, contexts: list[str], request_type: str
@@ -624,14 +1128,14 @@ class BaseAIProvider(AIProvider):
 
         try:
             # Try parsing directly first
-            result = json.loads(content)
+            result = deserialize_from_json(content)
             logger.debug("Successfully parsed batch JSON response")
         except json.JSONDecodeError as e:
             # If direct parsing fails, try to extract JSON from text with preamble
             json_start = content.find("{")
             if json_start > 0:
                 try:
-                    result = json.loads(content[json_start:])
+                    result = deserialize_from_json(content[json_start:])
                     logger.debug("Successfully parsed batch JSON after stripping preamble")
                 except json.JSONDecodeError:
                     pass  # Fall through to original error
@@ -663,12 +1167,10 @@ class BaseAIProvider(AIProvider):
         Returns:
             Expected top-level key in response JSON
         """
-        mapping = {
-            "headers": "headers",
-            "columns": "columns",
-            "line_items": "line_items",
-        }
-        return mapping[context]
+        if context not in _VALID_CONTEXTS:
+            raise KeyError(context)
+        # The response key matches the context name for all supported contexts
+        return context
 
     def _parse_and_validate_response(
         self, content: str, context: str, request_type: str
@@ -696,7 +1198,7 @@ class BaseAIProvider(AIProvider):
 
         try:
             # Try parsing directly first
-            result = json.loads(content)
+            result = deserialize_from_json(content)
             logger.debug("Successfully parsed JSON response")
 
             # Validate expected response key
@@ -715,7 +1217,7 @@ class BaseAIProvider(AIProvider):
             json_start = content.find("{")
             if json_start > 0:
                 try:
-                    result = json.loads(content[json_start:])
+                    result = deserialize_from_json(content[json_start:])
                     logger.debug("Successfully parsed JSON after stripping preamble")
 
                     # Validate expected response key
@@ -29,6 +29,7 @@ Usage Example:
     )
 """
 
+import functools
 import os
 from dataclasses import dataclass
 
@@ -38,12 +39,18 @@ from template_sense.constants import (
     ANTHROPIC_API_KEY_ENV_VAR,
     DEFAULT_AI_TIMEOUT_SECONDS,
     OPENAI_API_KEY_ENV_VAR,
+    RPM_LIMIT_ENV_VAR,
     SUPPORTED_AI_PROVIDERS,
+    TPM_LIMIT_ENV_VAR,
 )
 from template_sense.errors import AIProviderError
 
+# Frozenset view for membership tests, which run on every AIConfig
+# construction; the tuple constant keeps its stable order for messages.
+_SUPPORTED_PROVIDERS_SET = frozenset(SUPPORTED_AI_PROVIDERS)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AIConfig:
     """
     Configuration container for AI provider settings.
@@ -52,11 +59,20 @@ class AIConfig:
     and using an AI provider. It validates that the provider name is
     supported but does not validate API key formats.
 
+    Instances are immutable (frozen) and slotted: slots=True drops the
+    per-instance __dict__, which matters when many configs are created
+    (e.g., per-request keys in multi-tenant callers), and frozen=True makes
+    instances hashable so they can serve directly as cache keys.
+
     Attributes:
         provider: Name of the AI provider ("openai", "anthropic")
         api_key: API key for authentication with the provider
         model: Optional model name override (provider-specific)
         timeout_seconds: Request timeout in seconds (default from constants)
+        requests_per_minute: Optional client-side request rate limit; None
+            disables request throttling
+        tokens_per_minute: Optional client-side token rate limit; None
+            disables token throttling
 
     Raises:
         AIProviderError: If provider name is not in SUPPORTED_AI_PROVIDERS
@@ -74,10 +90,12 @@ class AIConfig:
     api_key: str
     model: str | None = None
     timeout_seconds: int = DEFAULT_AI_TIMEOUT_SECONDS
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
 
     def __post_init__(self):
         """Validate provider name after initialization."""
-        if self.provider not in SUPPORTED_AI_PROVIDERS:
+        if self.provider not in _SUPPORTED_PROVIDERS_SET:
             supported = ", ".join(SUPPORTED_AI_PROVIDERS)
             raise AIProviderError(
                 provider_name=self.provider,
@@ -94,6 +112,8 @@ def load_ai_config() -> AIConfig:
     - TEMPLATE_SENSE_AI_MODEL: Optional model name override
     - OPENAI_API_KEY: Required if provider is "openai"
     - ANTHROPIC_API_KEY: Required if provider is "anthropic"
+    - TEMPLATE_SENSE_RPM_LIMIT: Optional client-side requests-per-minute limit
+    - TEMPLATE_SENSE_TPM_LIMIT: Optional client-side tokens-per-minute limit
 
     Returns:
         AIConfig: Validated configuration object
@@ -109,8 +129,77 @@ def load_ai_config() -> AIConfig:
         >>> print(config.provider)
         openai
     """
-    # Read provider name
-    provider = os.environ.get(AI_PROVIDER_ENV_VAR)
+    # Memoize on the snapshot of relevant environment variables: repeated
+    # calls with unchanged env (the common case in hot loops) reuse the
+    # validated config instead of re-reading and re-validating, while any
+    # env mutation naturally produces a fresh cache key.
+    return _load_ai_config_cached(
+        os.environ.get(AI_PROVIDER_ENV_VAR),
+        os.environ.get(OPENAI_API_KEY_ENV_VAR),
+        os.environ.get(ANTHROPIC_API_KEY_ENV_VAR),
+        os.environ.get(AI_MODEL_ENV_VAR),
+        os.environ.get(RPM_LIMIT_ENV_VAR),
+        os.environ.get(TPM_LIMIT_ENV_VAR),
+    )
+
+
+def _parse_rate_limit(value: str | None, env_var: str) -> int | None:
+    """
+    Parse an optional positive-integer rate limit from an env value.
+
+    Args:
+        value: Raw environment variable value (or None when unset)
+        env_var: Environment variable name, for error messages
+
+    Returns:
+        Parsed limit, or None when the variable is unset or empty
+
+    Raises:
+        AIProviderError: If the value is not a positive integer
+    """
+    if not value:
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit <= 0:
+        raise AIProviderError(
+            provider_name="unknown",
+            error_details=f"{env_var} must be a positive integer, got: {value!r}",
+        )
+    return limit
+
+
+@functools.lru_cache(maxsize=1)
+def _load_ai_config_cached(
+    provider: str | None,
+    openai_api_key: str | None,
+    anthropic_api_key: str | None,
+    model: str | None,
+    rpm_limit: str | None = None,
+    tpm_limit: str | None = None,
+) -> AIConfig:
+    """
+    Validate and build an AIConfig from environment variable values.
+
+    Cached implementation behind load_ai_config(); errors are not cached
+    (lru_cache only stores successful results).
+
+    Args:
+        provider: Value of TEMPLATE_SENSE_AI_PROVIDER (or None)
+        openai_api_key: Value of OPENAI_API_KEY (or None)
+        anthropic_api_key: Value of ANTHROPIC_API_KEY (or None)
+        model: Value of TEMPLATE_SENSE_AI_MODEL (or None)
+        rpm_limit: Value of TEMPLATE_SENSE_RPM_LIMIT (or None)
+        tpm_limit: Value of TEMPLATE_SENSE_TPM_LIMIT (or None)
+
+    Returns:
+        AIConfig: Validated configuration object
+
+    Raises:
+        AIProviderError: If required values are missing or invalid
+    """
     if not provider:
         raise AIProviderError(
             provider_name="unknown",
@@ -119,45 +208,42 @@ def load_ai_config() -> AIConfig:
 
     # Validate provider is supported (case-insensitive)
     provider = provider.lower()
-    if provider not in SUPPORTED_AI_PROVIDERS:
+    if provider not in _SUPPORTED_PROVIDERS_SET:
         supported = ", ".join(SUPPORTED_AI_PROVIDERS)
         raise AIProviderError(
             provider_name=provider,
             error_details=f"Unsupported provider '{provider}'. Supported providers: {supported}",
         )
 
-    # Map provider names to their API key environment variables
+    # Map provider names to their API key values and environment variables
     # This makes it easy to add new providers in the future
-    provider_to_api_key_env = {
-        "openai": OPENAI_API_KEY_ENV_VAR,
-        "anthropic": ANTHROPIC_API_KEY_ENV_VAR,
+    provider_to_api_key = {
+        "openai": (openai_api_key, OPENAI_API_KEY_ENV_VAR),
+        "anthropic": (anthropic_api_key, ANTHROPIC_API_KEY_ENV_VAR),
     }
 
-    # Get the appropriate API key environment variable for this provider
-    api_key_env_var = provider_to_api_key_env.get(provider)
-    if not api_key_env_var:
+    # Get the appropriate API key for this provider
+    if provider not in provider_to_api_key:
         raise AIProviderError(
             provider_name=provider,
             error_details=f"No API key environment variable configured for provider '{provider}'",
         )
 
-    # Read the API key from environment
-    api_key = os.environ.get(api_key_env_var)
+    api_key, api_key_env_var = provider_to_api_key[provider]
     if not api_key:
         raise AIProviderError(
             provider_name=provider,
             error_details=f"Missing required environment variable: {api_key_env_var}",
         )
 
-    # Read optional model name
-    model = os.environ.get(AI_MODEL_ENV_VAR)
-
     # Create and return config (validation happens in __post_init__)
     return AIConfig(
         provider=provider,
         api_key=api_key,
         model=model,
         timeout_seconds=DEFAULT_AI_TIMEOUT_SECONDS,
+        requests_per_minute=_parse_rate_limit(rpm_limit, RPM_LIMIT_ENV_VAR),
+        tokens_per_minute=_parse_rate_limit(tpm_limit, TPM_LIMIT_ENV_VAR),
     )
 
 
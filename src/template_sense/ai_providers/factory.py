@@ -24,6 +24,20 @@ from template_sense.ai_providers.config import AIConfig, load_ai_config
 from template_sense.ai_providers.interface import AIProvider
 from template_sense.errors import AIProviderError
 
+# Module-level provider cache keyed by the config itself (AIConfig is a
+# frozen, hashable dataclass). Provider construction touches SDK client setup
+# (and, on first use, TLS/socket state), so callers that invoke
+# get_ai_provider() repeatedly with the same configuration get the
+# already-built instance back. Keying on the whole config means any field —
+# including rate limits — distinguishes cache entries; providers are
+# stateless between calls, so sharing one instance is safe.
+_provider_cache: dict[AIConfig, AIProvider] = {}
+
+
+def clear_provider_cache() -> None:
+    """Clear the memoized provider instances (intended for tests that mutate env)."""
+    _provider_cache.clear()
+
 
 def get_ai_provider(config: AIConfig | None = None) -> AIProvider:
     """
@@ -57,15 +71,19 @@ def get_ai_provider(config: AIConfig | None = None) -> AIProvider:
     # Validate provider is supported (already validated in AIConfig.__post_init__)
     provider_name = config.provider
 
+    cached = _provider_cache.get(config)
+    if cached is not None:
+        return cached
+
     # Lazy import providers to avoid circular dependencies
     if provider_name == "openai":
         from template_sense.ai_providers.openai_provider import OpenAIProvider
 
-        return OpenAIProvider(config)
+        return _provider_cache.setdefault(config, OpenAIProvider(config))
     if provider_name == "anthropic":
         from template_sense.ai_providers.anthropic_provider import AnthropicProvider
 
-        return AnthropicProvider(config)
+        return _provider_cache.setdefault(config, AnthropicProvider(config))
 
     # Should never reach here due to validation in AIConfig.__post_init__
     raise AIProviderError(
@@ -74,4 +92,4 @@ def get_ai_provider(config: AIConfig | None = None) -> AIProvider:
     )
 
 
-__all__ = ["get_ai_provider"]
+__all__ = ["get_ai_provider", "clear_provider_cache"]
@@ -8,22 +8,286 @@ for OpenAI's API (GPT models). It handles:
 - Error handling and timeout management
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
+import random
+import time
+from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from template_sense.ai_providers.base_provider import BaseAIProvider
+try:
+    import httpx
+except ImportError:  # pragma: no cover - SDK builds that bundle their own HTTP stack
+    httpx = None
+
+from template_sense.ai_providers.base_provider import (
+    _SYSTEM_PROMPTS,
+    _TRANSLATE_SYSTEM_TEMPLATE,
+    BaseAIProvider,
+    _translation_cache,
+    _translation_cache_key,
+    _translation_cache_put,
+    _wrap_provider_errors,
+)
 from template_sense.ai_providers.config import AIConfig
+from template_sense.ai_providers.rate_limiter import TokenBucket, estimate_tokens
+from template_sense.ai_providers.response_cache import (
+    response_cache_get,
+    response_cache_key,
+    response_cache_put,
+)
 from template_sense.constants import (
+    AI_BULK_COMPLETION_WINDOW,
+    AI_BULK_POLL_INTERVAL_SECONDS,
+    AI_BULK_POLL_MAX_INTERVAL_SECONDS,
     AI_CLASSIFICATION_TEMPERATURE,
+    AI_HTTP_MAX_CONNECTIONS,
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    AI_RETRY_MAX_ATTEMPTS,
+    AI_RETRY_MAX_BACKOFF_SECONDS,
+    AI_RETRYABLE_STATUS_CODES,
+    AI_STREAMING_MIN_PAYLOAD_BYTES,
     AI_TRANSLATION_TEMPERATURE,
     DEFAULT_AI_TIMEOUT_SECONDS,
+    DEFAULT_CLASSIFY_MAX_TOKENS,
+    DEFAULT_MAX_CONCURRENT_AI_REQUESTS,
     DEFAULT_OPENAI_MODEL,
+    DEFAULT_TRANSLATE_MAX_TOKENS,
 )
 from template_sense.errors import AIProviderError
+from template_sense.serialization import deserialize_from_json, serialize_to_json
 
 logger = logging.getLogger(__name__)
 
+# Module-level sync client cache keyed by (api_key, timeout). Provider
+# instances constructed with the same credentials (common in per-sheet
+# processing) share one client and its warm connection pool instead of paying
+# httpx startup and TLS setup each time. dict.setdefault is atomic in
+# CPython, so concurrent construction is safe. Async clients are deliberately
+# NOT cached here: httpx pools bind their connections to the event loop they
+# were opened under, so a client shared across asyncio.run() calls fails with
+# "Event loop is closed" in the second loop (see _build_async_client).
+_client_cache: dict[tuple[str, float], OpenAI] = {}
+
+
+def _pooled_http_client_kwargs(timeout: float, is_async: bool) -> dict[str, Any]:
+    """
+    Build http_client kwargs with tuned connection-pool limits.
+
+    Keeping a pool of warm keep-alive connections avoids re-paying TCP/TLS
+    handshakes (tens of ms each) on every request, which matters when the
+    pipeline fires many classification and translation calls back to back.
+    Returns an empty dict when httpx is not importable (some SDK builds
+    bundle their own HTTP stack), leaving the SDK's default client in place.
+
+    Args:
+        timeout: Request timeout in seconds, mirrored onto the HTTP client
+        is_async: Whether to build an AsyncClient instead of a sync Client
+
+    Returns:
+        Kwargs dict with an "http_client" entry, or empty when unavailable
+    """
+    if httpx is None:
+        return {}
+    limits = httpx.Limits(
+        max_keepalive_connections=AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=AI_HTTP_MAX_CONNECTIONS,
+    )
+    client_cls = httpx.AsyncClient if is_async else httpx.Client
+    return {"http_client": client_cls(limits=limits, timeout=timeout)}
+
+
+def _estimated_request_tokens(create_kwargs: dict[str, Any]) -> int:
+    """
+    Estimate the input token cost of a chat completion request.
+
+    Args:
+        create_kwargs: Keyword arguments for chat.completions.create()
+
+    Returns:
+        Byte-length token estimate over all message contents
+    """
+    text = "".join(message.get("content") or "" for message in create_kwargs.get("messages", ()))
+    return estimate_tokens(text)
+
+
+def _classify_response_budget(user_message: str) -> int:
+    """
+    Derive a max_tokens budget for a classification response.
+
+    Structured classification output roughly mirrors the payload (labels come
+    back with a type, confidence, and coordinates), so twice the input's
+    token estimate plus a small fixed allowance for the JSON envelope bounds
+    the response. Without a budget the model can run to its own maximum,
+    spending seconds generating padding nobody reads.
+
+    Args:
+        user_message: Serialized payload sent as the user prompt
+
+    Returns:
+        Budget in tokens, capped at DEFAULT_CLASSIFY_MAX_TOKENS
+    """
+    return min(DEFAULT_CLASSIFY_MAX_TOKENS, 2 * estimate_tokens(user_message) + 64)
+
+
+def _translate_response_budget(text: str) -> int:
+    """
+    Derive a max_tokens budget for a translation response.
+
+    English output is rarely longer than the source in tokens (CJK sources
+    compress heavily), so half the character count plus a fixed allowance is
+    a safe upper bound.
+
+    Args:
+        text: Source text being translated
+
+    Returns:
+        Budget in tokens, capped at DEFAULT_TRANSLATE_MAX_TOKENS
+    """
+    return min(DEFAULT_TRANSLATE_MAX_TOKENS, len(text) // 2 + 64)
+
+
+# Strict structured-output schemas for classification contexts. json_object
+# mode only guarantees syntactically valid JSON; a strict json_schema makes
+# the model return the required shape on the first try, removing the
+# missing-key retry path entirely. Strict mode requires every property to be
+# listed as required, so optional response fields are declared nullable
+# instead — the downstream converters already treat null like absent.
+#
+# line_items has no schema here: its free-form "columns" object (arbitrary
+# column-name keys) cannot be expressed in a strict closed schema, so that
+# context stays on json_object mode.
+_HEADERS_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "raw_label": {"type": ["string", "null"]},
+        "raw_value": {"type": ["string", "null"]},
+        "block_index": {"type": "integer"},
+        "row_index": {"type": "integer"},
+        "col_index": {"type": "integer"},
+        "label_col_offset": {"type": ["integer", "null"]},
+        "value_col_offset": {"type": ["integer", "null"]},
+        "pattern_type": {"type": ["string", "null"]},
+        "model_confidence": {"type": ["number", "null"]},
+    },
+    "required": [
+        "raw_label",
+        "raw_value",
+        "block_index",
+        "row_index",
+        "col_index",
+        "label_col_offset",
+        "value_col_offset",
+        "pattern_type",
+        "model_confidence",
+    ],
+    "additionalProperties": False,
+}
+
+_COLUMNS_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "raw_label": {"type": ["string", "null"]},
+        "raw_position": {"type": "integer"},
+        "table_block_index": {"type": "integer"},
+        "row_index": {"type": "integer"},
+        "col_index": {"type": "integer"},
+        "sample_values": {"type": "array", "items": {"type": ["string", "number", "null"]}},
+        "model_confidence": {"type": ["number", "null"]},
+    },
+    "required": [
+        "raw_label",
+        "raw_position",
+        "table_block_index",
+        "row_index",
+        "col_index",
+        "sample_values",
+        "model_confidence",
+    ],
+    "additionalProperties": False,
+}
+
+
+def _classification_response_format(context: str, item_schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build a strict json_schema response_format for a classification context.
+
+    Args:
+        context: Classification context, also the required top-level key
+        item_schema: JSON schema for one item in the context's array
+
+    Returns:
+        response_format dict for chat.completions.create()
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": f"{context}_classification",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {context: {"type": "array", "items": item_schema}},
+                "required": [context],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+_STRUCTURED_RESPONSE_FORMATS = {
+    "headers": _classification_response_format("headers", _HEADERS_ITEM_SCHEMA),
+    "columns": _classification_response_format("columns", _COLUMNS_ITEM_SCHEMA),
+}
+
+# The classify hooks receive the system prompt rather than the context name,
+# so the lookup is keyed by the (static, interned) prompt strings. Prompts
+# without a strict schema — line_items and combined batch prompts — fall back
+# to json_object mode.
+_RESPONSE_FORMAT_BY_SYSTEM_PROMPT = {
+    prompt: _STRUCTURED_RESPONSE_FORMATS.get(context, _JSON_OBJECT_FORMAT)
+    for context, prompt in _SYSTEM_PROMPTS.items()
+}
+
+
+def _response_format_for(system_message: str) -> dict[str, Any]:
+    """
+    Pick the response_format for a classification system prompt.
+
+    Args:
+        system_message: System prompt the request will be sent with
+
+    Returns:
+        Strict json_schema format when one exists for the prompt's context,
+        otherwise plain json_object mode
+    """
+    return _RESPONSE_FORMAT_BY_SYSTEM_PROMPT.get(system_message, _JSON_OBJECT_FORMAT)
+
+
+@functools.lru_cache(maxsize=16)
+def _prompt_cache_key(system_message: str) -> str:
+    """
+    Derive a stable prompt_cache_key for a static system prompt.
+
+    OpenAI's automatic prompt caching keys on the request prefix; passing an
+    explicit prompt_cache_key routes requests sharing the same static system
+    prompt to the same cache shard, improving hit rates when many requests
+    with different payloads are in flight. The system prompts are a handful
+    of module-level constants, so the digest is memoized.
+
+    Args:
+        system_message: Static system prompt for the request
+
+    Returns:
+        Deterministic cache-key string for the prompt prefix
+    """
+    digest = hashlib.sha256(system_message.encode("utf-8")).hexdigest()[:16]
+    return f"template-sense-{digest}"
+
 
 class OpenAIProvider(BaseAIProvider):
     """
@@ -53,9 +317,31 @@ class OpenAIProvider(BaseAIProvider):
             )
 
         try:
-            self.client = OpenAI(
-                api_key=config.api_key,
-                timeout=config.timeout_seconds or DEFAULT_AI_TIMEOUT_SECONDS,
+            # The SDK's underlying HTTP client is persistent; caching clients
+            # at module scope shares TLS/connection state across provider
+            # instances created with the same credentials.
+            cache_key = (config.api_key, config.timeout_seconds or DEFAULT_AI_TIMEOUT_SECONDS)
+            client = _client_cache.get(cache_key)
+            if client is None:
+                client = _client_cache.setdefault(
+                    cache_key,
+                    OpenAI(
+                        api_key=cache_key[0],
+                        timeout=cache_key[1],
+                        **_pooled_http_client_kwargs(cache_key[1], is_async=False),
+                    ),
+                )
+            self.client = client
+
+            self.async_client = self._build_async_client()
+
+            # Proactive throttle below the account's advertised RPM/TPM so
+            # bursts self-limit instead of triggering 429 retry storms.
+            # Limits are optional; no limiter means no per-call overhead.
+            rpm = getattr(config, "requests_per_minute", None)
+            tpm = getattr(config, "tokens_per_minute", None)
+            self._rate_limiter = (
+                TokenBucket(requests_per_minute=rpm, tokens_per_minute=tpm) if rpm or tpm else None
             )
             logger.debug("OpenAI client initialized successfully")
         except Exception as e:
@@ -65,6 +351,37 @@ class OpenAIProvider(BaseAIProvider):
                 request_type="initialization",
             ) from e
 
+    def _build_async_client(self) -> AsyncOpenAI:
+        """
+        Construct a fresh AsyncOpenAI client with pooled HTTP limits.
+
+        Async clients are built per provider instance (and rebuilt after each
+        classify_batch run) rather than cached at module scope: httpx pools
+        bind their connections to the event loop they were opened under, so a
+        client carried across asyncio.run() calls raises "Event loop is
+        closed" on its pooled connections in the next loop.
+
+        Returns:
+            New AsyncOpenAI client for this provider's credentials
+        """
+        timeout = self.config.timeout_seconds or DEFAULT_AI_TIMEOUT_SECONDS
+        return AsyncOpenAI(
+            api_key=self.config.api_key,
+            timeout=timeout,
+            **_pooled_http_client_kwargs(timeout, is_async=True),
+        )
+
+    async def _reset_async_client(self) -> None:
+        """
+        Close the loop-bound async client and hand the next run a fresh one.
+
+        Must run while the event loop that served the client is still alive,
+        so pooled connections close cleanly instead of leaking into a dead
+        loop.
+        """
+        client, self.async_client = self.async_client, self._build_async_client()
+        await client.close()
+
     @property
     def provider_name(self) -> str:
         """Returns 'openai'."""
@@ -72,9 +389,240 @@ class OpenAIProvider(BaseAIProvider):
 
     @property
     def model(self) -> str:
-        """Returns the configured model or default 'gpt-4'."""
+        """
+        Returns the configured model or the default from constants.
+
+        The default (gpt-4o-mini) trades a small amount of headroom for a
+        large cost/latency win on structured JSON classification; set
+        AIConfig.model to a larger model if accuracy regressions show up on
+        unusual templates.
+        """
         return self.config.model or DEFAULT_OPENAI_MODEL
 
+    @staticmethod
+    def _is_retryable_error(e: Exception) -> bool:
+        """
+        Check whether an API error is transient and worth retrying.
+
+        Matches on status_code rather than exception class so the check works
+        across SDK versions (same approach as BaseAIProvider._wrap_api_error).
+
+        Args:
+            e: Exception raised by the OpenAI SDK
+
+        Returns:
+            True for rate-limit/server errors, False otherwise
+        """
+        return getattr(e, "status_code", None) in AI_RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _retry_delay(e: Exception, attempt: int) -> float:
+        """
+        Compute the backoff delay before the next retry attempt.
+
+        Honors the server's Retry-After header when the SDK exposes it on
+        the error response (rate-limit replies usually include one), and
+        otherwise falls back to exponential backoff with jitter so
+        concurrent workers do not retry in lockstep.
+
+        Args:
+            e: The retryable exception from the OpenAI SDK
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds, capped at AI_RETRY_MAX_BACKOFF_SECONDS
+        """
+        response = getattr(e, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                retry_after = float(headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+            if retry_after is not None and retry_after >= 0:
+                return min(retry_after, AI_RETRY_MAX_BACKOFF_SECONDS)
+        return min(2**attempt + random.random(), AI_RETRY_MAX_BACKOFF_SECONDS)
+
+    def _create_with_retry(self, **create_kwargs: Any) -> Any:
+        """
+        Call chat.completions.create with backoff on transient errors.
+
+        A single 429/5xx would otherwise bubble up as AIProviderError and
+        force the caller to redo all upstream work (workbook parse, summary,
+        payload build). Retrying here preserves that compute at the cost of a
+        few bounded sleeps.
+
+        Args:
+            **create_kwargs: Keyword arguments for chat.completions.create()
+
+        Returns:
+            OpenAI API response
+
+        Raises:
+            The last API exception once attempts are exhausted (wrapped into
+            AIProviderError by BaseAIProvider)
+        """
+        for attempt in range(AI_RETRY_MAX_ATTEMPTS):
+            try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire(_estimated_request_tokens(create_kwargs))
+                response = self.client.chat.completions.create(**create_kwargs)
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update_from_headers(getattr(response, "headers", None))
+                return response
+            except Exception as e:
+                if attempt == AI_RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(
+                    "Transient OpenAI API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    AI_RETRY_MAX_ATTEMPTS,
+                    delay,
+                    type(e).__name__,
+                )
+                time.sleep(delay)
+        raise AIProviderError(  # pragma: no cover - loop always returns or raises
+            provider_name="openai",
+            error_details="Retry loop exited unexpectedly",
+            request_type="api_call",
+        )
+
+    async def _create_with_retry_async(self, **create_kwargs: Any) -> Any:
+        """
+        Async counterpart of _create_with_retry using the async client.
+
+        Args:
+            **create_kwargs: Keyword arguments for chat.completions.create()
+
+        Returns:
+            OpenAI API response
+
+        Raises:
+            The last API exception once attempts are exhausted
+        """
+        for attempt in range(AI_RETRY_MAX_ATTEMPTS):
+            try:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async(_estimated_request_tokens(create_kwargs))
+                response = await self.async_client.chat.completions.create(**create_kwargs)
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update_from_headers(getattr(response, "headers", None))
+                return response
+            except Exception as e:
+                if attempt == AI_RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(
+                    "Transient OpenAI API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    AI_RETRY_MAX_ATTEMPTS,
+                    delay,
+                    type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+        raise AIProviderError(  # pragma: no cover - loop always returns or raises
+            provider_name="openai",
+            error_details="Retry loop exited unexpectedly",
+            request_type="api_call",
+        )
+
+    def _stream_with_retry(self, **create_kwargs: Any) -> str:
+        """
+        Stream a chat completion, with the same retry policy as create.
+
+        Large classification payloads (many candidates, long line_items
+        output) produce responses running to thousands of tokens; streaming
+        lets bytes accumulate as they are generated instead of buffering the
+        whole body server-side, and avoids tripping long-request timeouts.
+        Chunks are joined once at the end (O(n), unlike repeated +=).
+
+        Args:
+            **create_kwargs: Keyword arguments for chat.completions.create()
+
+        Returns:
+            Full accumulated response text
+
+        Raises:
+            The last API exception once attempts are exhausted (wrapped into
+            AIProviderError by BaseAIProvider)
+        """
+        for attempt in range(AI_RETRY_MAX_ATTEMPTS):
+            try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire(_estimated_request_tokens(create_kwargs))
+                chunks: list[str] = []
+                stream = self.client.chat.completions.create(stream=True, **create_kwargs)
+                for chunk in stream:
+                    if chunk.choices:
+                        chunks.append(chunk.choices[0].delta.content or "")
+                return "".join(chunks)
+            except Exception as e:
+                if attempt == AI_RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable_error(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(
+                    "Transient OpenAI API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    AI_RETRY_MAX_ATTEMPTS,
+                    delay,
+                    type(e).__name__,
+                )
+                time.sleep(delay)
+        raise AIProviderError(  # pragma: no cover - loop always returns or raises
+            provider_name="openai",
+            error_details="Retry loop exited unexpectedly",
+            request_type="api_call",
+        )
+
+    def _create_with_token_budget(self, max_tokens: int, cap: int, **create_kwargs: Any) -> Any:
+        """
+        Call the API with a response budget, retrying once if truncated.
+
+        Tight input-derived budgets cut worst-case generation latency, but an
+        unusual template can legitimately need more room. When the response
+        stops with finish_reason "length" and headroom remains, the request
+        is reissued once with the full cap rather than surfacing a parse
+        error on half a JSON document.
+
+        Args:
+            max_tokens: Input-derived response budget for the first attempt
+            cap: Hard ceiling used for the retry attempt
+            **create_kwargs: Remaining chat.completions.create() arguments
+
+        Returns:
+            OpenAI API response
+        """
+        response = self._create_with_retry(max_tokens=max_tokens, **create_kwargs)
+        if getattr(response.choices[0], "finish_reason", None) == "length" and max_tokens < cap:
+            logger.warning(
+                "Response truncated at max_tokens=%d; retrying with cap %d", max_tokens, cap
+            )
+            response = self._create_with_retry(max_tokens=cap, **create_kwargs)
+        return response
+
+    async def _create_with_token_budget_async(
+        self, max_tokens: int, cap: int, **create_kwargs: Any
+    ) -> Any:
+        """
+        Async counterpart of _create_with_token_budget.
+
+        Args:
+            max_tokens: Input-derived response budget for the first attempt
+            cap: Hard ceiling used for the retry attempt
+            **create_kwargs: Remaining chat.completions.create() arguments
+
+        Returns:
+            OpenAI API response
+        """
+        response = await self._create_with_retry_async(max_tokens=max_tokens, **create_kwargs)
+        if getattr(response.choices[0], "finish_reason", None) == "length" and max_tokens < cap:
+            logger.warning(
+                "Response truncated at max_tokens=%d; retrying with cap %d", max_tokens, cap
+            )
+            response = await self._create_with_retry_async(max_tokens=cap, **create_kwargs)
+        return response
+
     def _call_classify_api(self, system_message: str, user_message: str) -> str:
         """
         Execute OpenAI API call for classification.
@@ -89,18 +637,50 @@ class OpenAIProvider(BaseAIProvider):
         Raises:
             OpenAI API exceptions (will be wrapped by BaseAIProvider)
         """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message},
-            ],
-            response_format={"type": "json_object"},
-            temperature=AI_CLASSIFICATION_TEMPERATURE,
-        )
+        # temperature=0.0 makes identical requests deterministic, so repeat
+        # payloads (duplicate sheets, repeated header rows) can be served
+        # from the shared response cache instead of a new round-trip
+        cacheable = AI_CLASSIFICATION_TEMPERATURE == 0.0
+        if cacheable:
+            cache_key = response_cache_key(self.model, system_message, user_message)
+            cached = response_cache_get(cache_key)
+            if cached is not None:
+                logger.debug("OpenAI response cache hit (classification)")
+                return cached
 
-        content = response.choices[0].message.content
-        return content or ""
+        if len(user_message) >= AI_STREAMING_MIN_PAYLOAD_BYTES:
+            # Large payloads imply large responses - stream them. Streamed
+            # responses cannot retry on a finish_reason, so they get the
+            # full token cap up front.
+            content = self._stream_with_retry(
+                max_tokens=DEFAULT_CLASSIFY_MAX_TOKENS,
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": user_message},
+                ],
+                response_format=_response_format_for(system_message),
+                temperature=AI_CLASSIFICATION_TEMPERATURE,
+                prompt_cache_key=_prompt_cache_key(system_message),
+            )
+        else:
+            response = self._create_with_token_budget(
+                max_tokens=_classify_response_budget(user_message),
+                cap=DEFAULT_CLASSIFY_MAX_TOKENS,
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": user_message},
+                ],
+                response_format=_response_format_for(system_message),
+                temperature=AI_CLASSIFICATION_TEMPERATURE,
+                prompt_cache_key=_prompt_cache_key(system_message),
+            )
+            content = response.choices[0].message.content or ""
+
+        if cacheable and content:
+            response_cache_put(cache_key, content)
+        return content
 
     def _call_batch_classify_api(self, system_message: str, user_message: str) -> str:
         """
@@ -116,14 +696,17 @@ class OpenAIProvider(BaseAIProvider):
         Raises:
             OpenAI API exceptions (will be wrapped by BaseAIProvider)
         """
-        response = self.client.chat.completions.create(
+        response = self._create_with_token_budget(
+            max_tokens=_classify_response_budget(user_message),
+            cap=DEFAULT_CLASSIFY_MAX_TOKENS,
             model=self.model,
             messages=[
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": user_message},
             ],
-            response_format={"type": "json_object"},
+            response_format=_response_format_for(system_message),
             temperature=AI_CLASSIFICATION_TEMPERATURE,
+            prompt_cache_key=_prompt_cache_key(system_message),
         )
 
         content = response.choices[0].message.content
@@ -143,7 +726,9 @@ class OpenAIProvider(BaseAIProvider):
         Raises:
             OpenAI API exceptions (will be wrapped by BaseAIProvider)
         """
-        response = self.client.chat.completions.create(
+        response = self._create_with_token_budget(
+            max_tokens=_translate_response_budget(user_message),
+            cap=DEFAULT_TRANSLATE_MAX_TOKENS,
             model=self.model,
             messages=[
                 {"role": "system", "content": system_message},
@@ -155,6 +740,364 @@ class OpenAIProvider(BaseAIProvider):
         content = response.choices[0].message.content
         return content or ""
 
+    async def _call_classify_api_async(self, system_message: str, user_message: str) -> str:
+        """
+        Async counterpart of _call_classify_api using the AsyncOpenAI client.
+
+        Args:
+            system_message: System prompt for classification
+            user_message: User prompt with payload data
+
+        Returns:
+            Raw response text from OpenAI API
+
+        Raises:
+            OpenAI API exceptions (will be wrapped by classify_fields_async)
+        """
+        cacheable = AI_CLASSIFICATION_TEMPERATURE == 0.0
+        if cacheable:
+            cache_key = response_cache_key(self.model, system_message, user_message)
+            cached = response_cache_get(cache_key)
+            if cached is not None:
+                logger.debug("OpenAI response cache hit (classification)")
+                return cached
+
+        response = await self._create_with_token_budget_async(
+            max_tokens=_classify_response_budget(user_message),
+            cap=DEFAULT_CLASSIFY_MAX_TOKENS,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": user_message},
+            ],
+            response_format=_response_format_for(system_message),
+            temperature=AI_CLASSIFICATION_TEMPERATURE,
+            prompt_cache_key=_prompt_cache_key(system_message),
+        )
+
+        content = response.choices[0].message.content or ""
+        if cacheable and content:
+            response_cache_put(cache_key, content)
+        return content
+
+    @_wrap_provider_errors("classify_fields")
+    async def classify_fields_async(
+        self, payload: dict[str, Any], context: str = "headers"
+    ) -> dict[str, Any]:
+        """
+        Async counterpart of classify_fields().
+
+        Mirrors the sync classification path (context validation, prompt
+        building, response parsing) but issues the API call through the
+        AsyncOpenAI client so multiple classifications can overlap their
+        network I/O.
+
+        Args:
+            payload: AI payload dict from build_ai_payload()
+            context: Classification context - "headers", "columns", or "line_items"
+
+        Returns:
+            Dict with classification results (structure depends on context)
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+            ValueError: If context is not a supported value
+        """
+        self._validate_context(context)
+
+        system_message = self._build_system_prompt(context)
+        user_message = self._build_user_prompt(payload, context)
+
+        logger.debug(
+            "Sending async classify_fields request (provider=%s, model=%s, context=%s)",
+            self.provider_name,
+            self.model,
+            context,
+        )
+
+        response_text = await self._call_classify_api_async(system_message, user_message)
+
+        return self._parse_and_validate_response(response_text, context, "classify_fields")
+
+    @_wrap_provider_errors("translate_text")
+    async def translate_text_async(
+        self, text: str, source_lang: str, target_lang: str = "en"
+    ) -> str:
+        """
+        Async counterpart of translate_text().
+
+        Mirrors the sync translation path (shared cross-call cache, prompt
+        building, empty-response validation, error wrapping) but issues the
+        API call through the AsyncOpenAI client so many label translations
+        can overlap their network I/O instead of paying one round-trip each,
+        serially.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code (e.g., "ja", "zh")
+            target_lang: Target language code (default: "en")
+
+        Returns:
+            Translated text
+
+        Raises:
+            AIProviderError: On API errors, timeouts, or invalid responses
+        """
+        # Consult the same cross-call cache as the sync path so async
+        # translations reuse (and refill) results the sync path has paid for
+        cache_key = _translation_cache_key(self.model, text, source_lang, target_lang)
+        cached = _translation_cache.get(cache_key)
+        if cached is not None:
+            _translation_cache.move_to_end(cache_key)
+            logger.debug("Translation cache hit (%s→%s)", source_lang, target_lang)
+            return cached
+
+        system_message = _TRANSLATE_SYSTEM_TEMPLATE.format(
+            source_lang=source_lang, target_lang=target_lang
+        )
+
+        logger.debug(
+            "Sending async translate_text request (provider=%s, model=%s, %s→%s)",
+            self.provider_name,
+            self.model,
+            source_lang,
+            target_lang,
+        )
+
+        response = await self._create_with_token_budget_async(
+            max_tokens=_translate_response_budget(text),
+            cap=DEFAULT_TRANSLATE_MAX_TOKENS,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": text},
+            ],
+            temperature=AI_TRANSLATION_TEMPERATURE,
+        )
+
+        translated = response.choices[0].message.content or ""
+        if not translated:
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details="Empty translation response from API",
+                request_type="translate_text",
+            )
+
+        translated = translated.strip()
+        _translation_cache_put(cache_key, translated)
+        return translated
+
+    def classify_batch(
+        self,
+        payloads: list[dict[str, Any]],
+        context: str = "headers",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_AI_REQUESTS,
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Classify multiple payloads concurrently (e.g., multi-sheet workbooks).
+
+        Fires all classification requests through the async client with
+        bounded concurrency, turning N sequential round-trips into overlapped
+        network I/O. Failures do not abort the batch: each failed payload
+        yields an AIProviderError in its result slot instead of a dict, so
+        callers can recover per-sheet.
+
+        Args:
+            payloads: List of AI payload dicts from build_ai_payload()
+            context: Classification context applied to all payloads
+            max_concurrency: Maximum simultaneous in-flight requests
+
+        Returns:
+            List aligned with payloads; each item is either a classification
+            result dict or the exception raised for that payload
+
+        Raises:
+            ValueError: If context is not a supported value
+        """
+        self._validate_context(context)
+
+        async def _run_batch() -> list[dict[str, Any] | Exception]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _classify_one(payload: dict[str, Any]) -> dict[str, Any]:
+                async with semaphore:
+                    return await self.classify_fields_async(payload, context)
+
+            try:
+                return await asyncio.gather(
+                    *(_classify_one(payload) for payload in payloads),
+                    return_exceptions=True,
+                )
+            finally:
+                # This asyncio.run-owned loop dies when the batch returns;
+                # close the client's loop-bound connections now so the next
+                # batch does not fail on a pool tied to a closed loop
+                await self._reset_async_client()
+
+        logger.info(
+            "Classifying batch of %d payloads (context=%s, max_concurrency=%d)",
+            len(payloads),
+            context,
+            max_concurrency,
+        )
+
+        return asyncio.run(_run_batch())
+
+    @_wrap_provider_errors("classify_fields_bulk")
+    def classify_fields_bulk(
+        self, payloads: list[dict[str, Any]], context: str = "headers"
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Classify payloads offline through the OpenAI Batch API.
+
+        For bulk jobs (re-classifying an archive of templates), synchronous
+        completions are the wrong tool: they pay full price and burn through
+        per-minute rate limits. The Batch API runs the same requests at half
+        cost with no RPM cap, at the price of asynchronous turnaround (up to
+        the completion window). This method uploads all requests as one JSONL
+        batch, polls with exponential backoff until the batch reaches a
+        terminal state, and returns results aligned with the input payloads.
+
+        Args:
+            payloads: List of AI payload dicts from build_ai_payload()
+            context: Classification context applied to all payloads
+
+        Returns:
+            List aligned with payloads; each item is either a classification
+            result dict or the AIProviderError raised for that payload
+
+        Raises:
+            AIProviderError: If the batch upload fails or ends in a
+                non-completed state
+            ValueError: If context is not a supported value
+        """
+        self._validate_context(context)
+
+        if not payloads:
+            return []
+
+        system_message = self._build_system_prompt(context)
+        request_lines = []
+        for index, payload in enumerate(payloads):
+            user_message = self._build_user_prompt(payload, context)
+            request_lines.append(
+                serialize_to_json(
+                    {
+                        "custom_id": f"cls-{index}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": [
+                                {"role": "system", "content": system_message},
+                                {"role": "user", "content": user_message},
+                            ],
+                            "response_format": _response_format_for(system_message),
+                            "temperature": AI_CLASSIFICATION_TEMPERATURE,
+                            # Batch requests cannot retry on truncation, so
+                            # they get the full cap rather than a derived
+                            # budget.
+                            "max_tokens": DEFAULT_CLASSIFY_MAX_TOKENS,
+                        },
+                    }
+                )
+            )
+
+        logger.info(
+            "Submitting Batch API job with %d classification requests (context=%s)",
+            len(payloads),
+            context,
+        )
+
+        input_file = self.client.files.create(
+            file=("template_sense_batch.jsonl", "\n".join(request_lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=AI_BULK_COMPLETION_WINDOW,
+        )
+
+        batch = self._poll_batch(batch.id)
+        if batch.status != "completed":
+            raise AIProviderError(
+                provider_name=self.provider_name,
+                error_details=f"Batch job {batch.id} ended with status '{batch.status}'",
+                request_type="classify_fields_bulk",
+            )
+
+        return self._collect_batch_results(batch.output_file_id, context, len(payloads))
+
+    def _poll_batch(self, batch_id: str) -> Any:
+        """
+        Poll a Batch API job until it reaches a terminal state.
+
+        Args:
+            batch_id: Identifier of the submitted batch job
+
+        Returns:
+            The final batch object from batches.retrieve()
+        """
+        delay = AI_BULK_POLL_INTERVAL_SECONDS
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                return batch
+            logger.debug("Batch %s status=%s; polling again in %ds", batch_id, batch.status, delay)
+            time.sleep(delay)
+            delay = min(delay * 2, AI_BULK_POLL_MAX_INTERVAL_SECONDS)
+
+    def _collect_batch_results(
+        self, output_file_id: str, context: str, expected_count: int
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Download and parse Batch API output into per-payload results.
+
+        Args:
+            output_file_id: File id of the completed batch output
+            context: Classification context the batch ran under
+            expected_count: Number of submitted payloads
+
+        Returns:
+            List aligned with the submitted payloads; slots for requests that
+            failed or are missing from the output hold an AIProviderError
+        """
+        output = self.client.files.content(output_file_id)
+        results: list[dict[str, Any] | Exception] = [
+            AIProviderError(
+                provider_name=self.provider_name,
+                error_details=f"Missing result for request cls-{index} in batch output",
+                request_type="classify_fields_bulk",
+            )
+            for index in range(expected_count)
+        ]
+
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = deserialize_from_json(line)
+            index = int(record["custom_id"].rsplit("-", 1)[1])
+            response = record.get("response") or {}
+            error = record.get("error")
+            if error or response.get("status_code") != 200:
+                details = error.get("message") if error else f"HTTP {response.get('status_code')}"
+                results[index] = AIProviderError(
+                    provider_name=self.provider_name,
+                    error_details=f"Batch request cls-{index} failed: {details}",
+                    request_type="classify_fields_bulk",
+                )
+                continue
+            content = response["body"]["choices"][0]["message"]["content"] or ""
+            try:
+                results[index] = self._parse_and_validate_response(
+                    content, context, "classify_fields_bulk"
+                )
+            except AIProviderError as e:
+                results[index] = e
+
+        return results
+
     def _call_generate_api(
         self,
         prompt: str,
@@ -199,7 +1142,7 @@ class OpenAIProvider(BaseAIProvider):
         if json_mode:
             request_params["response_format"] = {"type": "json_object"}
 
-        response = self.client.chat.completions.create(**request_params)
+        response = self._create_with_retry(**request_params)
         content = response.choices[0].message.content
         return content or ""
 
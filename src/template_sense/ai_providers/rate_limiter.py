@@ -0,0 +1,174 @@
+"""
+Client-side rate limiting for AI provider requests.
+
+Under concurrent use, firing requests until the provider returns 429s wastes
+round-trips: each rejected request burns latency and retry budget without
+doing any work. This module provides a token-bucket limiter that proactively
+throttles the client below the account's advertised requests-per-minute and
+tokens-per-minute limits, so rate-limit responses are avoided instead of
+retried.
+
+Classes:
+    TokenBucket: Dual request/token budget limiter with sync and async acquire
+
+Functions:
+    estimate_tokens: Cheap byte-length token estimate for request text
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Provider rate-limit feedback headers (OpenAI naming; checked case-insensitively)
+_REMAINING_REQUESTS_HEADER = "x-ratelimit-remaining-requests"
+_REMAINING_TOKENS_HEADER = "x-ratelimit-remaining-tokens"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of request text from its byte length.
+
+    Uses the same 1 token ~= 4 bytes heuristic as MAX_AI_PAYLOAD_BYTES. An
+    exact tokenizer (tiktoken) would be tighter, but it is a heavyweight
+    optional dependency and the limiter only needs a consistent
+    order-of-magnitude estimate to stay under the account's TPM ceiling.
+
+    Args:
+        text: Request text (system plus user content)
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+class TokenBucket:
+    """
+    Dual token-bucket limiter for requests-per-minute and tokens-per-minute.
+
+    Both budgets refill continuously at limit/60 per second up to their
+    capacity. acquire() blocks until both budgets cover the request, so a
+    burst of concurrent work self-throttles just under the configured limits
+    instead of triggering 429 storms. A limit of None disables that bucket.
+
+    State is guarded by a lock; the sync and async acquire paths share it, so
+    mixed sync/async callers draw from the same budget.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ):
+        """
+        Initialize the limiter with per-minute budgets.
+
+        Args:
+            requests_per_minute: Max requests per minute, or None for no limit
+            tokens_per_minute: Max tokens per minute, or None for no limit
+        """
+        self._lock = threading.Lock()
+        self._rpm_limit = requests_per_minute
+        self._tpm_limit = tokens_per_minute
+        self._request_budget = float(requests_per_minute or 0)
+        self._token_budget = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        """Top up both budgets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self._rpm_limit:
+            self._request_budget = min(
+                float(self._rpm_limit), self._request_budget + elapsed * self._rpm_limit / 60.0
+            )
+        if self._tpm_limit:
+            self._token_budget = min(
+                float(self._tpm_limit), self._token_budget + elapsed * self._tpm_limit / 60.0
+            )
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """
+        Deduct one request and its tokens, returning the wait before sending.
+
+        The deduction happens immediately (even when it drives a budget
+        negative) so concurrent acquirers queue up behind each other instead
+        of all seeing the same free budget.
+
+        Args:
+            estimated_tokens: Token estimate for the upcoming request
+
+        Returns:
+            Seconds the caller must wait before issuing the request
+        """
+        with self._lock:
+            self._refill()
+            wait = 0.0
+            if self._rpm_limit:
+                self._request_budget -= 1.0
+                if self._request_budget < 0:
+                    wait = max(wait, -self._request_budget * 60.0 / self._rpm_limit)
+            if self._tpm_limit:
+                self._token_budget -= float(estimated_tokens)
+                if self._token_budget < 0:
+                    wait = max(wait, -self._token_budget * 60.0 / self._tpm_limit)
+            return wait
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Block until the request fits within both budgets.
+
+        Args:
+            estimated_tokens: Token estimate for the upcoming request
+        """
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            logger.debug("Rate limiter throttling request for %.2fs", wait)
+            time.sleep(wait)
+
+    async def acquire_async(self, estimated_tokens: int = 0) -> None:
+        """
+        Async counterpart of acquire(); yields instead of blocking the loop.
+
+        Args:
+            estimated_tokens: Token estimate for the upcoming request
+        """
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            logger.debug("Rate limiter throttling request for %.2fs", wait)
+            await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers: object) -> None:
+        """
+        Clamp local budgets to the server's advertised remaining quota.
+
+        Rate-limit responses include x-ratelimit-remaining-* headers; when the
+        server reports less quota than the local estimate (other clients on
+        the same account, estimation drift), adopting the server's number
+        keeps the limiter honest. Missing or unparsable headers are ignored.
+
+        Args:
+            headers: Mapping-like response headers (anything with .get())
+        """
+        get = getattr(headers, "get", None)
+        if get is None:
+            return
+        with self._lock:
+            for header, attr, limit in (
+                (_REMAINING_REQUESTS_HEADER, "_request_budget", self._rpm_limit),
+                (_REMAINING_TOKENS_HEADER, "_token_budget", self._tpm_limit),
+            ):
+                if not limit:
+                    continue
+                try:
+                    remaining = float(get(header))
+                except (TypeError, ValueError):
+                    continue
+                setattr(self, attr, min(getattr(self, attr), remaining))
+
+
+__all__ = ["TokenBucket", "estimate_tokens"]
@@ -0,0 +1,68 @@
+"""
+Shared deterministic response cache for AI providers.
+
+Classification runs at temperature=0.0, so identical (model, system prompt,
+user payload) requests are deterministic and a cache hit replaces a
+multi-second network round-trip with a dict lookup. Duplicate requests are
+common in practice: workbooks with copied sheets or repeated header rows
+produce byte-identical payloads within one run.
+
+The cache is module-level so every provider instance (and both the sync and
+async call paths) share hits. Entries are LRU-evicted beyond
+AI_RESPONSE_CACHE_MAX_ENTRIES and expire after AI_RESPONSE_CACHE_TTL_SECONDS
+so long-lived processes eventually pick up server-side model updates.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from template_sense.constants import (
+    AI_RESPONSE_CACHE_MAX_ENTRIES,
+    AI_RESPONSE_CACHE_TTL_SECONDS,
+)
+
+_response_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def response_cache_key(model: str, system_message: str, user_message: str) -> str:
+    """
+    Build the response-cache key for a deterministic request.
+
+    The key hashes model + system prompt + user payload, so any change to
+    the prompt, payload, or configured model produces a distinct entry.
+
+    Args:
+        model: Model name the request targets
+        system_message: System prompt for the request
+        user_message: Serialized user payload
+
+    Returns:
+        SHA-256 hex digest uniquely identifying the request
+    """
+    raw = f"{model}\x00{system_message}\x00{user_message}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def response_cache_get(key: str) -> str | None:
+    """Return a cached response text, or None on miss/expiry."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, text = entry
+    if time.monotonic() - cached_at > AI_RESPONSE_CACHE_TTL_SECONDS:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return text
+
+
+def response_cache_put(key: str, text: str) -> None:
+    """Store a response text, evicting least-recently-used entries."""
+    _response_cache[key] = (time.monotonic(), text)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > AI_RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+
+
+__all__ = ["response_cache_key", "response_cache_get", "response_cache_put"]
@@ -106,7 +106,8 @@ def extract_template_structure(
         file_path,
     )
 
-    # Normalize path input to Path object
+    # Normalize path input to Path object once at the public boundary; the
+    # pipeline and every layer below it receive a Path
     path = Path(file_path) if isinstance(file_path, str) else file_path
 
     try:
@@ -30,12 +30,28 @@ DEFAULT_AUTO_MAPPING_THRESHOLD = 80.0  # Fuzzy match score for auto-mapping (0.0
 DEFAULT_TABLE_MIN_SCORE = 0.5  # Minimum score for table candidate rows (0.0-1.0)
 DEFAULT_TABLE_HEADER_MIN_SCORE = 0.6  # Minimum score for table header row detection (0.0-1.0)
 
+# Parallel row scoring (opt-in via env var). Worker processes pay a pickling
+# cost for their grid chunk, so parallel scoring only engages on grids at
+# least this many rows tall.
+PARALLEL_SCORING_ENV_VAR = "TEMPLATE_SENSE_PARALLEL_SCORING"
+PARALLEL_SCORING_MIN_ROWS = 5000
+
+# Content-addressed disk cache for grid extraction (opt-in via env var).
+# Caches sheet name, raw grid, and sheet summary keyed by file-content hash
+# so unchanged files skip workbook parsing on re-runs.
+GRID_CACHE_ENV_VAR = "TEMPLATE_SENSE_GRID_CACHE"
+GRID_CACHE_DIR_ENV_VAR = "TEMPLATE_SENSE_GRID_CACHE_DIR"
+
 # AI timeouts
 DEFAULT_AI_TIMEOUT_SECONDS = 120  # Timeout per AI request (increased for batch classification)
 
+# AI payload size guard (approx 1 token ~= 4 bytes; 400KB ~= 100k tokens)
+MAX_AI_PAYLOAD_BYTES = 400_000  # Shard classification payloads above this serialized size
+
 # AI payload configuration
 DEFAULT_AI_SAMPLE_ROWS = 5  # Number of sample data rows to include in AI payload
 DEFAULT_ADJACENT_CELL_RADIUS = 3  # Number of adjacent cells in each direction for header context
+DEFAULT_MAX_SAMPLE_CELL_CHARS = 200  # Truncation limit for string cells in sample data rows
 
 # Grid validation
 MIN_GRID_ROWS = 1
@@ -51,12 +67,18 @@ AI_MODEL_ENV_VAR = "TEMPLATE_SENSE_AI_MODEL"
 OPENAI_API_KEY_ENV_VAR = "OPENAI_API_KEY"
 ANTHROPIC_API_KEY_ENV_VAR = "ANTHROPIC_API_KEY"
 LOG_LEVEL_ENV_VAR = "TEMPLATE_SENSE_LOG_LEVEL"
+SEMANTIC_CACHE_ENV_VAR = "TEMPLATE_SENSE_SEMANTIC_CACHE"
+RPM_LIMIT_ENV_VAR = "TEMPLATE_SENSE_RPM_LIMIT"
+TPM_LIMIT_ENV_VAR = "TEMPLATE_SENSE_TPM_LIMIT"
 
 # Supported providers
 SUPPORTED_AI_PROVIDERS = ("openai", "anthropic")
 
 # Default AI models
-DEFAULT_OPENAI_MODEL = "gpt-4o"
+# gpt-4o-mini handles JSON-mode classification of tabular invoice fields at
+# near-parity accuracy for a fraction of gpt-4o's cost and per-token latency;
+# callers needing the larger model can override via AIConfig.model
+DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
 DEFAULT_ANTHROPIC_MODEL = "claude-3-sonnet-20240229"
 
 # AI temperature settings
@@ -67,6 +89,45 @@ AI_TRANSLATION_TEMPERATURE = 0.3  # Slight creativity for natural translations
 ANTHROPIC_CLASSIFICATION_MAX_TOKENS = 4096
 ANTHROPIC_TRANSLATION_MAX_TOKENS = 2048
 
+# Response budget for batched multi-label translation (one request per batch)
+AI_BATCH_TRANSLATION_MAX_TOKENS = 4096
+
+# Hard ceilings for input-derived response budgets on OpenAI calls. Budgets
+# are computed from input size per request and capped here; the cap is also
+# the retry budget when a response comes back truncated (finish_reason
+# "length").
+DEFAULT_CLASSIFY_MAX_TOKENS = 4096
+DEFAULT_TRANSLATE_MAX_TOKENS = 4096
+
+# Concurrency limit for async batch classification (simultaneous in-flight requests)
+DEFAULT_MAX_CONCURRENT_AI_REQUESTS = 5
+
+# Retry policy for transient AI provider errors (rate limits, server overload)
+AI_RETRY_MAX_ATTEMPTS = 5  # Total attempts including the first call
+AI_RETRY_MAX_BACKOFF_SECONDS = 30  # Ceiling for exponential backoff delays
+AI_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 529)  # Transient HTTP statuses worth retrying
+
+# In-process response cache for deterministic (temperature=0.0) classification calls
+AI_RESPONSE_CACHE_MAX_ENTRIES = 128  # LRU capacity (entries are raw response strings)
+AI_RESPONSE_CACHE_TTL_SECONDS = 3600  # Entries older than this are re-fetched
+
+# Normalized translation cache (opt-in via TEMPLATE_SENSE_SEMANTIC_CACHE=1)
+TRANSLATION_CACHE_MAX_ENTRIES = 1024  # LRU capacity (entries are short label strings)
+
+# HTTP connection pool tuning for AI provider clients (applied when httpx is available)
+AI_HTTP_MAX_KEEPALIVE_CONNECTIONS = 32  # Warm connections kept open between requests
+AI_HTTP_MAX_CONNECTIONS = 64  # Hard ceiling on simultaneous connections
+
+# OpenAI Batch API settings for offline bulk classification
+AI_BULK_COMPLETION_WINDOW = "24h"  # Batch API completion window
+AI_BULK_POLL_INTERVAL_SECONDS = 10  # Initial status-poll delay
+AI_BULK_POLL_MAX_INTERVAL_SECONDS = 300  # Poll delay ceiling (exponential backoff)
+
+# Streaming threshold: classification requests at least this large stream their
+# response (large payloads produce large responses, where streaming avoids
+# buffering the full body and long-request timeouts)
+AI_STREAMING_MIN_PAYLOAD_BYTES = 100_000
+
 # ============================================================
 # Translation Constants
 # ============================================================
@@ -88,6 +149,12 @@ SEMANTIC_MATCHING_TIMEOUT_SECONDS = 10  # Timeout for semantic matching AI reque
 SEMANTIC_MATCHING_MAX_TOKENS = 150  # Maximum tokens for semantic matching AI responses
 SEMANTIC_MATCHING_TEMPERATURE = 0.0  # Deterministic temperature for semantic matching
 
+# Persistent disk cache for semantic-matching results (opt-in via env var).
+# Caches accepted AI matches keyed by translated label + a fingerprint of the
+# field dictionary so repeated runs over similar templates skip the AI call.
+SEMANTIC_MATCH_CACHE_ENV_VAR = "TEMPLATE_SENSE_SEMANTIC_MATCH_CACHE"
+SEMANTIC_MATCH_CACHE_DIR_ENV_VAR = "TEMPLATE_SENSE_SEMANTIC_MATCH_CACHE_DIR"
+
 # ============================================================
 # Error Recovery Thresholds
 # ============================================================
@@ -133,9 +200,15 @@ __all__ = [
     "DEFAULT_AUTO_MAPPING_THRESHOLD",
     "DEFAULT_TABLE_MIN_SCORE",
     "DEFAULT_TABLE_HEADER_MIN_SCORE",
+    "PARALLEL_SCORING_ENV_VAR",
+    "PARALLEL_SCORING_MIN_ROWS",
+    "GRID_CACHE_ENV_VAR",
+    "GRID_CACHE_DIR_ENV_VAR",
     "DEFAULT_AI_TIMEOUT_SECONDS",
+    "MAX_AI_PAYLOAD_BYTES",
     "DEFAULT_AI_SAMPLE_ROWS",
     "DEFAULT_ADJACENT_CELL_RADIUS",
+    "DEFAULT_MAX_SAMPLE_CELL_CHARS",
     "MIN_GRID_ROWS",
     "MIN_GRID_COLUMNS",
     "AI_PROVIDER_ENV_VAR",
@@ -143,6 +216,9 @@ __all__ = [
     "OPENAI_API_KEY_ENV_VAR",
     "ANTHROPIC_API_KEY_ENV_VAR",
     "LOG_LEVEL_ENV_VAR",
+    "SEMANTIC_CACHE_ENV_VAR",
+    "RPM_LIMIT_ENV_VAR",
+    "TPM_LIMIT_ENV_VAR",
     "SUPPORTED_AI_PROVIDERS",
     "DEFAULT_OPENAI_MODEL",
     "DEFAULT_ANTHROPIC_MODEL",
@@ -150,6 +226,22 @@ __all__ = [
     "AI_TRANSLATION_TEMPERATURE",
     "ANTHROPIC_CLASSIFICATION_MAX_TOKENS",
     "ANTHROPIC_TRANSLATION_MAX_TOKENS",
+    "AI_BATCH_TRANSLATION_MAX_TOKENS",
+    "DEFAULT_CLASSIFY_MAX_TOKENS",
+    "DEFAULT_TRANSLATE_MAX_TOKENS",
+    "DEFAULT_MAX_CONCURRENT_AI_REQUESTS",
+    "AI_RETRY_MAX_ATTEMPTS",
+    "AI_RETRY_MAX_BACKOFF_SECONDS",
+    "AI_RETRYABLE_STATUS_CODES",
+    "AI_RESPONSE_CACHE_MAX_ENTRIES",
+    "AI_RESPONSE_CACHE_TTL_SECONDS",
+    "TRANSLATION_CACHE_MAX_ENTRIES",
+    "AI_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+    "AI_HTTP_MAX_CONNECTIONS",
+    "AI_STREAMING_MIN_PAYLOAD_BYTES",
+    "AI_BULK_COMPLETION_WINDOW",
+    "AI_BULK_POLL_INTERVAL_SECONDS",
+    "AI_BULK_POLL_MAX_INTERVAL_SECONDS",
     "DEFAULT_TARGET_LANGUAGE",
     "TRANSLATION_TIMEOUT_SECONDS",
     "ENABLE_AI_SEMANTIC_MATCHING",
@@ -158,6 +250,8 @@ __all__ = [
     "SEMANTIC_MATCHING_TIMEOUT_SECONDS",
     "SEMANTIC_MATCHING_MAX_TOKENS",
     "SEMANTIC_MATCHING_TEMPERATURE",
+    "SEMANTIC_MATCH_CACHE_ENV_VAR",
+    "SEMANTIC_MATCH_CACHE_DIR_ENV_VAR",
     "MIN_AI_CONFIDENCE_WARNING",
     "MIN_FUZZY_MATCH_WARNING",
     "MAX_FIELD_FAILURE_RATE",
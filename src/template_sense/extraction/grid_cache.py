@@ -0,0 +1,147 @@
+"""
+Content-addressed disk cache for grid extraction results.
+
+Repeated pipeline runs over the same template (regression tests, retries
+after AI errors) reparse the .xlsx from scratch even though the file has not
+changed. This module caches the outputs of the file-loading and
+grid-extraction stages — selected sheet name, raw grid, and sheet summary —
+keyed by a SHA-256 hash of the file bytes, so an unchanged file skips
+workbook parsing and heuristic detection entirely on re-runs.
+
+The cache is opt-in via the TEMPLATE_SENSE_GRID_CACHE=1 environment variable
+and lives under ~/.cache/template_sense/ (override with
+TEMPLATE_SENSE_GRID_CACHE_DIR). Hashing the bytes is orders of magnitude
+cheaper than reparsing the workbook, and a changed file produces a different
+key, so stale entries are never served. All cache failures (corrupt entry,
+unwritable directory) degrade to a miss; they never fail the pipeline.
+
+Functions:
+    grid_cache_enabled: Check whether the disk cache is turned on
+    compute_grid_cache_key: Hash file bytes into a cache key
+    load_cached_extraction: Look up a cached extraction result
+    store_cached_extraction: Persist an extraction result for future runs
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from template_sense.constants import GRID_CACHE_DIR_ENV_VAR, GRID_CACHE_ENV_VAR
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached tuple layout or upstream extraction output changes
+# shape; mismatched entries are treated as misses
+_CACHE_FORMAT_VERSION = 1
+
+
+def grid_cache_enabled() -> bool:
+    """
+    Check whether the grid disk cache is enabled.
+
+    Returns:
+        True if TEMPLATE_SENSE_GRID_CACHE is set to "1", False otherwise
+    """
+    return os.environ.get(GRID_CACHE_ENV_VAR) == "1"
+
+
+def _cache_dir() -> Path:
+    """Resolve the cache directory, honoring the override environment variable."""
+    override = os.environ.get(GRID_CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "template_sense"
+
+
+def _cache_path(key: str) -> Path:
+    """Build the cache file path for a given key."""
+    return _cache_dir() / f"{key}.pkl"
+
+
+def compute_grid_cache_key(file_path: Path) -> str | None:
+    """
+    Compute the content-addressed cache key for a file.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        Hex digest of the file bytes, or None if the file cannot be read
+        (the caller falls back to a normal parse)
+    """
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError as e:
+        logger.debug("Could not hash file for grid cache: %s", str(e))
+        return None
+
+
+def load_cached_extraction(key: str) -> tuple[str, list[list[Any]], dict[str, Any]] | None:
+    """
+    Load a cached extraction result.
+
+    Args:
+        key: Cache key from compute_grid_cache_key()
+
+    Returns:
+        Tuple of (sheet_name, grid, sheet_summary) on a hit, None on a miss
+        or any cache read failure
+    """
+    path = _cache_path(key)
+    try:
+        with path.open("rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable grid cache entry: %s", str(e))
+        return None
+
+    if not (isinstance(entry, tuple) and len(entry) == 4 and entry[0] == _CACHE_FORMAT_VERSION):
+        logger.debug("Ignoring grid cache entry with stale format")
+        return None
+
+    _, sheet_name, grid, sheet_summary = entry
+    logger.info("Grid cache hit; skipping workbook parse and heuristic detection")
+    return sheet_name, grid, sheet_summary
+
+
+def store_cached_extraction(
+    key: str,
+    sheet_name: str,
+    grid: list[list[Any]],
+    sheet_summary: dict[str, Any],
+) -> None:
+    """
+    Persist an extraction result for future runs.
+
+    Write failures are logged and swallowed; caching is best-effort.
+
+    Args:
+        key: Cache key from compute_grid_cache_key()
+        sheet_name: Selected sheet name
+        grid: Raw grid data extracted from the sheet
+        sheet_summary: Heuristic detection results for the sheet
+    """
+    path = _cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump((_CACHE_FORMAT_VERSION, sheet_name, grid, sheet_summary), f)
+        # Atomic replace so concurrent readers never see a partial entry
+        tmp_path.replace(path)
+        logger.debug("Stored grid cache entry")
+    except Exception as e:
+        logger.warning("Could not write grid cache entry: %s", str(e))
+
+
+__all__ = [
+    "compute_grid_cache_key",
+    "grid_cache_enabled",
+    "load_cached_extraction",
+    "store_cached_extraction",
+]
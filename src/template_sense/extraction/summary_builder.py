@@ -426,6 +426,7 @@ def build_sheet_summary(
     workbook: ExcelWorkbook,
     sheet_name: str | None = None,
     min_score: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    grid: list[list[Any]] | None = None,
 ) -> dict[str, Any]:
     """
     Build a complete, AI-ready sheet structure summary.
@@ -450,6 +451,9 @@ def build_sheet_summary(
         workbook: ExcelWorkbook instance to analyze
         sheet_name: Name of sheet to analyze. If None, uses first visible sheet.
         min_score: Minimum score threshold (0.0-1.0) for including blocks. Default: 0.7
+        grid: Pre-extracted raw grid for the sheet. When provided, the
+            extraction step is skipped, sparing callers that already hold
+            the grid a second full workbook traversal.
 
     Returns:
         Summary dict with structure:
@@ -493,9 +497,12 @@ def build_sheet_summary(
         min_score,
     )
 
-    # Step 1: Extract raw grid
-    logger.debug("Step 1/5: Extracting raw grid from sheet '%s'", sheet_name)
-    grid = extract_raw_grid(workbook, sheet_name)
+    # Step 1: Extract raw grid (unless the caller already extracted it)
+    if grid is None:
+        logger.debug("Step 1/5: Extracting raw grid from sheet '%s'", sheet_name)
+        grid = extract_raw_grid(workbook, sheet_name)
+    else:
+        logger.debug("Step 1/5: Using pre-extracted grid for sheet '%s'", sheet_name)
 
     if not grid:
         logger.info("Sheet '%s' is empty, returning empty summary", sheet_name)
@@ -44,7 +44,11 @@ Usage Example:
 """
 
 import logging
+import os
 import re
+from array import array
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -54,13 +58,47 @@ from template_sense.constants import (
     DEFAULT_HEADER_TEXT_DENSITY_THRESHOLD,
     DEFAULT_MIN_TABLE_ROWS,
     DEFAULT_TABLE_MIN_SCORE,
+    PARALLEL_SCORING_ENV_VAR,
+    PARALLEL_SCORING_MIN_ROWS,
 )
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Combined key-value pattern, compiled once at import time. The two branches
+# (label-colon-value and label-wide-gap-value) used to be separate re.search
+# calls paying a pattern-cache lookup each; one alternation scans the text
+# once. Both branches are anchored on literal characters, so the pattern is
+# linear-time with no backtracking blowup.
+_KV_RE = re.compile(r"\S+\s*:\s*\S|\S+\s{2,}\S")
+
+# Numeric-string shape, compiled once at import time. Raising and catching
+# ValueError from float() costs roughly a microsecond per non-numeric string
+# — the common case in table text cells — while a failed match on this
+# anchored, non-backtracking pattern is a cheap C-level scan. The scorer
+# only needs the yes/no answer, never the parsed value.
+_NUM_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$")
+
+# Hoisted type tuple for numeric-cell checks on the non-hot fallback paths.
+# A PEP 604 union in isinstance builds a types.UnionType per call; the
+# prebuilt tuple avoids that. Note isinstance with this tuple matches bool
+# (a subclass of int); sites that must not count booleans as numeric pair
+# it with an explicit bool exclusion.
+_NUMERIC_TYPES = (int, float)
+
+# Exact-type dispatch kinds for the per-cell scan loop. openpyxl grids are
+# overwhelmingly str/int/float/bool/datetime, so one dict lookup on
+# type(cell) replaces the isinstance chain (two failed isinstance calls per
+# datetime cell). bool gets its own kind: True/False cells are flags, not
+# amounts, and are scored as text rather than numeric. Exotic subclasses
+# miss the dict and take an isinstance fallback with original semantics.
+_KIND_NUMERIC = 1
+_KIND_TEXT = 2
+_KIND_BOOL = 3
+_TYPE_KINDS = {int: _KIND_NUMERIC, float: _KIND_NUMERIC, str: _KIND_TEXT, bool: _KIND_BOOL}
+
+
+@dataclass(slots=True, frozen=True)
 class TableCandidateBlock:
     """
     Represents a detected table/line-item data block.
@@ -74,7 +112,9 @@ class TableCandidateBlock:
         row_end: Last row of block (1-based, inclusive)
         col_start: First column of block (1-based, Excel convention)
         col_end: Last column of block (1-based, inclusive)
-        content: List of (row, col, value) tuples for all non-empty cells in block
+        content: List of (row, col, value) tuples for all non-empty cells in block.
+            Instances use slots (no per-instance __dict__) and are frozen;
+            derived blocks are built fresh rather than mutated in place.
         score: Confidence score (0.0-1.0) indicating likelihood this is a table block
         detected_pattern: Description of detection pattern (e.g., "numeric_density",
                           "column_consistency")
@@ -89,100 +129,68 @@ class TableCandidateBlock:
     detected_pattern: str
 
 
-def _contains_key_value_pattern(text: str) -> bool:
-    """
-    Check if text contains key-value separator patterns.
-
-    This helps distinguish header metadata ("Label: Value") from table data.
-
-    Args:
-        text: Text to check
-
-    Returns:
-        True if key-value pattern detected, False otherwise
-    """
-    if not isinstance(text, str):
-        return False
-
-    # Colon pattern: at least one non-whitespace char, colon, optional space, value
-    if re.search(r"\S+\s*:\s*\S", text):
-        return True
-
-    # Multiple spaces pattern: word, 2+ spaces, word
-    return bool(re.search(r"\S+\s{2,}\S", text))
-
-
-def _calculate_cell_density(row: list[Any]) -> float:
+@dataclass(slots=True)
+class _RowSummary:
     """
-    Calculate the ratio of non-empty cells to total cells in a row.
+    Per-row aggregates and non-empty cells collected in one scan.
 
-    Args:
-        row: List of cell values
-
-    Returns:
-        Density ratio (0.0-1.0)
-    """
-    if not row:
-        return 0.0
+    Built by _scan_row() during scoring and reused by block construction,
+    so each grid cell is visited exactly once for the whole detection
+    pipeline (structure-of-arrays: column indices and values are parallel
+    lists aligned by position).
 
-    non_empty_count = sum(1 for cell in row if cell not in (None, ""))
-    return non_empty_count / len(row)
-
-
-def _calculate_numeric_density(row: list[Any]) -> float:
+    Attributes:
+        non_empty: Count of non-empty cells in the row
+        numeric: Count of numeric cells (typed numbers plus numeric strings;
+            booleans are counted as text, not numeric)
+        typed_numeric: Count of int/float cells only (block pattern analysis
+            counts these, not numeric strings or booleans)
+        total_length: Summed string length of all non-empty cells
+        key_value_hits: Count of cells containing key-value patterns
+        col_indices: 1-based column index of each non-empty cell, stored as
+            an unsigned-int array (4 bytes per entry instead of a PyObject
+            pointer to a boxed int) since grids can run to tens of thousands
+            of cells
+        values: Cell value for each non-empty cell, aligned with col_indices
     """
-    Calculate the ratio of numeric cells to non-empty cells in a row.
 
-    Numeric cells are: int, float, or numeric strings.
-    This is a key indicator of table data (prices, quantities, weights, etc.)
+    non_empty: int
+    numeric: int
+    typed_numeric: int
+    total_length: int
+    key_value_hits: int
+    col_indices: array
+    values: list[Any]
 
-    Args:
-        row: List of cell values
 
-    Returns:
-        Numeric density ratio (0.0-1.0)
-    """
-    non_empty_cells = [cell for cell in row if cell not in (None, "")]
-
-    if not non_empty_cells:
-        return 0.0
-
-    numeric_count = 0
-    for cell in non_empty_cells:
-        # Direct numeric types
-        if isinstance(cell, int | float):
-            numeric_count += 1
-        # Numeric strings
-        elif isinstance(cell, str):
-            # Try to parse as number
-            try:
-                float(cell.strip())
-                numeric_count += 1
-            except (ValueError, AttributeError):
-                pass
-
-    return numeric_count / len(non_empty_cells)
-
-
-def _calculate_average_cell_length(row: list[Any]) -> float:
+def _contains_key_value_pattern(text: str) -> bool:
     """
-    Calculate average character length of non-empty cells in a row.
+    Check if text contains key-value separator patterns.
 
-    Table cells tend to be shorter than metadata cells (which have long text).
+    This helps distinguish header metadata ("Label: Value") from table data.
 
     Args:
-        row: List of cell values
+        text: Text to check
 
     Returns:
-        Average cell length in characters
+        True if key-value pattern detected, False otherwise
     """
-    non_empty_cells = [cell for cell in row if cell not in (None, "")]
+    if not isinstance(text, str):
+        return False
 
-    if not non_empty_cells:
-        return 0.0
+    # Fast prefilter: a match needs a colon or a run of 2+ whitespace chars,
+    # so cells containing none of these characters (most table cells) skip
+    # the regex entirely. The substring checks are C-level scans.
+    if (
+        ":" not in text
+        and "  " not in text
+        and "\t" not in text
+        and "\n" not in text
+        and "\r" not in text
+    ):
+        return False
 
-    total_length = sum(len(str(cell)) for cell in non_empty_cells)
-    return total_length / len(non_empty_cells)
+    return bool(_KV_RE.search(text))
 
 
 def _looks_like_table_header(row: list[Any]) -> bool:
@@ -211,7 +219,7 @@ def _looks_like_table_header(row: list[Any]) -> bool:
         >>> _looks_like_table_header(row)
         False
     """
-    non_empty_cells = [cell for cell in row if cell not in (None, "")]
+    non_empty_cells = [cell for cell in row if cell is not None and cell != ""]
 
     if not non_empty_cells:
         return False
@@ -225,14 +233,14 @@ def _looks_like_table_header(row: list[Any]) -> bool:
 
     for cell in non_empty_cells:
         if isinstance(cell, str):
-            # Try to parse as number
-            try:
-                float(cell.strip())
+            # Numeric-string check via the anchored pattern: a failed match
+            # is a C-level scan, where a failed float() raises and catches a
+            # ValueError per text cell — and header rows are mostly text.
+            if _NUM_RE.match(cell):
                 numeric_count += 1
-            except (ValueError, AttributeError):
-                # Not a number, count as text
+            else:
                 text_count += 1
-        elif isinstance(cell, int | float):
+        elif isinstance(cell, _NUMERIC_TYPES) and not isinstance(cell, bool):
             numeric_count += 1
         else:
             # Other types (datetime, bool, etc.) count as text for header detection
@@ -274,77 +282,203 @@ def score_row_as_table_candidate(row: list[Any], row_index: int) -> float:
     Returns:
         Score from 0.0 to 1.0 (clamped)
     """
-    score = 0.0
-    pattern_details = []
+    summary = _scan_row(row)
+    return _score_from_summary(summary, len(row), row_index)
+
+
+def _scan_row(
+    row: list[Any],
+    *,
+    _numeric_types: tuple[type, ...] = _NUMERIC_TYPES,
+    _kind_of: Callable[[type], int | None] = _TYPE_KINDS.get,
+    _num_match: Callable[[str], Any] = _NUM_RE.match,
+    _has_key_value: Callable[[str], bool] = _contains_key_value_pattern,
+    _len: Callable[[Any], int] = len,
+    _str: Callable[[Any], str] = str,
+) -> "_RowSummary":
+    """
+    Make the single fused pass over a row, collecting all per-row state.
 
-    # Count non-empty cells
-    non_empty_cells = [cell for cell in row if cell not in (None, "")]
+    The scoring heuristics need four aggregates (non-empty count, numeric
+    count, total text length, key-value hits); accumulating them in one loop
+    visits each cell once instead of the 5+ passes the old _calculate_*
+    helpers made. The non-empty column indices and values are collected in
+    the same pass so block construction never has to re-scan the grid.
 
-    if not non_empty_cells:
+    The keyword-only parameters are private default-argument bindings: they
+    pin the helpers used inside the per-cell loop as fast locals, skipping
+    the global (and builtin) dictionary lookups each cell would otherwise
+    pay. Callers never pass them.
+
+    Args:
+        row: List of cell values
+
+    Returns:
+        _RowSummary with aggregates and the row's non-empty cells
+    """
+    non_empty = 0
+    numeric = 0
+    typed_numeric = 0
+    total_length = 0
+    key_value_hits = 0
+    col_indices = array("I")
+    values: list[Any] = []
+
+    append_col = col_indices.append
+    append_value = values.append
+
+    for col_idx, cell in enumerate(row, start=1):
+        if cell is None or cell == "":
+            continue
+        non_empty += 1
+        append_col(col_idx)
+        append_value(cell)
+
+        # One dict lookup on the exact type replaces the isinstance chain.
+        # Each cell is stringified at most once, shared between the length
+        # and key-value heuristics; int/float cells skip key-value detection
+        # outright since their string form never contains a colon or doubled
+        # whitespace.
+        kind = _kind_of(type(cell))
+        if kind == _KIND_NUMERIC:
+            numeric += 1
+            typed_numeric += 1
+            total_length += _len(_str(cell))
+            continue
+
+        if kind == _KIND_TEXT:
+            text = cell
+            if _num_match(cell):
+                numeric += 1
+        elif kind == _KIND_BOOL:
+            # Booleans are flags, not amounts: scored as text ("True"/"False")
+            text = _str(cell)
+        elif isinstance(cell, str):
+            # str subclass: same handling as exact str
+            text = cell
+            if _num_match(cell):
+                numeric += 1
+        elif isinstance(cell, _numeric_types):
+            # int/float subclass: same handling as exact int/float
+            numeric += 1
+            typed_numeric += 1
+            total_length += _len(_str(cell))
+            continue
+        else:
+            # datetime and other objects: key-value detection still applies
+            # (e.g. the colon in a time component)
+            text = _str(cell)
+
+        total_length += _len(text)
+        if _has_key_value(text):
+            key_value_hits += 1
+
+    return _RowSummary(
+        non_empty=non_empty,
+        numeric=numeric,
+        typed_numeric=typed_numeric,
+        total_length=total_length,
+        key_value_hits=key_value_hits,
+        col_indices=col_indices,
+        values=values,
+    )
+
+
+def _score_from_summary(summary: "_RowSummary", row_length: int, row_index: int) -> float:
+    """
+    Apply the scoring cascade to a row's scanned aggregates.
+
+    Args:
+        summary: Aggregates from _scan_row()
+        row_length: Total cell count of the row (including empty cells)
+        row_index: 1-based row index (for logging/debugging)
+
+    Returns:
+        Score from 0.0 to 1.0 (clamped)
+    """
+    non_empty = summary.non_empty
+    if non_empty == 0 or row_length == 0:
         return 0.0  # Empty row
 
-    # Calculate metrics
-    cell_density = _calculate_cell_density(row)
-    numeric_density = _calculate_numeric_density(row)
-    avg_cell_length = _calculate_average_cell_length(row)
+    score = 0.0
+
+    # Pattern labels exist only to feed the debug log below. At the
+    # production default of INFO, skip the per-branch appends, the join,
+    # and the seven-argument logger call entirely — the logger would drop
+    # the record anyway, but only after Python had built all the arguments.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    pattern_details: list[str] = []
+
+    cell_density = non_empty / row_length
+    numeric_density = summary.numeric / non_empty
+    avg_cell_length = summary.total_length / non_empty
 
     # Heuristic 1: High cell density (tables are densely populated)
     if cell_density > 0.7:
         score += 0.4
-        pattern_details.append("high_density")
+        if debug_enabled:
+            pattern_details.append("high_density")
     elif 0.3 <= cell_density <= 0.7:
         # Moderate density also suggests table (some columns might be empty)
         score += 0.2
-        pattern_details.append("moderate_density")
+        if debug_enabled:
+            pattern_details.append("moderate_density")
     elif cell_density < 0.3:
         # Very sparse - likely metadata
         score -= 0.3
-        pattern_details.append("sparse_row")
+        if debug_enabled:
+            pattern_details.append("sparse_row")
 
     # Heuristic 2: High numeric density (tables contain numbers)
     if numeric_density > 0.6:
         score += 0.5
-        pattern_details.append("high_numeric")
+        if debug_enabled:
+            pattern_details.append("high_numeric")
     elif numeric_density > 0.4:
         score += 0.3
-        pattern_details.append("moderate_numeric")
+        if debug_enabled:
+            pattern_details.append("moderate_numeric")
 
     # Heuristic 2.5: Text-heavy dense rows (likely table headers)
     # Table headers are text-heavy but should still be included in table blocks
     text_density = 1.0 - numeric_density
     if text_density > 0.7 and cell_density > 0.7:
         score += 0.4
-        pattern_details.append("text_header_candidate")
+        if debug_enabled:
+            pattern_details.append("text_header_candidate")
 
     # Heuristic 3: Short cell values (table cells are concise)
     if avg_cell_length < 30:
         score += 0.2
-        pattern_details.append("short_cells")
+        if debug_enabled:
+            pattern_details.append("short_cells")
 
     # Heuristic 4: Absence of key-value patterns (distinguishes from headers)
-    key_value_count = sum(1 for cell in non_empty_cells if _contains_key_value_pattern(str(cell)))
-    if key_value_count == 0:
+    if summary.key_value_hits == 0:
         score += 0.2
-        pattern_details.append("no_key_value")
+        if debug_enabled:
+            pattern_details.append("no_key_value")
     else:
         # Presence of key-value patterns suggests header, not table
         score -= 0.4
-        pattern_details.append("has_key_value")
+        if debug_enabled:
+            pattern_details.append("has_key_value")
 
     # Clamp score to 0.0-1.0 range
     score = max(0.0, min(1.0, score))
 
-    logger.debug(
-        "Row %d scored %.2f as table candidate (patterns: %s, "
-        "density: %.2f, numeric: %.2f, avg_len: %.1f, cells: %d)",
-        row_index,
-        score,
-        ", ".join(pattern_details) if pattern_details else "none",
-        cell_density,
-        numeric_density,
-        avg_cell_length,
-        len(non_empty_cells),
-    )
+    if debug_enabled:
+        logger.debug(
+            "Row %d scored %.2f as table candidate (patterns: %s, "
+            "density: %.2f, numeric: %.2f, avg_len: %.1f, cells: %d)",
+            row_index,
+            score,
+            ", ".join(pattern_details) if pattern_details else "none",
+            cell_density,
+            numeric_density,
+            avg_cell_length,
+            non_empty,
+        )
 
     return score
 
@@ -371,34 +505,166 @@ def find_table_candidate_rows(
         >>> find_table_candidate_rows(grid, min_score=0.5)
         [(3, 0.8)]
     """
+    candidate_rows, _ = _find_table_candidate_rows_summarized(grid, min_score)
+    return candidate_rows
+
+
+def _find_table_candidate_rows_summarized(
+    grid: list[list[Any]], min_score: float
+) -> tuple[list[tuple[int, float]], list[_RowSummary]]:
+    """
+    Scan the grid once, returning candidate rows plus per-row summaries.
+
+    The summaries carry each row's non-empty cells and numeric counts so
+    cluster_table_blocks can build block content without re-walking the grid
+    — every cell is visited exactly once for the whole detection pipeline.
+
+    Args:
+        grid: 2D list of cell values (list of rows)
+        min_score: Minimum score threshold (0.0-1.0)
+
+    Returns:
+        Tuple of (candidate (row_index, score) list, summary per grid row)
+    """
     logger.debug(
         "Scanning grid (%d rows) for table candidates (min_score=%.2f)",
         len(grid),
         min_score,
     )
 
-    candidate_rows = []
+    if len(grid) >= PARALLEL_SCORING_MIN_ROWS and os.environ.get(PARALLEL_SCORING_ENV_VAR) == "1":
+        candidate_rows, summaries = _score_rows_parallel(grid, min_score)
+    else:
+        candidate_rows, summaries = _score_rows(grid, 1, min_score)
+
+    logger.info(
+        "Found %d table candidate rows out of %d total rows",
+        len(candidate_rows),
+        len(grid),
+    )
 
-    for row_idx, row in enumerate(grid, start=1):
-        score = score_row_as_table_candidate(row, row_idx)
+    return candidate_rows, summaries
+
+
+def _score_rows(
+    rows: list[list[Any]], first_row_idx: int, min_score: float
+) -> tuple[list[tuple[int, float]], list[_RowSummary]]:
+    """
+    Score a contiguous run of rows, returning candidates and summaries.
+
+    This is the serial scoring kernel. It is a pure module-level function of
+    its arguments so the parallel path can dispatch it to worker processes
+    (picklable by reference), with `first_row_idx` carrying each chunk's
+    1-based offset into the full grid.
+
+    Args:
+        rows: Contiguous run of grid rows to score
+        first_row_idx: 1-based grid row index of rows[0]
+        min_score: Minimum score threshold (0.0-1.0)
+
+    Returns:
+        Tuple of (candidate (row_index, score) list, summary per row)
+    """
+    candidate_rows: list[tuple[int, float]] = []
+    summaries: list[_RowSummary] = []
+
+    # Exported sheets commonly contain long runs of identical rows (blank
+    # separators, repeated header/footer bands). Memoize the scan + score
+    # per distinct row content so repeats skip the per-cell work entirely.
+    # Keyed by (type, value) per cell: equal-but-differently-typed cells
+    # (True == 1 == 1.0 as dict keys) scan differently — booleans count as
+    # text while ints count as typed numerics — so the value alone would
+    # alias rows that legitimately score differently. The dict is local to
+    # this call, so it cannot grow beyond the current grid's distinct rows.
+    # Summaries are never mutated downstream, so sharing one instance across
+    # identical rows is safe.
+    seen_rows: dict[tuple[Any, ...], tuple[_RowSummary, float]] = {}
+
+    # Hot loop over every row of the grid: bind the helpers and the append
+    # methods to locals so each iteration skips the global/attribute lookups.
+    append_candidate = candidate_rows.append
+    append_summary = summaries.append
+    scan_row = _scan_row
+    score_from_summary = _score_from_summary
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    for row_idx, row in enumerate(rows, start=first_row_idx):
+        key: tuple[Any, ...] | None = tuple((type(value), value) for value in row)
+        try:
+            cached = seen_rows.get(key)
+        except TypeError:
+            # Unhashable cell value: score this row without caching
+            cached = None
+            key = None
+
+        if cached is not None:
+            summary, score = cached
+        else:
+            summary = scan_row(row)
+            score = score_from_summary(summary, len(row), row_idx)
+            if key is not None:
+                seen_rows[key] = (summary, score)
+        append_summary(summary)
 
         if score >= min_score:
-            candidate_rows.append((row_idx, score))
-            logger.debug("Row %d is a table candidate (score: %.2f)", row_idx, score)
+            append_candidate((row_idx, score))
+            if debug_enabled:
+                logger.debug("Row %d is a table candidate (score: %.2f)", row_idx, score)
+
+    return candidate_rows, summaries
+
+
+def _score_rows_parallel(
+    grid: list[list[Any]], min_score: float
+) -> tuple[list[tuple[int, float]], list[_RowSummary]]:
+    """
+    Score the grid across worker processes, one contiguous chunk per core.
+
+    Rows are scored independently, so the grid is split into cpu_count
+    contiguous chunks dispatched to a ProcessPoolExecutor. executor.map
+    preserves submission order, so concatenating the per-chunk results keeps
+    candidates and summaries in ascending row order. Only engaged for grids
+    of at least PARALLEL_SCORING_MIN_ROWS rows with the opt-in env var set,
+    since each worker pays to pickle its chunk of the grid.
+
+    Args:
+        grid: 2D list of cell values (list of rows)
+        min_score: Minimum score threshold (0.0-1.0)
+
+    Returns:
+        Tuple of (candidate (row_index, score) list, summary per grid row)
+    """
+    worker_count = os.cpu_count() or 1
+    chunk_size = max(1, -(-len(grid) // worker_count))  # ceil division
+    chunk_starts = range(0, len(grid), chunk_size)
+    chunks = [grid[start : start + chunk_size] for start in chunk_starts]
+    first_row_indices = [start + 1 for start in chunk_starts]
 
     logger.info(
-        "Found %d table candidate rows out of %d total rows",
-        len(candidate_rows),
+        "Scoring %d rows across %d worker process(es) (%d chunk(s) of up to %d rows)",
         len(grid),
+        worker_count,
+        len(chunks),
+        chunk_size,
     )
 
-    return candidate_rows
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        results = list(
+            executor.map(_score_rows, chunks, first_row_indices, [min_score] * len(chunks))
+        )
+
+    candidate_rows = [
+        candidate for chunk_candidates, _ in results for candidate in chunk_candidates
+    ]
+    summaries = [summary for _, chunk_summaries in results for summary in chunk_summaries]
+    return candidate_rows, summaries
 
 
 def cluster_table_blocks(
     grid: list[list[Any]],
     scored_rows: list[tuple[int, float]],
     min_consecutive: int = DEFAULT_MIN_TABLE_ROWS,
+    row_summaries: list[_RowSummary] | None = None,
 ) -> list[TableCandidateBlock]:
     """
     Group consecutive high-scoring rows into distinct table blocks.
@@ -410,6 +676,9 @@ def cluster_table_blocks(
         grid: 2D list of cell values
         scored_rows: List of (row_index, score) tuples (1-based indices)
         min_consecutive: Minimum consecutive rows required to form a table. Default: 3
+        row_summaries: Optional per-row summaries from the scoring pass; when
+            provided, block content is built from them instead of re-scanning
+            the grid
 
     Returns:
         List of TableCandidateBlock instances, sorted by row_start.
@@ -431,65 +700,71 @@ def cluster_table_blocks(
         min_consecutive,
     )
 
-    # Sort by row index
-    sorted_rows = sorted(scored_rows, key=lambda x: x[0])
+    # Scored rows arrive in ascending row order from the grid scan, so a
+    # single cheap monotonicity pass replaces an unconditional sort; the
+    # sort only happens for callers that hand rows unordered.
+    row_count = len(scored_rows)
+    if all(scored_rows[i][0] <= scored_rows[i + 1][0] for i in range(row_count - 1)):
+        sorted_rows = scored_rows
+    else:
+        sorted_rows = sorted(scored_rows, key=lambda x: x[0])
 
+    # A cluster is always a contiguous slice of sorted_rows (bridged gap
+    # rows simply were not scored above threshold), so track only the slice
+    # start index and materialize the cluster when a break is seen — no
+    # per-row list growth, and the header-bridge lookahead is a direct
+    # index probe instead of a linear list.index() search.
     blocks = []
-    current_cluster = [sorted_rows[0]]
+    cluster_start = 0
 
-    # Cluster consecutive rows
-    for row_idx, score in sorted_rows[1:]:
-        last_row_idx = current_cluster[-1][0]
+    for i in range(1, row_count):
+        row_idx = sorted_rows[i][0]
+        last_row_idx = sorted_rows[i - 1][0]
+        cluster_len = i - cluster_start
 
-        # If consecutive (next row), add to current cluster
+        # If consecutive (next row), continue the current cluster
         if row_idx == last_row_idx + 1:
-            current_cluster.append((row_idx, score))
-        # If gap of 1 row and current cluster is small (1-2 rows), check if it's a header
-        # followed by data rows - if so, skip the gap and continue clustering
-        elif row_idx == last_row_idx + 2 and len(current_cluster) <= 2:
-            # Check if this starts a longer sequence
-            # Look ahead to see if there are more consecutive rows after this one
-            next_indices = [r[0] for r in sorted_rows[sorted_rows.index((row_idx, score)) :]]
-            has_consecutive_after = len(next_indices) >= 2 and next_indices[1] == row_idx + 1
-
-            if has_consecutive_after:
-                # Include the current row, bridging the gap
-                current_cluster.append((row_idx, score))
-                logger.debug(
-                    "Bridging 1-row gap from R%d to R%d (potential header-data separation)",
-                    last_row_idx,
-                    row_idx,
-                )
-            else:
-                # Regular non-consecutive handling
-                if len(current_cluster) >= min_consecutive:
-                    blocks.append(_create_table_block_from_cluster(grid, current_cluster))
-                else:
-                    logger.debug(
-                        "Discarding cluster of %d rows (below min_consecutive=%d)",
-                        len(current_cluster),
-                        min_consecutive,
-                    )
-                current_cluster = [(row_idx, score)]
+            continue
+
+        # If gap of 1 row and current cluster is small (1-2 rows), check if
+        # it's a header followed by data rows - if so, bridge the gap and
+        # continue clustering
+        if (
+            row_idx == last_row_idx + 2
+            and cluster_len <= 2
+            and i + 1 < row_count
+            and sorted_rows[i + 1][0] == row_idx + 1
+        ):
+            logger.debug(
+                "Bridging 1-row gap from R%d to R%d (potential header-data separation)",
+                last_row_idx,
+                row_idx,
+            )
+            continue
+
+        # Non-consecutive: finalize current cluster if it meets minimum
+        if cluster_len >= min_consecutive:
+            blocks.append(
+                _create_table_block_from_cluster(grid, sorted_rows[cluster_start:i], row_summaries)
+            )
         else:
-            # Non-consecutive: finalize current cluster if it meets minimum
-            if len(current_cluster) >= min_consecutive:
-                blocks.append(_create_table_block_from_cluster(grid, current_cluster))
-            else:
-                logger.debug(
-                    "Discarding cluster of %d rows (below min_consecutive=%d)",
-                    len(current_cluster),
-                    min_consecutive,
-                )
-            current_cluster = [(row_idx, score)]
+            logger.debug(
+                "Discarding cluster of %d rows (below min_consecutive=%d)",
+                cluster_len,
+                min_consecutive,
+            )
+        cluster_start = i
 
     # Finalize last cluster
-    if len(current_cluster) >= min_consecutive:
-        blocks.append(_create_table_block_from_cluster(grid, current_cluster))
+    cluster_len = row_count - cluster_start
+    if cluster_len >= min_consecutive:
+        blocks.append(
+            _create_table_block_from_cluster(grid, sorted_rows[cluster_start:], row_summaries)
+        )
     else:
         logger.debug(
             "Discarding final cluster of %d rows (below min_consecutive=%d)",
-            len(current_cluster),
+            cluster_len,
             min_consecutive,
         )
 
@@ -504,7 +779,9 @@ def cluster_table_blocks(
 
 
 def _create_table_block_from_cluster(
-    grid: list[list[Any]], cluster: list[tuple[int, float]]
+    grid: list[list[Any]],
+    cluster: list[tuple[int, float]],
+    row_summaries: list[_RowSummary] | None = None,
 ) -> TableCandidateBlock:
     """
     Create a TableCandidateBlock from a cluster of scored rows.
@@ -512,39 +789,66 @@ def _create_table_block_from_cluster(
     Args:
         grid: 2D list of cell values
         cluster: List of (row_index, score) tuples (1-based)
+        row_summaries: Optional per-row summaries from the scoring pass;
+            when provided, content and numeric counts come from the cached
+            scan instead of a second walk over the grid cells
 
     Returns:
         TableCandidateBlock instance
     """
-    row_indices = [row_idx for row_idx, _ in cluster]
-    scores = [score for _, score in cluster]
+    # Clusters are built in ascending row order by cluster_table_blocks, so
+    # the row bounds are the endpoints — no index list or min()/max() pass.
+    row_start = cluster[0][0]
+    row_end = cluster[-1][0]
 
-    row_start = min(row_indices)
-    row_end = max(row_indices)
+    # Calculate average score for the block (running sum, no score list)
+    avg_score = sum(score for _, score in cluster) / len(cluster)
 
-    # Calculate average score for the block
-    avg_score = sum(scores) / len(scores)
-
-    # Extract content and determine column range
+    # Extract content, tracking the column extrema as running values
+    # instead of materializing a col_indices list just to min()/max() it
     content = []
-    col_indices = []
-
-    for row_idx in range(row_start, row_end + 1):
-        # Convert to 0-based index for grid access
-        grid_row_idx = row_idx - 1
-
-        if grid_row_idx < len(grid):
-            row = grid[grid_row_idx]
-
-            for col_idx, cell in enumerate(row, start=1):
-                if cell not in (None, ""):
+    col_min = 0
+    col_max = 0
+    numeric_cells = 0
+
+    if row_summaries is not None:
+        # Reuse the cells collected during scoring (no grid re-scan)
+        for row_idx in range(row_start, row_end + 1):
+            if row_idx <= len(row_summaries):
+                summary = row_summaries[row_idx - 1]
+                numeric_cells += summary.typed_numeric
+                cols = summary.col_indices
+                if cols:
+                    # Column indices are collected in ascending order, so the
+                    # row's extrema are its endpoints
+                    if col_min == 0 or cols[0] < col_min:
+                        col_min = cols[0]
+                    if cols[-1] > col_max:
+                        col_max = cols[-1]
+                for col_idx, cell in zip(cols, summary.values, strict=True):
                     content.append((row_idx, col_idx, cell))
-                    col_indices.append(col_idx)
+    else:
+        for row_idx in range(row_start, row_end + 1):
+            # Convert to 0-based index for grid access
+            grid_row_idx = row_idx - 1
+
+            if grid_row_idx < len(grid):
+                row = grid[grid_row_idx]
+
+                for col_idx, cell in enumerate(row, start=1):
+                    if cell is not None and cell != "":
+                        content.append((row_idx, col_idx, cell))
+                        if col_min == 0 or col_idx < col_min:
+                            col_min = col_idx
+                        if col_idx > col_max:
+                            col_max = col_idx
+                        if isinstance(cell, _NUMERIC_TYPES) and not isinstance(cell, bool):
+                            numeric_cells += 1
 
     # Determine column range
-    if col_indices:
-        col_start = min(col_indices)
-        col_end = max(col_indices)
+    if col_min > 0:
+        col_start = col_min
+        col_end = col_max
     else:
         # Empty block (shouldn't happen, but handle gracefully)
         col_start = 1
@@ -552,7 +856,6 @@ def _create_table_block_from_cluster(
 
     # Determine primary detection pattern
     # Analyze patterns across all cells in the block
-    numeric_cells = sum(1 for _, _, cell in content if isinstance(cell, int | float))
     total_cells = len(content)
     numeric_ratio = numeric_cells / total_cells if total_cells > 0 else 0.0
 
@@ -654,7 +957,7 @@ def expand_table_blocks_with_headers(
             header_content = []
             for col_idx in range(block.col_start - 1, min(block.col_end, len(header_row))):
                 cell = header_row[col_idx]
-                if cell not in (None, ""):
+                if cell is not None and cell != "":
                     # Store as (row_1based, col_1based, value)
                     header_content.append((header_row_index, col_idx + 1, cell))
 
@@ -739,15 +1042,18 @@ def detect_table_candidate_blocks(
         min_consecutive,
     )
 
-    # Step 1: Find candidate rows
-    scored_rows = find_table_candidate_rows(grid, min_score=min_score)
+    # Step 1: Find candidate rows (keeping the per-row summaries so the
+    # clustering step never re-scans the grid)
+    scored_rows, row_summaries = _find_table_candidate_rows_summarized(grid, min_score)
 
     if not scored_rows:
         logger.info("No table candidate rows found")
         return []
 
     # Step 2: Cluster into blocks with minimum consecutive requirement
-    blocks = cluster_table_blocks(grid, scored_rows, min_consecutive=min_consecutive)
+    blocks = cluster_table_blocks(
+        grid, scored_rows, min_consecutive=min_consecutive, row_summaries=row_summaries
+    )
 
     # Step 3: Expand blocks to include adjacent header rows
     blocks = expand_table_blocks_with_headers(blocks, grid)
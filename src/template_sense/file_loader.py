@@ -62,7 +62,13 @@ def load_excel_file(path: Path) -> Workbook:
     try:
         # data_only=True: Load computed values instead of formulas
         # This ensures consistent behavior across different environments
-        return load_workbook(filename=path, data_only=True)
+        # keep_links=False: Skip external workbook link parts; extraction
+        # only reads cell values, so link bookkeeping is dead weight
+        # NOTE: read_only=True would stream rows at near-constant memory,
+        # but ReadOnlyWorksheet drops row_dimensions/column_dimensions and
+        # extract_raw_grid guarantees hidden rows/columns are excluded —
+        # that metadata requires the regular load path.
+        return load_workbook(filename=path, data_only=True, keep_links=False)
     except FileNotFoundError as e:
         # This should not happen since validate_supported_file checks existence
         raise FileValidationError(
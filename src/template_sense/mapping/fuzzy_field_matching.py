@@ -59,6 +59,13 @@ from template_sense.constants import (
     SEMANTIC_MATCHING_CONFIDENCE_THRESHOLD,
     SEMANTIC_MATCHING_FUZZY_FLOOR,
 )
+from template_sense.mapping.semantic_match_cache import (
+    compute_dictionary_fingerprint,
+    compute_semantic_cache_key,
+    load_cached_semantic_match,
+    semantic_match_cache_enabled,
+    store_cached_semantic_match,
+)
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -136,7 +143,7 @@ def _normalize_text(text: str) -> str:
     return " ".join(normalized.split())
 
 
-def _calculate_similarity(text1: str, text2: str) -> float:
+def _calculate_similarity(text1: str, text2: str, score_cutoff: float | None = None) -> float:
     """
     Calculate similarity score between two text strings.
 
@@ -148,9 +155,13 @@ def _calculate_similarity(text1: str, text2: str) -> float:
     Args:
         text1: First text string (already normalized)
         text2: Second text string (already normalized)
+        score_cutoff: Optional fail-fast threshold passed to rapidfuzz; the C
+                     implementation aborts early and returns 0.0 once the score
+                     provably cannot reach it
 
     Returns:
-        Similarity score on 0-100 scale (100 = perfect match)
+        Similarity score on 0-100 scale (100 = perfect match), or 0.0 when the
+        score falls below score_cutoff
 
     Example:
         >>> _calculate_similarity("invoice number", "invoice number")
@@ -160,13 +171,69 @@ def _calculate_similarity(text1: str, text2: str) -> float:
         >>> _calculate_similarity("invoice no", "invoice number")
         76.92  # Approximate
     """
-    return fuzz.token_set_ratio(text1, text2)
+    return fuzz.token_set_ratio(text1, text2, score_cutoff=score_cutoff)
+
+
+def _build_exact_index(field_dictionary: dict[str, list[str]]) -> dict[str, tuple[str, str]]:
+    """
+    Build a lookup of normalized variants to their canonical key and variant.
+
+    Translated labels frequently equal a dictionary variant verbatim (e.g.,
+    "Invoice Number"), so an O(1) dict lookup can resolve them without scanning
+    every key/variant pair through the fuzzy scorer. When the same normalized
+    variant appears under multiple canonical keys, the lexicographically
+    smallest (canonical_key, variant) pair wins, matching the tie-breaking
+    rule in _find_best_match.
+
+    Args:
+        field_dictionary: Mapping of canonical_key -> list of variants
+
+    Returns:
+        Dict mapping normalized variant text to (canonical_key, variant)
+
+    Example:
+        >>> _build_exact_index({"invoice_number": ["Invoice No"]})
+        {'invoice no': ('invoice_number', 'Invoice No')}
+    """
+    index: dict[str, tuple[str, str]] = {}
+    for canonical_key, variants in field_dictionary.items():
+        for variant in variants:
+            normalized = _normalize_text(variant)
+            existing = index.get(normalized)
+            if existing is None or (canonical_key, variant) < existing:
+                index[normalized] = (canonical_key, variant)
+    return index
+
+
+def _normalize_variants(field_dictionary: dict[str, list[str]]) -> list[tuple[str, str, str]]:
+    """
+    Normalize every dictionary variant once for reuse across labels.
+
+    _find_best_match compares each label against each variant; normalizing
+    the variants inside that loop repeated the Unicode/case/whitespace work
+    len(labels) times per variant. This flattens the dictionary into
+    pre-normalized tuples so a match_fields call normalizes each variant
+    exactly once.
+
+    Args:
+        field_dictionary: Mapping of canonical_key -> list of variants
+
+    Returns:
+        List of (canonical_key, variant, normalized_variant) tuples in
+        dictionary iteration order
+    """
+    return [
+        (canonical_key, variant, _normalize_text(variant))
+        for canonical_key, variants in field_dictionary.items()
+        for variant in variants
+    ]
 
 
 def _find_best_match(
     translated_text: str,
     field_dictionary: dict[str, list[str]],
     threshold: float,
+    normalized_variants: list[tuple[str, str, str]] | None = None,
 ) -> tuple[str | None, float, str | None]:
     """
     Find the best matching canonical key for a single translated label.
@@ -179,6 +246,9 @@ def _find_best_match(
         translated_text: Normalized English text to match
         field_dictionary: Mapping of canonical_key -> list of variants
         threshold: Minimum match score (0-100) to accept a match
+        normalized_variants: Optional pre-normalized variants from
+                            _normalize_variants(); computed from
+                            field_dictionary when not provided
 
     Returns:
         Tuple of (canonical_key, match_score, matched_variant):
@@ -199,6 +269,9 @@ def _find_best_match(
     # Normalize the input text once
     normalized_input = _normalize_text(translated_text)
 
+    if normalized_variants is None:
+        normalized_variants = _normalize_variants(field_dictionary)
+
     best_score = 0.0
     best_canonical_key: str | None = None
     best_variant: str | None = None
@@ -206,22 +279,24 @@ def _find_best_match(
     # Track ties for deterministic tie-breaking
     tied_matches: list[tuple[str, str]] = []  # List of (canonical_key, variant)
 
-    # Compare against all canonical keys and their variants
-    for canonical_key, variants in field_dictionary.items():
-        for variant in variants:
-            normalized_variant = _normalize_text(variant)
-            score = _calculate_similarity(normalized_input, normalized_variant)
-
-            if score > best_score:
-                # New best match found
-                best_score = score
-                best_canonical_key = canonical_key
-                best_variant = variant
-                tied_matches = [(canonical_key, variant)]
-
-            elif score == best_score and score > 0:
-                # Tie detected
-                tied_matches.append((canonical_key, variant))
+    # Compare against all canonical keys and their pre-normalized variants.
+    # The running best score doubles as a fail-fast cutoff: rapidfuzz aborts
+    # scoring a variant (returning 0.0) once it provably cannot beat the best
+    # seen so far, while scores equal to the cutoff still come through so tie
+    # detection is unaffected.
+    for canonical_key, variant, normalized_variant in normalized_variants:
+        score = _calculate_similarity(normalized_input, normalized_variant, score_cutoff=best_score)
+
+        if score > best_score:
+            # New best match found
+            best_score = score
+            best_canonical_key = canonical_key
+            best_variant = variant
+            tied_matches = [(canonical_key, variant)]
+
+        elif score == best_score and score > 0:
+            # Tie detected
+            tied_matches.append((canonical_key, variant))
 
     # If we found a match above threshold
     if best_score >= threshold and best_canonical_key is not None:
@@ -268,12 +343,16 @@ def match_fields(
     AI to determine semantic equivalence.
 
     Behavior:
-    - For each label, compares against all canonical keys and variants (fuzzy matching)
+    - Labels equal to a dictionary variant (after normalization) fast-path to a
+      100.0-score match via an exact-lookup index, skipping fuzzy scoring
+    - For each remaining label, compares against all canonical keys and variants (fuzzy matching)
     - Returns best match with score >= threshold
     - If fuzzy match fails (<threshold) and enable_semantic_matching=True and ai_provider provided:
       * Attempts AI semantic matching for scores >= SEMANTIC_MATCHING_FUZZY_FLOOR (30%)
       * Uses AI to determine semantic equivalence (e.g., "FROM" → "shipper")
       * Returns semantic match if AI confidence >= semantic_confidence_threshold
+      * With TEMPLATE_SENSE_SEMANTIC_MATCH_CACHE=1, accepted semantic matches
+        persist to disk and repeated runs resolve them without an AI request
     - If no match meets threshold, returns FieldMatchResult with canonical_key=None
     - Deterministic fuzzy matching: same inputs always produce same outputs
     - Tie-breaking: lexicographic order of canonical_key
@@ -342,6 +421,21 @@ def match_fields(
     if semantic_matching_available:
         logger.info("AI semantic matching enabled as fallback for low-confidence matches")
 
+    # Persistent cache for accepted semantic matches (opt-in via env var).
+    # The fingerprint ties cached entries to this exact dictionary's contents
+    dictionary_fingerprint: str | None = None
+    if semantic_matching_available and semantic_match_cache_enabled():
+        dictionary_fingerprint = compute_dictionary_fingerprint(field_dictionary)
+
+    # Exact-match fast path: labels that equal a dictionary variant verbatim
+    # (after normalization) resolve via one dict lookup instead of scoring
+    # every key/variant pair
+    exact_index = _build_exact_index(field_dictionary)
+
+    # Normalize every variant once up front; _find_best_match reuses this
+    # list for each label instead of re-normalizing per label
+    normalized_variants = _normalize_variants(field_dictionary)
+
     # Process each translated label
     results: list[FieldMatchResult] = []
     matched_count = 0
@@ -352,9 +446,25 @@ def match_fields(
         # Extract translated text for matching
         translated_text = translated_label.translated_text
 
+        # Step 0: Exact variant match resolves without any fuzzy scoring
+        exact = exact_index.get(_normalize_text(translated_text))
+        if exact is not None:
+            canonical_key, matched_variant = exact
+            results.append(
+                FieldMatchResult(
+                    original_text=translated_label.original_text,
+                    translated_text=translated_text,
+                    canonical_key=canonical_key,
+                    match_score=100.0,
+                    matched_variant=matched_variant,
+                )
+            )
+            matched_count += 1
+            continue
+
         # Step 1: Try fuzzy matching first
         canonical_key, match_score, matched_variant = _find_best_match(
-            translated_text, field_dictionary, threshold
+            translated_text, field_dictionary, threshold, normalized_variants
         )
 
         # Step 2: If fuzzy succeeded, use it
@@ -382,6 +492,27 @@ def match_fields(
                 f"attempting semantic matching"
             )
 
+            # Cached accepted matches resolve without an AI round-trip
+            cache_key: str | None = None
+            if dictionary_fingerprint is not None:
+                cache_key = compute_semantic_cache_key(translated_text, dictionary_fingerprint)
+                cached = load_cached_semantic_match(cache_key)
+                if cached is not None:
+                    cached_key, cached_confidence, cached_reasoning = cached
+                    if cached_confidence >= semantic_confidence_threshold:
+                        results.append(
+                            FieldMatchResult(
+                                original_text=translated_label.original_text,
+                                translated_text=translated_text,
+                                canonical_key=cached_key,
+                                match_score=cached_confidence * 100,
+                                matched_variant=f"AI Semantic: {cached_reasoning}",
+                            )
+                        )
+                        matched_count += 1
+                        semantic_matched_count += 1
+                        continue
+
             try:
                 semantic_result = semantic_match_field(
                     translated_label=translated_text,
@@ -411,6 +542,15 @@ def match_fields(
                         f"Semantic match found: '{translated_text}' → '{semantic_result.canonical_key}' "
                         f"(AI confidence: {semantic_result.semantic_confidence:.0%})"
                     )
+                    # Only accepted matches are persisted; misses and provider
+                    # failures are re-queried on the next run
+                    if cache_key is not None:
+                        store_cached_semantic_match(
+                            cache_key,
+                            semantic_result.canonical_key,
+                            semantic_result.semantic_confidence,
+                            semantic_result.reasoning,
+                        )
                     continue
 
             except Exception as e:
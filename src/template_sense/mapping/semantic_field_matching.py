@@ -39,6 +39,7 @@ from template_sense.constants import (
     SEMANTIC_MATCHING_TIMEOUT_SECONDS,
 )
 from template_sense.errors import AIProviderError
+from template_sense.serialization import deserialize_from_json
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -232,7 +233,7 @@ def semantic_match_field(
             elif response_text.startswith("```"):
                 response_text = response_text.split("```")[1].split("```")[0].strip()
 
-            response_data = json.loads(response_text)
+            response_data = deserialize_from_json(response_text)
             canonical_key = response_data.get("canonical_key")
             confidence = float(response_data.get("confidence", 0.0))
             reasoning = response_data.get("reasoning", "No reasoning provided")
@@ -0,0 +1,179 @@
+"""
+Persistent disk cache for AI semantic-matching results.
+
+Semantic matching costs a network round-trip per uncertain label, and invoice
+templates from the same customer repeat the same uncertain labels run after
+run. This module caches accepted semantic matches — canonical key, AI
+confidence, and reasoning — keyed by the translated label plus a fingerprint
+of the field dictionary, so repeated pipeline runs resolve those labels with
+a disk lookup instead of an AI call.
+
+The cache is opt-in via the TEMPLATE_SENSE_SEMANTIC_MATCH_CACHE=1 environment
+variable and lives under ~/.cache/template_sense/ (override with
+TEMPLATE_SENSE_SEMANTIC_MATCH_CACHE_DIR). A changed dictionary produces a
+different fingerprint, so entries from an outdated dictionary are never
+served. Only accepted matches are stored: misses and provider failures are
+re-queried on the next run rather than pinned to disk. All cache failures
+(corrupt entry, unwritable directory) degrade to a miss; they never fail
+matching.
+
+Functions:
+    semantic_match_cache_enabled: Check whether the disk cache is turned on
+    compute_dictionary_fingerprint: Hash a field dictionary into a fingerprint
+    compute_semantic_cache_key: Build a cache key for one label + fingerprint
+    load_cached_semantic_match: Look up a cached semantic match
+    store_cached_semantic_match: Persist an accepted match for future runs
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from template_sense.constants import (
+    SEMANTIC_MATCH_CACHE_DIR_ENV_VAR,
+    SEMANTIC_MATCH_CACHE_ENV_VAR,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached entry layout changes shape; mismatched entries are
+# treated as misses
+_CACHE_FORMAT_VERSION = 1
+
+
+def semantic_match_cache_enabled() -> bool:
+    """
+    Check whether the semantic-match disk cache is enabled.
+
+    Returns:
+        True if TEMPLATE_SENSE_SEMANTIC_MATCH_CACHE is set to "1", False otherwise
+    """
+    return os.environ.get(SEMANTIC_MATCH_CACHE_ENV_VAR) == "1"
+
+
+def _cache_dir() -> Path:
+    """Resolve the cache directory, honoring the override environment variable."""
+    override = os.environ.get(SEMANTIC_MATCH_CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "template_sense"
+
+
+def _cache_path(key: str) -> Path:
+    """Build the cache file path for a given key."""
+    return _cache_dir() / f"sem-{key}.json"
+
+
+def compute_dictionary_fingerprint(field_dictionary: dict[str, list[str]]) -> str:
+    """
+    Compute a stable fingerprint of a field dictionary.
+
+    The fingerprint is insensitive to key insertion order but changes when
+    any canonical key or variant changes, so cached matches made against an
+    outdated dictionary are never served.
+
+    Args:
+        field_dictionary: Mapping of canonical_key -> list of variants
+
+    Returns:
+        Hex digest identifying the dictionary contents
+    """
+    serialized = json.dumps(sorted(field_dictionary.items()), ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def compute_semantic_cache_key(translated_text: str, dictionary_fingerprint: str) -> str:
+    """
+    Build the cache key for one translated label against one dictionary.
+
+    Args:
+        translated_text: English label text being semantically matched
+        dictionary_fingerprint: Fingerprint from compute_dictionary_fingerprint()
+
+    Returns:
+        Hex digest combining the label and the dictionary fingerprint
+    """
+    payload = f"{translated_text}|{dictionary_fingerprint}".encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def load_cached_semantic_match(key: str) -> tuple[str, float, str | None] | None:
+    """
+    Load a cached semantic match.
+
+    Args:
+        key: Cache key from compute_semantic_cache_key()
+
+    Returns:
+        Tuple of (canonical_key, semantic_confidence, reasoning) on a hit,
+        None on a miss or any cache read failure
+    """
+    path = _cache_path(key)
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable semantic match cache entry: %s", str(e))
+        return None
+
+    if not (isinstance(entry, dict) and entry.get("version") == _CACHE_FORMAT_VERSION):
+        logger.debug("Ignoring semantic match cache entry with stale format")
+        return None
+
+    canonical_key = entry.get("canonical_key")
+    confidence = entry.get("confidence")
+    if not isinstance(canonical_key, str) or not isinstance(confidence, (int, float)):
+        logger.debug("Ignoring malformed semantic match cache entry")
+        return None
+
+    logger.info("Semantic match cache hit; skipping AI request")
+    return canonical_key, float(confidence), entry.get("reasoning")
+
+
+def store_cached_semantic_match(
+    key: str,
+    canonical_key: str,
+    confidence: float,
+    reasoning: str | None,
+) -> None:
+    """
+    Persist an accepted semantic match for future runs.
+
+    Write failures are logged and swallowed; caching is best-effort.
+
+    Args:
+        key: Cache key from compute_semantic_cache_key()
+        canonical_key: Canonical field key the AI matched
+        confidence: AI confidence for the match (0.0-1.0)
+        reasoning: AI reasoning for the match, if provided
+    """
+    path = _cache_path(key)
+    entry = {
+        "version": _CACHE_FORMAT_VERSION,
+        "canonical_key": canonical_key,
+        "confidence": confidence,
+        "reasoning": reasoning,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        # Atomic replace so concurrent readers never see a partial entry
+        tmp_path.replace(path)
+        logger.debug("Stored semantic match cache entry")
+    except Exception as e:
+        logger.warning("Could not write semantic match cache entry: %s", str(e))
+
+
+__all__ = [
+    "compute_dictionary_fingerprint",
+    "compute_semantic_cache_key",
+    "load_cached_semantic_match",
+    "semantic_match_cache_enabled",
+    "store_cached_semantic_match",
+]
@@ -25,6 +25,7 @@ on top of this module.
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -35,7 +36,7 @@ logger = logging.getLogger(__name__)
 
 
 def run_extraction_pipeline(
-    file_path: str | Path,
+    file_path: Path,
     field_dictionary: dict[str, dict[str, str]],
     ai_config: AIConfig | None = None,
 ) -> dict[str, Any]:
@@ -58,10 +59,11 @@ def run_extraction_pipeline(
     9. ConfidenceFilteringStage - Filters by confidence thresholds
     10. CanonicalAggregationStage - Builds canonical template
     11. NormalizedOutputStage - Builds normalized JSON output
-    12. MetadataStage - Builds metadata and closes workbook
+    12. MetadataStage - Builds metadata
 
     Args:
-        file_path: Path to the Excel file (.xlsx or .xls)
+        file_path: Path to the Excel file (.xlsx or .xls). Callers normalize
+                  string paths at the public boundary (see analyzer module).
         field_dictionary: Canonical field dictionary with multilingual variants.
                          Format: {"canonical_key": ["variant1", "variant2", ...]}
         ai_config: Optional AI provider configuration. If None, loads from environment.
@@ -120,10 +122,6 @@ def run_extraction_pipeline(
     logger.info("File: %s", file_path)
     logger.info("Field dictionary keys: %d", len(field_dictionary))
 
-    # Convert file_path to Path if string
-    if isinstance(file_path, str):
-        file_path = Path(file_path)
-
     # Initialize pipeline context
     context = PipelineContext(
         file_path=file_path,
@@ -147,9 +145,25 @@ def run_extraction_pipeline(
         MetadataStage(),
     ]
 
-    # Execute stages sequentially
-    for stage in stages:
-        context = stage.execute(context)
+    # Execute stages sequentially. The runner owns the workbook's lifetime:
+    # closing in one finally block covers every stage's failure path instead
+    # of each stage duplicating close-on-error handling.
+    #
+    # Per-stage progress logs are emitted at DEBUG by the stages themselves;
+    # at INFO the runner collapses them into a single trace record so a
+    # production run writes one log line instead of two per stage.
+    pipeline_trace: list[str] = []
+    try:
+        for stage in stages:
+            start = time.perf_counter()
+            context = stage.execute(context)
+            duration_ms = (time.perf_counter() - start) * 1000
+            pipeline_trace.append(f"{type(stage).__name__}={duration_ms:.1f}ms")
+    finally:
+        if context.workbook is not None:
+            context.workbook.close()
+            logger.debug("Workbook closed")
+        logger.info("Pipeline trace: %s", "; ".join(pipeline_trace))
 
     # Return final result
     return context.to_dict()
@@ -17,7 +17,7 @@ The 12 stages are:
 9. ConfidenceFilteringStage - Filters by confidence thresholds
 10. CanonicalAggregationStage - Builds canonical template
 11. NormalizedOutputStage - Builds normalized JSON output
-12. MetadataStage - Builds metadata and closes workbook
+12. MetadataStage - Builds metadata
 """
 
 from template_sense.pipeline.stages.ai_classification import AIClassificationStage
@@ -10,19 +10,23 @@ Uses error recovery to handle AI provider failures gracefully.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from template_sense.ai.header_classification import (
     ClassifiedHeaderField,
     _parse_header_field,
+    classify_header_fields,
 )
 from template_sense.ai.line_item_extraction import (
     ExtractedLineItem,
     _parse_line_item,
+    extract_line_items,
 )
 from template_sense.ai.table_column_classification import (
     ClassifiedTableColumn,
     _parse_table_column,
+    classify_table_columns,
 )
 from template_sense.errors import AIProviderError
 from template_sense.pipeline.stages.base import PipelineContext, PipelineStage
@@ -40,12 +44,15 @@ class AIClassificationStage(PipelineStage):
     - Table columns (context.classified_columns)
     - Line items (context.extracted_line_items)
 
-    Uses error recovery to continue processing if the batch call fails.
+    If the batch call fails, falls back to the three individual
+    classification calls submitted concurrently, so a batch-level failure
+    (e.g. an over-long combined response) degrades to roughly one
+    round-trip of extra latency instead of losing all three results.
     """
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute AI classification stage using batch classification."""
-        logger.info("Stage 6: AI batch classification")
+        logger.debug("Stage 6: AI batch classification")
 
         if context.ai_provider is None or context.ai_payload is None:
             logger.error("AI provider or payload not set in context")
@@ -61,93 +68,122 @@ class AIClassificationStage(PipelineStage):
             )
             logger.info("Batch classification completed successfully")
 
-            # Parse headers
-            context.classified_headers = self._parse_headers(batch_results.get("headers", []))
+            # Parse each context's result list with its registered parser
+            context.classified_headers = self._parse_batch_list(batch_results, "headers")
             logger.info("Classified %d header fields", len(context.classified_headers))
 
-            # Parse columns
-            context.classified_columns = self._parse_columns(batch_results.get("columns", []))
+            context.classified_columns = self._parse_batch_list(batch_results, "columns")
             logger.info("Classified %d table columns", len(context.classified_columns))
 
-            # Parse line items
-            context.extracted_line_items = self._parse_line_items(
-                batch_results.get("line_items", [])
-            )
+            context.extracted_line_items = self._parse_batch_list(batch_results, "line_items")
             logger.info("Extracted %d line items", len(context.extracted_line_items))
 
         except AIProviderError as e:
-            logger.error("Batch classification failed: %s", str(e))
+            logger.warning(
+                "Batch classification failed (%s); falling back to concurrent "
+                "individual classification",
+                str(e),
+            )
             context.recovery_events.append(
                 RecoveryEvent(
-                    severity=RecoverySeverity.ERROR,
+                    severity=RecoverySeverity.WARNING,
                     stage="ai_classification",
-                    message=f"Batch classification failed: {str(e)}",
+                    message=(
+                        f"Batch classification failed, falling back to "
+                        f"individual classification calls: {str(e)}"
+                    ),
                     metadata={"error_type": "AIProviderError"},
                 )
             )
+            self._classify_individually(context)
 
-        logger.info("Stage 6: AI classification complete")
+        logger.debug("Stage 6: AI classification complete")
         return context
 
-    def _parse_headers(self, headers_list: list[dict[str, Any]]) -> list[ClassifiedHeaderField]:
+    def _classify_individually(self, context: PipelineContext) -> None:
         """
-        Parse headers list from batch response.
-
-        Args:
-            headers_list: List of header field dicts from AI response
-
-        Returns:
-            List of ClassifiedHeaderField instances
-        """
-        classified = []
-        for i, header_dict in enumerate(headers_list):
-            try:
-                field = _parse_header_field(header_dict, i)
-                classified.append(field)
-            except (KeyError, TypeError, ValueError) as e:
-                logger.warning("Failed to parse header field at index %d: %s", i, str(e))
-                # Continue processing remaining items
-        return classified
+        Run the three classification tasks as concurrent individual calls.
 
-    def _parse_columns(self, columns_list: list[dict[str, Any]]) -> list[ClassifiedTableColumn]:
-        """
-        Parse columns list from batch response.
+        Fallback path for batch failure. The three calls are independent
+        network-bound requests against the same provider and payload, so
+        they are submitted together to a thread pool and total latency is
+        the slowest round-trip rather than the sum of three. Each result is
+        collected under its own error handler: one task failing records a
+        RecoveryEvent and leaves that result empty without affecting the
+        other two.
 
         Args:
-            columns_list: List of column dicts from AI response
-
-        Returns:
-            List of ClassifiedTableColumn instances
+            context: Pipeline context with ai_provider and ai_payload set
         """
-        classified = []
-        for i, column_dict in enumerate(columns_list):
-            try:
-                column = _parse_table_column(column_dict, i)
-                classified.append(column)
-            except (KeyError, TypeError, ValueError) as e:
-                logger.warning("Failed to parse table column at index %d: %s", i, str(e))
-                # Continue processing remaining items
-        return classified
-
-    def _parse_line_items(self, line_items_list: list[dict[str, Any]]) -> list[ExtractedLineItem]:
+        task_functions = {
+            "headers": classify_header_fields,
+            "columns": classify_table_columns,
+            "line_items": extract_line_items,
+        }
+
+        with ThreadPoolExecutor(max_workers=len(task_functions)) as executor:
+            futures = {
+                name: executor.submit(task, context.ai_provider, context.ai_payload)
+                for name, task in task_functions.items()
+            }
+
+            results: dict[str, list[Any]] = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                    logger.info(
+                        "Individual %s classification returned %d item(s)", name, len(results[name])
+                    )
+                except AIProviderError as e:
+                    logger.error("Individual %s classification failed: %s", name, str(e))
+                    context.recovery_events.append(
+                        RecoveryEvent(
+                            severity=RecoverySeverity.ERROR,
+                            stage="ai_classification",
+                            message=f"Individual {name} classification failed: {str(e)}",
+                            metadata={"error_type": "AIProviderError"},
+                        )
+                    )
+                    results[name] = []
+
+        context.classified_headers = results["headers"]
+        context.classified_columns = results["columns"]
+        context.extracted_line_items = results["line_items"]
+
+    # Per-context (item parser, log noun) pairs driving _parse_batch_list;
+    # keys match the context names sent to classify_all_fields
+    _BATCH_PARSERS = {
+        "headers": (_parse_header_field, "header field"),
+        "columns": (_parse_table_column, "table column"),
+        "line_items": (_parse_line_item, "line item"),
+    }
+
+    def _parse_batch_list(
+        self, batch_results: dict[str, Any], context_name: str
+    ) -> list[ClassifiedHeaderField] | list[ClassifiedTableColumn] | list[ExtractedLineItem]:
         """
-        Parse line items list from batch response.
+        Parse one context's result list from the batch response.
+
+        Replaces three near-identical parse loops with a single data-driven
+        one: the parser and log wording come from _BATCH_PARSERS. Items that
+        fail to parse are logged and skipped so the rest of the list survives.
 
         Args:
-            line_items_list: List of line item dicts from AI response
+            batch_results: Batch response dict keyed by context name
+            context_name: One of "headers", "columns", or "line_items"
 
         Returns:
-            List of ExtractedLineItem instances
+            List of parsed dataclass instances for that context
         """
-        extracted = []
-        for i, item_dict in enumerate(line_items_list):
+        parser, noun = self._BATCH_PARSERS[context_name]
+        parsed = []
+        for i, item_dict in enumerate(batch_results.get(context_name, [])):
             try:
-                item = _parse_line_item(item_dict, i)
-                extracted.append(item)
+                parsed.append(parser(item_dict, i))
             except (KeyError, TypeError, ValueError) as e:
-                logger.warning("Failed to parse line item at index %d: %s", i, str(e))
+                logger.warning("Failed to parse %s at index %d: %s", noun, i, str(e))
                 # Continue processing remaining items
-        return extracted
+        return parsed
 
 
 __all__ = ["AIClassificationStage"]
@@ -27,7 +27,7 @@ class AIPayloadBuildingStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute AI payload building stage."""
-        logger.info("Stage 5: Building AI payload")
+        logger.debug("Stage 5: Building AI payload")
 
         if context.sheet_summary is None or context.grid is None:
             raise ExtractionError(
@@ -50,14 +50,12 @@ class AIPayloadBuildingStage(PipelineStage):
             logger.info("AI payload built successfully")
         except Exception as e:
             logger.error("Failed to build AI payload: %s", str(e))
-            if context.workbook:
-                context.workbook.close()
             raise ExtractionError(
                 extraction_type="ai_payload",
                 reason=f"Failed to build AI payload: {str(e)}",
             ) from e
 
-        logger.info("Stage 5: AI payload building complete")
+        logger.debug("Stage 5: AI payload building complete")
         return context
 
 
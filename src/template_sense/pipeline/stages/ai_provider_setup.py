@@ -27,7 +27,7 @@ class AIProviderSetupStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute AI provider setup stage."""
-        logger.info("Stage 4: Initializing AI provider")
+        logger.debug("Stage 4: Initializing AI provider")
 
         try:
             context.ai_provider = get_ai_provider(context.ai_config)
@@ -38,11 +38,9 @@ class AIProviderSetupStage(PipelineStage):
             )
         except AIProviderError:
             logger.error("AI provider initialization failed")
-            if context.workbook:
-                context.workbook.close()
             raise
 
-        logger.info("Stage 4: AI provider setup complete")
+        logger.debug("Stage 4: AI provider setup complete")
         return context
 
 
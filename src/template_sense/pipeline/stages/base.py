@@ -47,6 +47,9 @@ class PipelineContext:
         start_time: Pipeline start time for timing calculations
         workbook: Loaded Excel workbook (set by FileLoadingStage)
         sheet_name: Name of selected sheet (set by FileLoadingStage)
+        grid_cache_key: Disk-cache key for this file's content, set by
+                       FileLoadingStage on a cache miss so GridExtractionStage
+                       can store its outputs
         grid: Raw grid data from sheet (set by GridExtractionStage)
         sheet_summary: Heuristic detection results (set by GridExtractionStage)
         ai_provider: Initialized AI provider (set by AIProviderSetupStage)
@@ -78,6 +81,7 @@ class PipelineContext:
     # Stage outputs (populated progressively)
     workbook: ExcelWorkbook | None = None
     sheet_name: str | None = None
+    grid_cache_key: str | None = None
     grid: list[list[Any]] | None = None
     sheet_summary: dict[str, Any] | None = None
     ai_provider: AIProvider | None = None
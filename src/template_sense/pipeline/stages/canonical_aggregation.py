@@ -84,7 +84,7 @@ class CanonicalAggregationStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute canonical aggregation stage."""
-        logger.info("Stage 10: Building canonical template")
+        logger.debug("Stage 10: Building canonical template")
 
         if context.sheet_name is None:
             raise ExtractionError(
@@ -125,14 +125,12 @@ class CanonicalAggregationStage(PipelineStage):
 
         except Exception as e:
             logger.error("Canonical aggregation failed: %s", str(e))
-            if context.workbook:
-                context.workbook.close()
             raise ExtractionError(
                 extraction_type="canonical_aggregation",
                 reason=f"Failed to build canonical template: {str(e)}",
             ) from e
 
-        logger.info("Stage 10: Canonical aggregation complete")
+        logger.debug("Stage 10: Canonical aggregation complete")
         return context
 
 
@@ -28,7 +28,7 @@ class ConfidenceFilteringStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute confidence filtering stage."""
-        logger.info("Stage 9: Filtering by confidence thresholds")
+        logger.debug("Stage 9: Filtering by confidence thresholds")
 
         # Filter headers by AI confidence
         _, header_ai_events = filter_by_ai_confidence(
@@ -62,7 +62,7 @@ class ConfidenceFilteringStage(PipelineStage):
         context.recovery_events.extend(column_fuzzy_events)
         logger.info("Generated %d fuzzy match warnings for columns", len(column_fuzzy_events))
 
-        logger.info("Stage 9: Confidence filtering complete")
+        logger.debug("Stage 9: Confidence filtering complete")
         return context
 
 
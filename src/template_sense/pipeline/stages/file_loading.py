@@ -9,6 +9,11 @@ import logging
 
 from template_sense.adapters.excel_adapter import ExcelWorkbook
 from template_sense.errors import ExtractionError, FileValidationError
+from template_sense.extraction.grid_cache import (
+    compute_grid_cache_key,
+    grid_cache_enabled,
+    load_cached_extraction,
+)
 from template_sense.file_loader import load_excel_file
 from template_sense.pipeline.stages.base import PipelineContext, PipelineStage
 
@@ -22,6 +27,12 @@ class FileLoadingStage(PipelineStage):
     Loads the workbook and selects the first visible sheet for processing.
     Sets context.workbook and context.sheet_name.
 
+    When the grid disk cache is enabled and holds an entry for this file's
+    content hash, the cached sheet name, grid, and sheet summary are restored
+    instead and the workbook parse is skipped entirely (GridExtractionStage
+    then has nothing left to do). On a miss, the computed key is kept on the
+    context so GridExtractionStage can populate the cache.
+
     Raises:
         FileValidationError: If file cannot be loaded
         ExtractionError: If no visible sheets are found
@@ -29,7 +40,18 @@ class FileLoadingStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute file loading stage."""
-        logger.info("Stage 2: Loading Excel file")
+        logger.debug("Stage 2: Loading Excel file")
+
+        # Check the content-addressed disk cache before paying for a parse
+        if grid_cache_enabled():
+            key = compute_grid_cache_key(context.file_path)
+            if key is not None:
+                cached = load_cached_extraction(key)
+                if cached is not None:
+                    context.sheet_name, context.grid, context.sheet_summary = cached
+                    logger.debug("Stage 2: File loading complete (grid cache hit)")
+                    return context
+                context.grid_cache_key = key
 
         # Load workbook
         try:
@@ -51,10 +73,9 @@ class FileLoadingStage(PipelineStage):
             context.sheet_name = self._select_sheet(context.workbook)
         except ExtractionError:
             logger.error("No visible sheets found")
-            context.workbook.close()
             raise
 
-        logger.info("Stage 2: File loading complete")
+        logger.debug("Stage 2: File loading complete")
         return context
 
     def _select_sheet(self, workbook: ExcelWorkbook) -> str:
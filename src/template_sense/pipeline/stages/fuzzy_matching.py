@@ -6,6 +6,8 @@ field dictionary using fuzzy matching algorithms.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 
 from template_sense.ai.translation import TranslatedLabel
 from template_sense.constants import DEFAULT_AUTO_MAPPING_THRESHOLD, DEFAULT_TARGET_LANGUAGE
@@ -33,19 +35,25 @@ def get_translated_labels(
         List of TranslatedLabel objects with fallback for missing translations
     """
     result = []
+    # Untranslated labels repeat across fields (e.g., "Amount" in many rows),
+    # so misses share one identity fallback per distinct label instead of
+    # allocating a TranslatedLabel per field
+    fallbacks: dict[str, TranslatedLabel] = {}
     for item in items:
         label = getattr(item, label_attr)
         if not label:
             continue
 
-        translated = translation_map.get(
-            label,
-            TranslatedLabel(
-                original_text=label,
-                translated_text=label,
-                target_language=DEFAULT_TARGET_LANGUAGE,
-            ),
-        )
+        translated = translation_map.get(label)
+        if translated is None:
+            translated = fallbacks.get(label)
+            if translated is None:
+                translated = TranslatedLabel(
+                    original_text=label,
+                    translated_text=label,
+                    target_language=DEFAULT_TARGET_LANGUAGE,
+                )
+                fallbacks[label] = translated
         result.append(translated)
     return result
 
@@ -57,76 +65,115 @@ class FuzzyMatchingStage(PipelineStage):
     Performs fuzzy matching of translated labels against the canonical field
     dictionary. Sets context.header_match_results and context.column_match_results.
 
-    Uses error recovery if matching fails.
+    Header and column matching operate on disjoint label sets against
+    independent dictionaries, so when both sides have labels the two
+    match_fields calls run concurrently: RapidFuzz's C scorer releases the
+    GIL and any semantic-matching AI calls are network-bound, so threads
+    overlap both kinds of work. Uses error recovery if matching fails.
     """
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute fuzzy matching stage."""
-        logger.info("Stage 8: Performing fuzzy matching")
+        logger.debug("Stage 8: Performing fuzzy matching")
 
         if context.ai_provider is None:
             logger.warning("AI provider not set, skipping fuzzy matching")
             return context
 
-        # Match header fields
-        header_translated_labels = get_translated_labels(
-            items=context.classified_headers, translation_map=context.translation_map
-        )
-
-        if header_translated_labels:
-            try:
-                context.header_match_results = match_fields(
-                    translated_labels=header_translated_labels,
-                    field_dictionary=context.header_field_dictionary,
-                    threshold=DEFAULT_AUTO_MAPPING_THRESHOLD,
-                    ai_provider=context.ai_provider,  # Pass AI provider for semantic matching
-                )
-                logger.info(
-                    "Matched %d header fields (threshold=%.1f)",
-                    len(context.header_match_results),
-                    DEFAULT_AUTO_MAPPING_THRESHOLD,
-                )
-            except Exception as e:
-                logger.error("Header fuzzy matching failed: %s", str(e))
-                context.recovery_events.append(
-                    RecoveryEvent(
-                        severity=RecoverySeverity.ERROR,
-                        stage="fuzzy_matching",
-                        message=f"Header fuzzy matching failed: {str(e)}",
-                        metadata={"error_type": type(e).__name__},
+        # ("Header"/"Column", labels, dictionary, context attribute) per task.
+        # Label lists are only built when classification produced items, so the
+        # common failure-recovery path (classification bailed to []) skips
+        # straight past matching without allocating anything.
+        tasks = []
+
+        if context.classified_headers:
+            header_translated_labels = get_translated_labels(
+                items=context.classified_headers, translation_map=context.translation_map
+            )
+            if header_translated_labels:
+                tasks.append(
+                    (
+                        "Header",
+                        header_translated_labels,
+                        context.header_field_dictionary,
+                        "header_match_results",
                     )
                 )
 
-        # Match column fields
-        column_translated_labels = get_translated_labels(
-            items=context.classified_columns, translation_map=context.translation_map
-        )
-
-        if column_translated_labels:
-            try:
-                context.column_match_results = match_fields(
-                    translated_labels=column_translated_labels,
-                    field_dictionary=context.column_field_dictionary,
-                    threshold=DEFAULT_AUTO_MAPPING_THRESHOLD,
-                    ai_provider=context.ai_provider,  # Pass AI provider for semantic matching
-                )
-                logger.info(
-                    "Matched %d column fields (threshold=%.1f)",
-                    len(context.column_match_results),
-                    DEFAULT_AUTO_MAPPING_THRESHOLD,
-                )
-            except Exception as e:
-                logger.error("Column fuzzy matching failed: %s", str(e))
-                context.recovery_events.append(
-                    RecoveryEvent(
-                        severity=RecoverySeverity.ERROR,
-                        stage="fuzzy_matching",
-                        message=f"Column fuzzy matching failed: {str(e)}",
-                        metadata={"error_type": type(e).__name__},
+        if context.classified_columns:
+            column_translated_labels = get_translated_labels(
+                items=context.classified_columns, translation_map=context.translation_map
+            )
+            if column_translated_labels:
+                tasks.append(
+                    (
+                        "Column",
+                        column_translated_labels,
+                        context.column_field_dictionary,
+                        "column_match_results",
                     )
                 )
 
-        logger.info("Stage 8: Fuzzy matching complete")
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    (
+                        name,
+                        labels,
+                        result_attr,
+                        executor.submit(
+                            match_fields,
+                            # Matching scores translated_text, so labels that
+                            # share it (repeated fields, or distinct source
+                            # labels translating to the same English) only need
+                            # one fuzzy match each; results are expanded back
+                            # to the per-field list afterwards
+                            translated_labels=list(
+                                {label.translated_text: label for label in labels}.values()
+                            ),
+                            field_dictionary=field_dictionary,
+                            threshold=DEFAULT_AUTO_MAPPING_THRESHOLD,
+                            # Pass AI provider for semantic matching
+                            ai_provider=context.ai_provider,
+                        ),
+                    )
+                    for name, labels, field_dictionary, result_attr in tasks
+                ]
+
+                for name, labels, result_attr, future in futures:
+                    try:
+                        unique_results = future.result()
+                        result_by_text = {
+                            result.translated_text: result for result in unique_results
+                        }
+                        match_results = []
+                        for label in labels:
+                            result = result_by_text[label.translated_text]
+                            if result.original_text != label.original_text:
+                                # The representative label's result is shared;
+                                # restore this field's own source text
+                                result = replace(result, original_text=label.original_text)
+                            match_results.append(result)
+                        setattr(context, result_attr, match_results)
+                        logger.info(
+                            "Matched %d %s fields (%d unique, threshold=%.1f)",
+                            len(match_results),
+                            name.lower(),
+                            len(unique_results),
+                            DEFAULT_AUTO_MAPPING_THRESHOLD,
+                        )
+                    except Exception as e:
+                        logger.error("%s fuzzy matching failed: %s", name, str(e))
+                        context.recovery_events.append(
+                            RecoveryEvent(
+                                severity=RecoverySeverity.ERROR,
+                                stage="fuzzy_matching",
+                                message=f"{name} fuzzy matching failed: {str(e)}",
+                                metadata={"error_type": type(e).__name__},
+                            )
+                        )
+
+        logger.debug("Stage 8: Fuzzy matching complete")
         return context
 
 
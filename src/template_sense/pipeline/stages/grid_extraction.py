@@ -8,6 +8,7 @@ detection of headers and tables.
 import logging
 
 from template_sense.errors import ExtractionError
+from template_sense.extraction.grid_cache import store_cached_extraction
 from template_sense.extraction.sheet_extractor import extract_raw_grid
 from template_sense.extraction.summary_builder import build_sheet_summary
 from template_sense.pipeline.stages.base import PipelineContext, PipelineStage
@@ -22,13 +23,22 @@ class GridExtractionStage(PipelineStage):
     Extracts raw grid data from the sheet and performs heuristic detection
     of header blocks and table blocks. Sets context.grid and context.sheet_summary.
 
+    Skipped entirely when FileLoadingStage restored these from the grid disk
+    cache; on a cache miss it stores its outputs under the key computed there.
+
     Raises:
         ExtractionError: If grid extraction fails
     """
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute grid extraction stage."""
-        logger.info("Stage 3: Extracting grid from sheet '%s'", context.sheet_name)
+        # A grid cache hit in FileLoadingStage already restored the grid and
+        # sheet summary without parsing the workbook
+        if context.grid is not None and context.sheet_summary is not None:
+            logger.debug("Stage 3: Grid extraction complete (restored from grid cache)")
+            return context
+
+        logger.debug("Stage 3: Extracting grid from sheet '%s'", context.sheet_name)
 
         if context.workbook is None or context.sheet_name is None:
             raise ExtractionError(
@@ -37,25 +47,36 @@ class GridExtractionStage(PipelineStage):
             )
 
         try:
-            # Build sheet summary (includes heuristic detection)
-            context.sheet_summary = build_sheet_summary(context.workbook, context.sheet_name)
+            # Extract the raw grid once; it feeds both the sheet summary and
+            # the adjacent cell context for AI payload building (BAT-53)
+            context.grid = extract_raw_grid(context.workbook, context.sheet_name)
+            logger.debug("Extracted grid (%d rows)", len(context.grid))
+
+            # Build sheet summary (includes heuristic detection), reusing the
+            # grid extracted above instead of traversing the workbook again
+            context.sheet_summary = build_sheet_summary(
+                context.workbook, context.sheet_name, grid=context.grid
+            )
             logger.info(
                 "Sheet summary built: %d header blocks, %d table blocks",
                 len(context.sheet_summary.get("header_blocks", [])),
                 len(context.sheet_summary.get("table_blocks", [])),
             )
 
-            # Extract raw grid for adjacent cell context (BAT-53)
-            context.grid = extract_raw_grid(context.workbook, context.sheet_name)
-            logger.debug("Extracted grid for adjacent cell context (%d rows)", len(context.grid))
-
         except ExtractionError:
             logger.error("Grid extraction failed")
-            if context.workbook:
-                context.workbook.close()
             raise
 
-        logger.info("Stage 3: Grid extraction complete")
+        # Populate the disk cache so unchanged files skip the parse next run
+        if context.grid_cache_key is not None:
+            store_cached_extraction(
+                context.grid_cache_key,
+                context.sheet_name,
+                context.grid,
+                context.sheet_summary,
+            )
+
+        logger.debug("Stage 3: Grid extraction complete")
         return context
 
 
@@ -1,5 +1,5 @@
 """
-MetadataStage: Builds pipeline metadata and closes workbook.
+MetadataStage: Builds pipeline metadata.
 
 This stage calculates timing, builds metadata, closes the workbook, and
 prepares the final context for return.
@@ -19,12 +19,12 @@ class MetadataStage(PipelineStage):
     Stage 12: Metadata building.
 
     Calculates pipeline timing, builds metadata dictionary, and closes the workbook.
-    Sets context.metadata and closes context.workbook.
+    Sets context.metadata; the pipeline runner closes the workbook.
     """
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute metadata building stage."""
-        logger.info("Stage 12: Building metadata and preparing final output")
+        logger.debug("Stage 12: Building metadata and preparing final output")
 
         # Calculate timing
         end_time = time.perf_counter()
@@ -55,15 +55,10 @@ class MetadataStage(PipelineStage):
                 timing_ms,
             )
 
-        # Close workbook
-        if context.workbook:
-            context.workbook.close()
-            logger.debug("Workbook closed")
-
         logger.info("=== Pipeline completed successfully ===")
         logger.info("Total time: %d ms", timing_ms)
         logger.info("Recovery events: %d", len(context.recovery_events))
-        logger.info("Stage 12: Metadata building complete")
+        logger.debug("Stage 12: Metadata building complete")
 
         return context
 
@@ -27,7 +27,7 @@ class NormalizedOutputStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute normalized output building stage."""
-        logger.info("Stage 11: Building normalized output")
+        logger.debug("Stage 11: Building normalized output")
 
         if context.canonical_template is None:
             raise ExtractionError(
@@ -40,14 +40,12 @@ class NormalizedOutputStage(PipelineStage):
             logger.info("Normalized output built successfully")
         except Exception as e:
             logger.error("Normalized output building failed: %s", str(e))
-            if context.workbook:
-                context.workbook.close()
             raise ExtractionError(
                 extraction_type="normalized_output",
                 reason=f"Failed to build normalized output: {str(e)}",
             ) from e
 
-        logger.info("Stage 11: Normalized output building complete")
+        logger.debug("Stage 11: Normalized output building complete")
         return context
 
 
@@ -6,6 +6,7 @@ them to the target language (English by default), and builds a translation map.
 """
 
 import logging
+from itertools import chain
 
 from template_sense.ai.translation import TranslatedLabel, translate_labels
 from template_sense.constants import DEFAULT_TARGET_LANGUAGE
@@ -28,27 +29,44 @@ class TranslationStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute translation stage."""
-        logger.info("Stage 7: Translating labels")
+        logger.debug("Stage 7: Translating labels")
 
         if context.ai_provider is None:
             logger.warning("AI provider not set, skipping translation")
             return context
 
-        # Collect all labels from headers and columns
-        all_labels: list[str] = []
-
-        for header in context.classified_headers:
-            if header.raw_label:
-                all_labels.append(header.raw_label)
-
-        for column in context.classified_columns:
-            if column.raw_label:
-                all_labels.append(column.raw_label)
-
-        # Deduplicate labels
-        unique_labels = list(set(all_labels))
+        # Collect and deduplicate labels from headers and columns in one pass,
+        # preserving first-seen order so the provider request payload (and the
+        # shared translation cache it feeds) stays deterministic across runs
+        unique_labels = list(
+            dict.fromkeys(
+                item.raw_label
+                for item in chain(context.classified_headers, context.classified_columns)
+                if item.raw_label
+            )
+        )
         logger.info("Collected %d unique labels for translation", len(unique_labels))
 
+        # Fast path: pure-ASCII labels are already in the target language when
+        # targeting English (templates mix English headers into Japanese
+        # sheets), so they map to identity translations without a provider
+        # round-trip; only the non-ASCII remainder is sent for translation
+        if DEFAULT_TARGET_LANGUAGE == "en":
+            ascii_labels = [label for label in unique_labels if label.isascii()]
+            if ascii_labels:
+                for label in ascii_labels:
+                    context.translation_map[label] = TranslatedLabel(
+                        original_text=label,
+                        translated_text=label,
+                        target_language=DEFAULT_TARGET_LANGUAGE,
+                    )
+                unique_labels = [label for label in unique_labels if not label.isascii()]
+                logger.info(
+                    "Skipped translation for %d ASCII label(s); %d non-ASCII remaining",
+                    len(ascii_labels),
+                    len(unique_labels),
+                )
+
         # Translate if there are labels
         if unique_labels:
             try:
@@ -86,7 +104,7 @@ class TranslationStage(PipelineStage):
 
                 logger.info("Using fallback translations (original text)")
 
-        logger.info("Stage 7: Translation complete")
+        logger.debug("Stage 7: Translation complete")
         return context
 
 
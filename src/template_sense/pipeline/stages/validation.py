@@ -30,7 +30,7 @@ class ValidationStage(PipelineStage):
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Execute validation stage."""
-        logger.info("Stage 1: Validating inputs...")
+        logger.debug("Stage 1: Validating inputs...")
 
         # Validate file path
         self._validate_file_path(context.file_path)
@@ -48,7 +48,7 @@ class ValidationStage(PipelineStage):
             len(header_dict),
             len(column_dict),
         )
-        logger.info("Stage 1: Validation complete")
+        logger.debug("Stage 1: Validation complete")
 
         return context
 
@@ -111,58 +111,69 @@ class ValidationStage(PipelineStage):
                 field_dictionary=field_dictionary,
             )
 
-        # 3. Validate headers section
-        headers = field_dictionary["headers"]
-        if not isinstance(headers, dict):
-            raise InvalidFieldDictionaryError(
-                reason="'headers' must be a dict[str, str]",
-                field_dictionary=field_dictionary,
-            )
+        # 3. Validate each section and transform to internal format in one pass
+        header_dict = self._validate_section(
+            field_dictionary["headers"], "Header", "headers", field_dictionary
+        )
+        column_dict = self._validate_section(
+            field_dictionary["columns"], "Column", "columns", field_dictionary
+        )
 
-        for key, value in headers.items():
-            if not isinstance(key, str):
-                raise InvalidFieldDictionaryError(
-                    reason=f"Header key must be string, got {type(key).__name__}",
-                    field_dictionary=field_dictionary,
-                )
-            if not isinstance(value, str):
-                raise InvalidFieldDictionaryError(
-                    reason=f"Header value for '{key}' must be string, got {type(value).__name__}",
-                    field_dictionary=field_dictionary,
-                )
+        logger.debug(
+            "Field dictionary validated: %d headers, %d columns (empty sections allowed)",
+            len(header_dict),
+            len(column_dict),
+        )
+
+        return header_dict, column_dict
+
+    def _validate_section(
+        self,
+        section: dict[str, str],
+        noun: str,
+        section_key: str,
+        field_dictionary: dict[str, dict[str, str]],
+    ) -> dict[str, list[str]]:
+        """
+        Validate one dictionary section and transform it to internal format.
 
-        # 4. Validate columns section
-        columns = field_dictionary["columns"]
-        if not isinstance(columns, dict):
+        Fuses type checking and the list-wrapping transform into a single pass
+        per entry (one combined isinstance check in the common valid case),
+        shared by the headers and columns sections.
+
+        Args:
+            section: The section value to validate (expected dict[str, str])
+            noun: Capitalized entry noun for error messages ("Header"/"Column")
+            section_key: Section key for error messages ("headers"/"columns")
+            field_dictionary: Full input dict, attached to raised errors
+
+        Returns:
+            Section in internal dict[str, list[str]] format, values wrapped in
+            lists for compatibility with fuzzy matching
+
+        Raises:
+            InvalidFieldDictionaryError: If the section is malformed
+        """
+        if not isinstance(section, dict):
             raise InvalidFieldDictionaryError(
-                reason="'columns' must be a dict[str, str]",
+                reason=f"'{section_key}' must be a dict[str, str]",
                 field_dictionary=field_dictionary,
             )
 
-        for key, value in columns.items():
-            if not isinstance(key, str):
-                raise InvalidFieldDictionaryError(
-                    reason=f"Column key must be string, got {type(key).__name__}",
-                    field_dictionary=field_dictionary,
-                )
-            if not isinstance(value, str):
+        transformed: dict[str, list[str]] = {}
+        for key, value in section.items():
+            if not (isinstance(key, str) and isinstance(value, str)):
+                if not isinstance(key, str):
+                    raise InvalidFieldDictionaryError(
+                        reason=f"{noun} key must be string, got {type(key).__name__}",
+                        field_dictionary=field_dictionary,
+                    )
                 raise InvalidFieldDictionaryError(
-                    reason=f"Column value for '{key}' must be string, got {type(value).__name__}",
+                    reason=(f"{noun} value for '{key}' must be string, got {type(value).__name__}"),
                     field_dictionary=field_dictionary,
                 )
-
-        # 5. Transform to internal format: dict[str, list[str]]
-        # Wrap single string values in lists for compatibility with fuzzy matching
-        header_dict = {k: [v] for k, v in headers.items()}
-        column_dict = {k: [v] for k, v in columns.items()}
-
-        logger.debug(
-            "Field dictionary validated: %d headers, %d columns (empty sections allowed)",
-            len(header_dict),
-            len(column_dict),
-        )
-
-        return header_dict, column_dict
+            transformed[key] = [value]
+        return transformed
 
 
 __all__ = ["ValidationStage"]
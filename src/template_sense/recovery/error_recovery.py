@@ -265,31 +265,25 @@ def aggregate_recovery_events(events: list[RecoveryEvent]) -> dict[str, Any]:
             "events": [event.to_dict(), ...]
         }
     """
-    # Filter to only WARNING and ERROR events (exclude INFO to reduce noise)
-    critical_events = [
-        event
-        for event in events
-        if event.severity in (RecoverySeverity.WARNING, RecoverySeverity.ERROR)
-    ]
-
-    # Initialize counters
+    # Single pass: filter to WARNING/ERROR events (INFO is excluded to reduce
+    # noise), count by severity and stage, and serialize, without building an
+    # intermediate critical-events list
     by_severity = {"warning": 0, "error": 0}
     by_stage: dict[str, int] = {}
+    event_dicts: list[dict[str, Any]] = []
 
-    # Count events by severity and stage
-    for event in critical_events:
-        # Count by severity
-        severity_key = event.severity.value
-        by_severity[severity_key] += 1
+    for event in events:
+        if event.severity not in (RecoverySeverity.WARNING, RecoverySeverity.ERROR):
+            continue
 
-        # Count by stage
-        stage_key = event.stage
-        by_stage[stage_key] = by_stage.get(stage_key, 0) + 1
+        by_severity[event.severity.value] += 1
+        by_stage[event.stage] = by_stage.get(event.stage, 0) + 1
+        event_dicts.append(event.to_dict())
 
     # Build summary
     return {
-        "total_events": len(critical_events),
+        "total_events": len(event_dicts),
         "by_severity": by_severity,
         "by_stage": by_stage,
-        "events": [event.to_dict() for event in critical_events],
+        "events": event_dicts,
     }
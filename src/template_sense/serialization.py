@@ -11,6 +11,11 @@ import datetime
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
 
 def _serialize_value(value: Any) -> Any:
     """Convert a single value to JSON-serializable form.
@@ -88,6 +93,50 @@ def serialize_to_json(obj: Any, indent: int | None = None) -> str:
         >>> payload = {"date": datetime.date(2024, 5, 8)}
         >>> serialize_to_json(payload, indent=2)
         '{\\n  "date": "2024-05-08"\\n}'
+
+    Notes:
+        - Uses orjson (C-extension serializer) when available, which is
+          significantly faster than stdlib json on large nested payloads
+          and emits compact UTF-8 output by default
+        - Falls back to stdlib json when orjson is not installed or when
+          an unsupported indent level is requested (orjson only supports
+          2-space indentation)
     """
     serializable_obj = make_json_serializable(obj)
-    return json.dumps(serializable_obj, indent=indent)
+
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(serializable_obj, option=option).decode()
+
+    # ensure_ascii=False keeps CJK text as raw UTF-8 instead of \uXXXX
+    # escapes, which would roughly triple the character (and token) count of
+    # Japanese labels; it also matches orjson's output
+    return json.dumps(serializable_obj, indent=indent, ensure_ascii=False)
+
+
+def deserialize_from_json(text: str) -> Any:
+    """Parse a JSON string into Python objects.
+
+    Counterpart to serialize_to_json() used for AI responses, which can run
+    to thousands of line items.
+
+    Args:
+        text: JSON string to parse
+
+    Returns:
+        Parsed Python object (dict, list, or scalar)
+
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON (orjson's
+            decode error subclasses json.JSONDecodeError, so callers can
+            catch the stdlib type either way)
+
+    Notes:
+        - Uses orjson when available, which parses large responses several
+          times faster than stdlib json
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -151,14 +151,19 @@ class TestEndToEndExtraction:
         # Track API calls
         classify_all_fields_count = 0
         classify_fields_count = 0
+        batch_call_failed = False
 
         def count_classify_all_fields(original_method):
             """Wrapper to count classify_all_fields calls."""
 
             def wrapper(*args, **kwargs):
-                nonlocal classify_all_fields_count
+                nonlocal classify_all_fields_count, batch_call_failed
                 classify_all_fields_count += 1
-                return original_method(*args, **kwargs)
+                try:
+                    return original_method(*args, **kwargs)
+                except Exception:
+                    batch_call_failed = True
+                    raise
 
             return wrapper
 
@@ -227,10 +232,14 @@ class TestEndToEndExtraction:
         assert (
             classify_all_fields_count >= 1
         ), "Should call classify_all_fields at least once (batch classification)"
-        assert classify_fields_count == 0, (
-            f"Should NOT call classify_fields (individual), but called {classify_fields_count} times. "
-            "Batch optimization (BAT-74) may not be working correctly."
-        )
+        # Individual classify_fields calls are only legitimate as the pipeline's
+        # fallback after a failed batch call (chunk9-1).
+        if not batch_call_failed:
+            assert classify_fields_count == 0, (
+                f"Should NOT call classify_fields (individual), but called {classify_fields_count} "
+                "times without a batch failure. Batch optimization (BAT-74) may not be working "
+                "correctly."
+            )
 
         # Validate result is still valid
         assert result is not None
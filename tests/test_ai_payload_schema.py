@@ -275,6 +275,52 @@ def test_extract_sample_data_rows_small_table():
     assert total_rows == 2
 
 
+def test_extract_sample_data_rows_unsorted_content():
+    """Test that unsorted (non row-major) content still densifies correctly."""
+    content = [
+        [6, 2, 2],
+        [5, 1, "A"],
+        [6, 1, "B"],
+        [5, 2, 1],
+    ]
+
+    sample_rows, total_rows = _extract_sample_data_rows(
+        table_content=content,
+        header_row_index=None,
+        start_row=5,
+        end_row=6,
+        start_col=1,
+        end_col=2,
+        max_rows=5,
+    )
+
+    assert sample_rows == [["A", 1], ["B", 2]]
+    assert total_rows == 2
+
+
+def test_extract_sample_data_rows_clips_long_strings():
+    """Test that oversized string cells are truncated with an ellipsis."""
+    long_text = "x" * 500
+    content = [
+        [5, 1, long_text],
+        [5, 2, 12345],
+    ]
+
+    sample_rows, _ = _extract_sample_data_rows(
+        table_content=content,
+        header_row_index=None,
+        start_row=5,
+        end_row=5,
+        start_col=1,
+        end_col=2,
+        max_rows=5,
+        max_cell_chars=200,
+    )
+
+    assert sample_rows[0][0] == "x" * 200 + "..."
+    assert sample_rows[0][1] == 12345  # Non-strings pass through unchanged
+
+
 # ============================================================
 # Test build_ai_payload
 # ============================================================
@@ -308,7 +354,9 @@ def test_build_ai_payload_normal_case(
     assert table["start_row"] == 10
     assert table["end_row"] == 20
     assert table["total_data_rows"] == 10
-    assert len(table["sample_data_rows"]) == 5  # Default max_sample_rows
+    # Columnar layout keyed by header labels; each column holds max_sample_rows values
+    assert set(table["sample_data_rows"]) == {"Item", "Quantity", "Price", "Amount"}
+    assert all(len(column) == 5 for column in table["sample_data_rows"].values())
 
     # Check header row
     assert table["header_row"] is not None
@@ -494,7 +542,7 @@ def test_build_ai_payload_custom_max_sample_rows(table_block_with_header, tako_f
     payload = build_ai_payload(sheet_summary, tako_field_dictionary, max_sample_rows=3)
 
     table = payload["table_candidates"][0]
-    assert len(table["sample_data_rows"]) == 3  # Limited to 3
+    assert all(len(column) == 3 for column in table["sample_data_rows"].values())  # Limited to 3
     assert table["total_data_rows"] == 10  # But total is still 10
 
 
@@ -593,3 +641,34 @@ def test_ai_payload_dataclass(tako_field_dictionary):
     assert payload.header_candidates == []
     assert payload.table_candidates == []
     assert payload.field_dictionary == tako_field_dictionary
+
+
+def test_to_dict_matches_asdict(tako_field_dictionary):
+    """Test that the manual to_dict methods mirror dataclasses.asdict output."""
+    from dataclasses import asdict
+
+    table = AITableCandidate(
+        start_row=10,
+        end_row=20,
+        start_col=1,
+        end_col=2,
+        header_row=AITableHeaderInfo(
+            row_index=10,
+            cells=[AITableHeaderCell(col=1, value="Item", score=0.9)],
+            detected_pattern="first_row_text_dense",
+        ),
+        sample_data_rows=[["A", 1]],
+        total_data_rows=10,
+        score=0.78,
+        detected_pattern="high_numeric_density",
+    )
+    payload = AIPayload(
+        sheet_name="Test",
+        header_candidates=[
+            AIHeaderCandidate(row=1, col=1, label="Invoice", value="12345", score=0.85)
+        ],
+        table_candidates=[table],
+        field_dictionary=tako_field_dictionary,
+    )
+
+    assert payload.to_dict() == asdict(payload)
@@ -9,6 +9,8 @@ from template_sense.constants import (
     ANTHROPIC_API_KEY_ENV_VAR,
     DEFAULT_AI_TIMEOUT_SECONDS,
     OPENAI_API_KEY_ENV_VAR,
+    RPM_LIMIT_ENV_VAR,
+    TPM_LIMIT_ENV_VAR,
 )
 from template_sense.errors import AIProviderError
 
@@ -76,6 +78,21 @@ class TestAIConfig:
         assert error.provider_name == ""
         assert "Unsupported provider" in error.error_details
 
+    def test_config_is_immutable(self):
+        """Test that AIConfig fields cannot be reassigned after construction."""
+        config = AIConfig(provider="openai", api_key="sk-test")
+
+        with pytest.raises(AttributeError):
+            config.model = "gpt-4"
+
+    def test_config_is_hashable(self):
+        """Test that equal configs hash equally, enabling use as cache keys."""
+        config_a = AIConfig(provider="openai", api_key="sk-test", model="gpt-4")
+        config_b = AIConfig(provider="openai", api_key="sk-test", model="gpt-4")
+
+        assert hash(config_a) == hash(config_b)
+        assert config_a == config_b
+
 
 class TestLoadAIConfig:
     """Tests for the load_ai_config function."""
@@ -199,3 +216,38 @@ class TestLoadAIConfig:
         error = exc_info.value
         assert error.provider_name == "openai"
         assert OPENAI_API_KEY_ENV_VAR in error.error_details
+
+    def test_load_config_without_rate_limits(self, monkeypatch):
+        """Test that rate limits default to None when env vars are unset."""
+        monkeypatch.setenv(AI_PROVIDER_ENV_VAR, "openai")
+        monkeypatch.setenv(OPENAI_API_KEY_ENV_VAR, "sk-test-key")
+        monkeypatch.delenv(RPM_LIMIT_ENV_VAR, raising=False)
+        monkeypatch.delenv(TPM_LIMIT_ENV_VAR, raising=False)
+
+        config = load_ai_config()
+
+        assert config.requests_per_minute is None
+        assert config.tokens_per_minute is None
+
+    def test_load_config_with_rate_limits(self, monkeypatch):
+        """Test that rate-limit env vars are parsed as integers."""
+        monkeypatch.setenv(AI_PROVIDER_ENV_VAR, "openai")
+        monkeypatch.setenv(OPENAI_API_KEY_ENV_VAR, "sk-test-key")
+        monkeypatch.setenv(RPM_LIMIT_ENV_VAR, "500")
+        monkeypatch.setenv(TPM_LIMIT_ENV_VAR, "200000")
+
+        config = load_ai_config()
+
+        assert config.requests_per_minute == 500
+        assert config.tokens_per_minute == 200000
+
+    def test_load_config_rejects_invalid_rate_limit(self, monkeypatch):
+        """Test that a non-integer rate limit raises AIProviderError."""
+        monkeypatch.setenv(AI_PROVIDER_ENV_VAR, "openai")
+        monkeypatch.setenv(OPENAI_API_KEY_ENV_VAR, "sk-test-key")
+        monkeypatch.setenv(RPM_LIMIT_ENV_VAR, "lots")
+
+        with pytest.raises(AIProviderError) as exc_info:
+            load_ai_config()
+
+        assert RPM_LIMIT_ENV_VAR in exc_info.value.error_details
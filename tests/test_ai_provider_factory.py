@@ -1,7 +1,11 @@
 """Tests for AI provider factory function."""
 
+import subprocess
+import sys
+
 import pytest
 
+from template_sense.ai_providers import factory
 from template_sense.ai_providers.config import AIConfig
 from template_sense.ai_providers.factory import get_ai_provider
 from template_sense.constants import (
@@ -12,6 +16,14 @@ from template_sense.constants import (
 from template_sense.errors import AIProviderError
 
 
+@pytest.fixture(autouse=True)
+def clear_provider_cache():
+    """Clear memoized providers so each test constructs fresh (mocked) instances."""
+    factory.clear_provider_cache()
+    yield
+    factory.clear_provider_cache()
+
+
 class TestGetAIProvider:
     """Tests for the get_ai_provider factory function."""
 
@@ -119,7 +131,7 @@ class TestGetAIProvider:
         with patch("template_sense.ai_providers.openai_provider.OpenAI"):
             provider = get_ai_provider(config)
             assert provider.provider_name == "openai"
-            assert provider.model == "gpt-4o"  # Default model
+            assert provider.model == "gpt-4o-mini"  # Default model
 
     def test_factory_default_parameter_is_none(self):
         """Test that calling factory without args defaults to config=None."""
@@ -143,3 +155,80 @@ class TestGetAIProvider:
             # Cleanup
             os.environ.pop(AI_PROVIDER_ENV_VAR, None)
             os.environ.pop(OPENAI_API_KEY_ENV_VAR, None)
+
+
+class TestLazyProviderImports:
+    """Test that vendor SDKs load only when a provider is actually used."""
+
+    def test_package_import_does_not_load_sdks(self):
+        """Test that importing the package pulls in neither openai nor anthropic."""
+        script = (
+            "import sys; import template_sense.ai_providers; "
+            "assert 'anthropic' not in sys.modules, 'anthropic imported eagerly'; "
+            "assert 'openai' not in sys.modules, 'openai imported eagerly'"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=False)
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_provider_classes_resolve_lazily(self):
+        """Test that the re-exported provider classes still import on demand."""
+        from template_sense.ai_providers import AnthropicProvider, OpenAIProvider
+
+        assert AnthropicProvider.__name__ == "AnthropicProvider"
+        assert OpenAIProvider.__name__ == "OpenAIProvider"
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown package attributes raise AttributeError."""
+        import template_sense.ai_providers as ai_providers
+
+        with pytest.raises(AttributeError):
+            ai_providers.NotAProvider  # noqa: B018
+
+
+class TestProviderCaching:
+    """Test memoization of provider instances by config."""
+
+    def test_same_config_returns_cached_instance(self):
+        """Test that identical configs share one provider instance."""
+        from unittest.mock import patch
+
+        config = AIConfig(provider="openai", api_key="sk-test")
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            first = get_ai_provider(config)
+            second = get_ai_provider(config)
+
+        assert first is second
+
+    def test_different_config_builds_new_instance(self):
+        """Test that differing configs get distinct provider instances."""
+        from unittest.mock import patch
+
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            first = get_ai_provider(AIConfig(provider="openai", api_key="sk-test"))
+            second = get_ai_provider(AIConfig(provider="openai", api_key="sk-other"))
+
+        assert first is not second
+
+    def test_rate_limit_fields_distinguish_cache_entries(self):
+        """Test that configs differing only in rate limits get distinct instances."""
+        from unittest.mock import patch
+
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            first = get_ai_provider(AIConfig(provider="openai", api_key="sk-test"))
+            second = get_ai_provider(
+                AIConfig(provider="openai", api_key="sk-test", requests_per_minute=60)
+            )
+
+        assert first is not second
+
+    def test_clear_provider_cache_resets(self):
+        """Test that clearing the cache forces reconstruction."""
+        from unittest.mock import patch
+
+        config = AIConfig(provider="openai", api_key="sk-test")
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            first = get_ai_provider(config)
+            factory.clear_provider_cache()
+            second = get_ai_provider(config)
+
+        assert first is not second
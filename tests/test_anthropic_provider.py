@@ -8,16 +8,30 @@ This module tests the AnthropicProvider class, including:
 - Configuration handling
 """
 
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from template_sense.ai_providers import anthropic_provider, base_provider, response_cache
 from template_sense.ai_providers.anthropic_provider import AnthropicProvider
 from template_sense.ai_providers.config import AIConfig
 from template_sense.errors import AIProviderError
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Clear the module-level caches so tests get fresh mocked clients and no cached responses."""
+    anthropic_provider._client_cache.clear()
+    response_cache._response_cache.clear()
+    base_provider._translation_cache.clear()
+    yield
+    anthropic_provider._client_cache.clear()
+    response_cache._response_cache.clear()
+    base_provider._translation_cache.clear()
+
+
 class TestAnthropicProviderInitialization:
     """Test AnthropicProvider initialization and configuration."""
 
@@ -76,6 +90,35 @@ class TestAnthropicProviderInitialization:
             provider = AnthropicProvider(config)
             assert provider.model == "claude-3-sonnet-20240229"
 
+    def test_same_config_reuses_cached_client(self):
+        """Test providers with identical credentials share one client."""
+        config = AIConfig(provider="anthropic", api_key="sk-ant-test-key")
+
+        with (
+            patch("template_sense.ai_providers.anthropic_provider.Anthropic") as mock_client_cls,
+            patch("template_sense.ai_providers.anthropic_provider.AsyncAnthropic"),
+        ):
+            first = AnthropicProvider(config)
+            second = AnthropicProvider(config)
+
+        assert first.client is second.client
+        assert mock_client_cls.call_count == 1
+
+    def test_different_timeout_gets_distinct_client(self):
+        """Test providers with different timeouts do not share a client."""
+        with (
+            patch("template_sense.ai_providers.anthropic_provider.Anthropic") as mock_client_cls,
+            patch("template_sense.ai_providers.anthropic_provider.AsyncAnthropic"),
+        ):
+            AnthropicProvider(
+                AIConfig(provider="anthropic", api_key="sk-ant-test-key", timeout_seconds=30)
+            )
+            AnthropicProvider(
+                AIConfig(provider="anthropic", api_key="sk-ant-test-key", timeout_seconds=60)
+            )
+
+        assert mock_client_cls.call_count == 2
+
 
 class TestAnthropicProviderClassifyFields:
     """Test AnthropicProvider classify_fields method."""
@@ -206,6 +249,27 @@ class TestAnthropicProviderClassifyFields:
         assert "line_items" in result
         provider.client.messages.create.assert_called_once()
 
+    def test_classify_fields_uses_cached_system_block(self, provider, sample_payload):
+        """Test classification sends the system prompt as a cache_control block."""
+        mock_response = Mock()
+        mock_content_block = Mock()
+        mock_content_block.text = json.dumps({"headers": []})
+        mock_response.content = [mock_content_block]
+
+        provider.client.messages.create = Mock(return_value=mock_response)
+
+        provider.classify_fields(sample_payload, context="headers")
+
+        system_blocks = provider.client.messages.create.call_args.kwargs["system"]
+        assert isinstance(system_blocks, list)
+        # Invariant classification boilerplate first, context-specific body second,
+        # both marked cacheable so the shared prefix survives context switches
+        assert len(system_blocks) == 2
+        assert all(block["type"] == "text" for block in system_blocks)
+        assert all(block["cache_control"] == {"type": "ephemeral"} for block in system_blocks)
+        assert system_blocks[0]["text"] == anthropic_provider._CLASSIFY_SYSTEM_PREFIX
+        assert "field classification" in system_blocks[1]["text"]
+
     def test_classify_fields_invalid_context(self, provider, sample_payload):
         """Test field classification with invalid context raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -335,6 +399,358 @@ class TestAnthropicProviderClassifyFields:
         assert "Unexpected error" in error.error_details
 
 
+class TestAnthropicProviderRetry:
+    """Test retry-with-backoff behavior for transient API errors."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create AnthropicProvider instance with mocked clients."""
+        config = AIConfig(provider="anthropic", api_key="sk-ant-test-key")
+        with (
+            patch("template_sense.ai_providers.anthropic_provider.Anthropic"),
+            patch("template_sense.ai_providers.anthropic_provider.AsyncAnthropic"),
+        ):
+            return AnthropicProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    @staticmethod
+    def _transient_error() -> Exception:
+        """Build an exception that looks like a retryable API error."""
+        error = RuntimeError("Overloaded")
+        error.status_code = 529
+        return error
+
+    def test_transient_error_is_retried(self, provider, sample_payload):
+        """Test that a 529 is retried and the call eventually succeeds."""
+        mock_response = Mock()
+        mock_content_block = Mock()
+        mock_content_block.text = json.dumps({"headers": []})
+        mock_response.content = [mock_content_block]
+
+        provider.client.messages.create = Mock(
+            side_effect=[self._transient_error(), self._transient_error(), mock_response]
+        )
+
+        with patch("template_sense.ai_providers.anthropic_provider.time.sleep") as mock_sleep:
+            result = provider.classify_fields(sample_payload)
+
+        assert result == {"headers": []}
+        assert provider.client.messages.create.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_retry_after_header_overrides_backoff(self, provider, sample_payload):
+        """Test that a server-provided Retry-After delay is honored."""
+        error = self._transient_error()
+        error.response = Mock()
+        error.response.headers = {"retry-after": "7"}
+
+        mock_response = Mock()
+        mock_content_block = Mock()
+        mock_content_block.text = json.dumps({"headers": []})
+        mock_response.content = [mock_content_block]
+
+        provider.client.messages.create = Mock(side_effect=[error, mock_response])
+
+        with patch("template_sense.ai_providers.anthropic_provider.time.sleep") as mock_sleep:
+            provider.classify_fields(sample_payload)
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_malformed_retry_after_falls_back_to_backoff(self, provider, sample_payload):
+        """Test that an unparsable Retry-After falls back to jittered backoff."""
+        error = self._transient_error()
+        error.response = Mock()
+        error.response.headers = {"retry-after": "soon"}
+
+        mock_response = Mock()
+        mock_content_block = Mock()
+        mock_content_block.text = json.dumps({"headers": []})
+        mock_response.content = [mock_content_block]
+
+        provider.client.messages.create = Mock(side_effect=[error, mock_response])
+
+        with patch("template_sense.ai_providers.anthropic_provider.time.sleep") as mock_sleep:
+            provider.classify_fields(sample_payload)
+
+        delay = mock_sleep.call_args.args[0]
+        assert 1.0 <= delay <= 2.0  # 2**0 plus jitter in [0, 1)
+
+    def test_non_retryable_error_fails_immediately(self, provider, sample_payload):
+        """Test that a 401-style error is not retried."""
+        error = RuntimeError("Invalid key")
+        error.status_code = 401
+        provider.client.messages.create = Mock(side_effect=error)
+
+        with (
+            patch("template_sense.ai_providers.anthropic_provider.time.sleep") as mock_sleep,
+            pytest.raises(AIProviderError),
+        ):
+            provider.classify_fields(sample_payload)
+
+        assert provider.client.messages.create.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_retries_exhausted_raises_provider_error(self, provider, sample_payload):
+        """Test that persistent transient errors eventually surface."""
+        provider.client.messages.create = Mock(
+            side_effect=[self._transient_error() for _ in range(10)]
+        )
+
+        with (
+            patch("template_sense.ai_providers.anthropic_provider.time.sleep"),
+            pytest.raises(AIProviderError),
+        ):
+            provider.classify_fields(sample_payload)
+
+        assert provider.client.messages.create.call_count == 5
+
+
+class TestAnthropicProviderClassifyBatch:
+    """Test AnthropicProvider async batch classification."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create AnthropicProvider instance with mocked clients."""
+        config = AIConfig(provider="anthropic", api_key="sk-ant-test-key")
+        with (
+            patch("template_sense.ai_providers.anthropic_provider.Anthropic"),
+            patch("template_sense.ai_providers.anthropic_provider.AsyncAnthropic") as mock_async,
+        ):
+            # classify_batch awaits close() on the loop-bound client
+            mock_async.return_value.close = AsyncMock()
+            return AnthropicProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    @staticmethod
+    def _mock_response(body: dict) -> Mock:
+        """Build a mock Anthropic response with the given JSON body."""
+        mock_response = Mock()
+        mock_content_block = Mock()
+        mock_content_block.text = json.dumps(body)
+        mock_response.content = [mock_content_block]
+        return mock_response
+
+    def test_classify_batch_success(self, provider, sample_payload):
+        """Test batch classification returns one result per payload."""
+        response = self._mock_response({"headers": [{"raw_label": "Invoice"}]})
+        create_mock = AsyncMock(return_value=response)
+        provider.async_client.messages.create = create_mock
+
+        # Distinct payloads so the response cache does not collapse the batch
+        payloads = [sample_payload, dict(sample_payload, sheet_name="Sheet2")]
+        results = provider.classify_batch(payloads)
+
+        assert len(results) == 2
+        assert all(result["headers"][0]["raw_label"] == "Invoice" for result in results)
+        assert create_mock.call_count == 2
+
+    def test_classify_batch_rebuilds_async_client_per_run(self, provider, sample_payload):
+        """Test consecutive batches do not reuse a client bound to a dead loop."""
+        response = self._mock_response({"headers": []})
+
+        first_client = provider.async_client
+        first_client.messages.create = AsyncMock(return_value=response)
+        first_results = provider.classify_batch([sample_payload])
+
+        # The loop-bound client must be replaced once its loop is gone
+        second_client = provider.async_client
+        assert second_client is not first_client
+
+        second_client.messages.create = AsyncMock(return_value=response)
+        second_results = provider.classify_batch([dict(sample_payload, sheet_name="Sheet2")])
+
+        assert first_results == [{"headers": []}]
+        assert second_results == [{"headers": []}]
+
+    def test_classify_batch_partial_failure(self, provider, sample_payload):
+        """Test batch classification isolates per-payload failures."""
+        good_response = self._mock_response({"headers": []})
+        provider.async_client.messages.create = AsyncMock(
+            side_effect=[good_response, RuntimeError("Connection dropped")]
+        )
+
+        payloads = [sample_payload, dict(sample_payload, sheet_name="Sheet2")]
+        results = provider.classify_batch(payloads)
+
+        assert len(results) == 2
+        assert results[0] == {"headers": []}
+        assert isinstance(results[1], AIProviderError)
+        assert "Unexpected error" in results[1].error_details
+
+    def test_classify_batch_invalid_context(self, provider, sample_payload):
+        """Test batch classification with invalid context raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid context"):
+            provider.classify_batch([sample_payload], context="invalid_context")
+
+    def test_classify_fields_async_success(self, provider, sample_payload):
+        """Test single async classification mirrors the sync path."""
+        response = self._mock_response({"columns": [{"raw_label": "Item"}]})
+        provider.async_client.messages.create = AsyncMock(return_value=response)
+
+        result = asyncio.run(provider.classify_fields_async(sample_payload, context="columns"))
+
+        assert result["columns"][0]["raw_label"] == "Item"
+
+
+class TestAnthropicProviderResponseCache:
+    """Test the deterministic response cache around classification calls."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create AnthropicProvider instance with mocked client."""
+        config = AIConfig(provider="anthropic", api_key="sk-ant-test-key")
+        with patch("template_sense.ai_providers.anthropic_provider.Anthropic"):
+            return AnthropicProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [
+                {"row": 1, "col": 1, "label": "Invoice", "value": "12345", "score": 0.9}
+            ],
+            "table_candidates": [],
+            "field_dictionary": {"invoice_number": ["Invoice", "Invoice No"]},
+        }
+
+    @staticmethod
+    def _mock_response(body: dict) -> Mock:
+        """Build a mock API response carrying the given JSON body."""
+        response = Mock()
+        content_block = Mock()
+        content_block.text = json.dumps(body)
+        response.content = [content_block]
+        return response
+
+    def test_identical_payload_served_from_cache(self, provider, sample_payload):
+        """Test that a repeated identical classification skips the API call."""
+        response = self._mock_response({"headers": [{"raw_label": "Invoice"}]})
+        provider.client.messages.create = Mock(return_value=response)
+
+        first = provider.classify_fields(sample_payload)
+        second = provider.classify_fields(sample_payload)
+
+        assert first == second
+        provider.client.messages.create.assert_called_once()
+
+    def test_different_payloads_not_conflated(self, provider, sample_payload):
+        """Test that distinct payloads each trigger their own API call."""
+        response = self._mock_response({"headers": []})
+        provider.client.messages.create = Mock(return_value=response)
+
+        other_payload = dict(sample_payload, sheet_name="Sheet2")
+        provider.classify_fields(sample_payload)
+        provider.classify_fields(other_payload)
+
+        assert provider.client.messages.create.call_count == 2
+
+    def test_expired_entry_refetched(self, provider, sample_payload):
+        """Test that entries past the TTL trigger a fresh API call."""
+        response = self._mock_response({"headers": []})
+        provider.client.messages.create = Mock(return_value=response)
+
+        provider.classify_fields(sample_payload)
+        # Age the single cached entry beyond the TTL
+        ((key, (cached_at, text)),) = response_cache._response_cache.items()
+        response_cache._response_cache[key] = (
+            cached_at - response_cache.AI_RESPONSE_CACHE_TTL_SECONDS - 1,
+            text,
+        )
+        provider.classify_fields(sample_payload)
+
+        assert provider.client.messages.create.call_count == 2
+
+
+class TestAnthropicProviderStreaming:
+    """Test streaming of large classification responses."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create AnthropicProvider instance with mocked client."""
+        config = AIConfig(provider="anthropic", api_key="sk-ant-test-key")
+        with patch("template_sense.ai_providers.anthropic_provider.Anthropic"):
+            return AnthropicProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [
+                {"row": 1, "col": 1, "label": "Invoice", "value": "12345", "score": 0.9}
+            ],
+            "table_candidates": [],
+            "field_dictionary": {"invoice_number": ["Invoice", "Invoice No"]},
+        }
+
+    @staticmethod
+    def _mock_stream(text_chunks: list[str]) -> MagicMock:
+        """Build a mock messages.stream() context manager yielding the given chunks."""
+        stream_cm = MagicMock()
+        stream = stream_cm.__enter__.return_value
+        stream.text_stream = iter(text_chunks)
+        stream.get_final_message.return_value = Mock(usage=None)
+        return stream_cm
+
+    def test_large_payload_streams_response(self, provider, sample_payload):
+        """Test that payloads above the streaming threshold use messages.stream()."""
+        stream_cm = self._mock_stream(['{"headers": [{"raw_label":', ' "Invoice"}]}'])
+        provider.client.messages.stream = Mock(return_value=stream_cm)
+        provider.client.messages.create = Mock()
+
+        with patch.object(anthropic_provider, "AI_STREAMING_MIN_PAYLOAD_BYTES", 0):
+            result = provider.classify_fields(sample_payload)
+
+        assert result == {"headers": [{"raw_label": "Invoice"}]}
+        provider.client.messages.stream.assert_called_once()
+        provider.client.messages.create.assert_not_called()
+
+    def test_small_payload_does_not_stream(self, provider, sample_payload):
+        """Test that payloads below the streaming threshold use messages.create()."""
+        response = Mock()
+        content_block = Mock()
+        content_block.text = json.dumps({"headers": []})
+        response.content = [content_block]
+        provider.client.messages.create = Mock(return_value=response)
+        provider.client.messages.stream = Mock()
+
+        result = provider.classify_fields(sample_payload)
+
+        assert result == {"headers": []}
+        provider.client.messages.create.assert_called_once()
+        provider.client.messages.stream.assert_not_called()
+
+    def test_streamed_response_is_cached(self, provider, sample_payload):
+        """Test that a streamed response lands in the deterministic response cache."""
+        stream_cm = self._mock_stream(['{"headers": []}'])
+        provider.client.messages.stream = Mock(return_value=stream_cm)
+
+        with patch.object(anthropic_provider, "AI_STREAMING_MIN_PAYLOAD_BYTES", 0):
+            provider.classify_fields(sample_payload)
+            provider.classify_fields(sample_payload)
+
+        provider.client.messages.stream.assert_called_once()
+
+
 class TestAnthropicProviderTranslateText:
     """Test AnthropicProvider translate_text method."""
 
@@ -359,6 +775,34 @@ class TestAnthropicProviderTranslateText:
         assert result == "Invoice Number"
         provider.client.messages.create.assert_called_once()
 
+    def test_translate_text_async_success(self, provider):
+        """Test async translation mirrors the sync path."""
+        mock_response = Mock()
+        mock_content_block = Mock()
+        mock_content_block.text = "Invoice Number"
+        mock_response.content = [mock_content_block]
+
+        provider.async_client.messages.create = AsyncMock(return_value=mock_response)
+
+        result = asyncio.run(
+            provider.translate_text_async("請求書番号", source_lang="ja", target_lang="en")
+        )
+
+        assert result == "Invoice Number"
+        provider.async_client.messages.create.assert_awaited_once()
+
+    def test_translate_text_async_empty_response(self, provider):
+        """Test async translation raises on empty response."""
+        mock_response = Mock()
+        mock_response.content = []
+
+        provider.async_client.messages.create = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(AIProviderError) as exc_info:
+            asyncio.run(provider.translate_text_async("test", source_lang="ja"))
+
+        assert "Empty translation response" in exc_info.value.error_details
+
     def test_translate_text_authentication_error(self, provider):
         """Test translation with authentication error."""
         from anthropic import AuthenticationError
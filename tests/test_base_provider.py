@@ -15,8 +15,10 @@ from unittest.mock import Mock
 
 import pytest
 
+from template_sense.ai_providers import base_provider
 from template_sense.ai_providers.base_provider import BaseAIProvider
 from template_sense.ai_providers.config import AIConfig
+from template_sense.constants import SEMANTIC_CACHE_ENV_VAR
 from template_sense.errors import AIProviderError
 
 
@@ -58,6 +60,14 @@ class MockProvider(BaseAIProvider):
         return self.generate_response
 
 
+@pytest.fixture(autouse=True)
+def clear_translation_cache():
+    """Keep the module-level translation cache from leaking between tests."""
+    base_provider._translation_cache.clear()
+    yield
+    base_provider._translation_cache.clear()
+
+
 @pytest.fixture
 def mock_provider():
     """Create a mock provider for testing."""
@@ -124,12 +134,25 @@ class TestPromptBuilding:
         assert "table_index" in prompt
         assert "is_subtotal" in prompt
 
+    def test_system_prompts_overridable_per_instance(self, mock_provider):
+        """Test that rebinding _system_prompts customizes prompts without subclassing."""
+        mock_provider._system_prompts = {"headers": "custom headers prompt"}
+
+        assert mock_provider._build_system_prompt("headers") == "custom headers prompt"
+
+    def test_batch_system_prompt_memoized(self, mock_provider):
+        """Test that repeat batch prompts for the same contexts reuse one string."""
+        first = mock_provider._build_batch_system_prompt(["headers", "columns"])
+        second = mock_provider._build_batch_system_prompt(["headers", "columns"])
+
+        assert first is second
+
     def test_build_user_prompt_headers(self, mock_provider):
         """Test user prompt for headers context."""
         payload = {"header_fields": [{"label": "Invoice No"}]}
         prompt = mock_provider._build_user_prompt(payload, "headers")
         assert "invoice template header fields" in prompt
-        assert json.dumps(payload, indent=2) in prompt
+        assert json.dumps(payload, separators=(",", ":")) in prompt
         assert "JSON object" in prompt
 
     def test_build_user_prompt_columns(self, mock_provider):
@@ -137,14 +160,26 @@ class TestPromptBuilding:
         payload = {"table_columns": [{"label": "Item"}]}
         prompt = mock_provider._build_user_prompt(payload, "columns")
         assert "invoice table columns" in prompt
-        assert json.dumps(payload, indent=2) in prompt
+        assert json.dumps(payload, separators=(",", ":")) in prompt
 
     def test_build_user_prompt_line_items(self, mock_provider):
         """Test user prompt for line_items context."""
         payload = {"line_items": [{"row": 1}]}
         prompt = mock_provider._build_user_prompt(payload, "line_items")
         assert "invoice table line items" in prompt
-        assert json.dumps(payload, indent=2) in prompt
+        assert json.dumps(payload, separators=(",", ":")) in prompt
+
+    def test_build_user_prompt_payload_is_compact(self, mock_provider):
+        """Test that the serialized payload carries no pretty-print whitespace."""
+        payload = {
+            "header_fields": [
+                {"label": "Invoice No", "value": "INV-12345"},
+                {"label": "Due Date", "value": "2024-06-08"},
+            ]
+        }
+        prompt = mock_provider._build_user_prompt(payload, "headers")
+        # Indented JSON would contain newline + spaces; compact JSON must not
+        assert "\n " not in prompt
 
     def test_build_user_prompt_with_datetime_objects(self, mock_provider):
         """Test user prompt with datetime objects in payload."""
@@ -186,6 +221,171 @@ class TestExpectedResponseKey:
         assert key == "line_items"
 
 
+class TestPayloadSharding:
+    """Tests for the oversized-payload size guard and sharding."""
+
+    def test_oversized_columns_payload_is_sharded(self, mock_provider, monkeypatch):
+        """Test that an oversized payload is split and results re-merged."""
+        monkeypatch.setattr("template_sense.ai_providers.base_provider.MAX_AI_PAYLOAD_BYTES", 100)
+
+        payload = {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [
+                {"start_row": 1, "sample_data_rows": [["x" * 50]]},
+                {"start_row": 20, "sample_data_rows": [["y" * 50]]},
+            ],
+            "field_dictionary": {},
+        }
+
+        calls = []
+
+        def fake_classify_api(system_message, user_message):
+            calls.append(user_message)
+            # Each shard sees a single table, so indices restart at 0
+            return json.dumps({"columns": [{"raw_label": "Item", "table_block_index": 0}]})
+
+        mock_provider._call_classify_api = fake_classify_api
+
+        result = mock_provider.classify_fields(payload, context="columns")
+
+        assert len(calls) == 2
+        assert len(result["columns"]) == 2
+        # Second shard's index is shifted back to its absolute position
+        assert result["columns"][0]["table_block_index"] == 0
+        assert result["columns"][1]["table_block_index"] == 1
+
+    def test_unshardable_payload_is_sent_anyway(self, mock_provider, monkeypatch):
+        """Test that a single oversized candidate still goes through."""
+        monkeypatch.setattr("template_sense.ai_providers.base_provider.MAX_AI_PAYLOAD_BYTES", 100)
+
+        payload = {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [{"start_row": 1, "sample_data_rows": [["x" * 500]]}],
+            "field_dictionary": {},
+        }
+
+        mock_provider.classify_response = json.dumps({"columns": []})
+        result = mock_provider.classify_fields(payload, context="columns")
+
+        assert result == {"columns": []}
+
+    def test_small_payload_is_not_sharded(self, mock_provider):
+        """Test that payloads under the limit use a single request."""
+        payload = {"sheet_name": "Sheet1", "header_candidates": [], "table_candidates": []}
+
+        result = mock_provider.classify_fields(payload, context="headers")
+
+        assert result == {"headers": []}
+
+
+class TestClassifyFieldsBatch:
+    """Tests for row-marshaled multi-payload classification."""
+
+    @staticmethod
+    def _payload(sheet_name: str) -> dict:
+        return {
+            "sheet_name": sheet_name,
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    def test_batch_returns_one_result_per_payload(self, mock_provider):
+        """Test that N payloads produce N aligned results from one request."""
+        mock_provider.batch_classify_response = json.dumps(
+            [
+                {"headers": [{"raw_label": "Invoice"}]},
+                {"headers": []},
+            ]
+        )
+
+        results = mock_provider.classify_fields_batch(
+            [self._payload("Sheet1"), self._payload("Sheet2")], context="headers"
+        )
+
+        assert len(results) == 2
+        assert results[0]["headers"][0]["raw_label"] == "Invoice"
+        assert results[1] == {"headers": []}
+
+    def test_batch_prompt_numbers_inputs(self, mock_provider):
+        """Test that the user prompt marshals payloads as a numbered array."""
+        captured = {}
+
+        def capture(system_message, user_message):
+            captured["user"] = user_message
+            return json.dumps([{"headers": []}, {"headers": []}])
+
+        mock_provider._call_batch_classify_api = capture
+
+        mock_provider.classify_fields_batch(
+            [self._payload("Sheet1"), self._payload("Sheet2")], context="headers"
+        )
+
+        assert "2 invoice inputs" in captured["user"]
+        assert '"input_index":0' in captured["user"]
+        assert '"input_index":1' in captured["user"]
+
+    def test_batch_empty_payloads(self, mock_provider):
+        """Test that an empty payload list short-circuits without an API call."""
+        assert mock_provider.classify_fields_batch([], context="headers") == []
+
+    def test_batch_single_payload_uses_single_call(self, mock_provider):
+        """Test that a one-element batch delegates to classify_fields."""
+        mock_provider.classify_response = '{"headers": [{"raw_label": "Invoice"}]}'
+
+        results = mock_provider.classify_fields_batch([self._payload("Sheet1")])
+
+        assert results == [{"headers": [{"raw_label": "Invoice"}]}]
+
+    def test_batch_wrong_result_count_raises(self, mock_provider):
+        """Test that a response array of the wrong length raises AIProviderError."""
+        mock_provider.batch_classify_response = json.dumps([{"headers": []}])
+
+        with pytest.raises(AIProviderError) as exc_info:
+            mock_provider.classify_fields_batch(
+                [self._payload("Sheet1"), self._payload("Sheet2")], context="headers"
+            )
+
+        assert "Expected JSON array of 2 results" in exc_info.value.error_details
+
+    def test_batch_missing_expected_key_raises(self, mock_provider):
+        """Test that a result missing the context key raises AIProviderError."""
+        mock_provider.batch_classify_response = json.dumps([{"headers": []}, {"wrong": []}])
+
+        with pytest.raises(AIProviderError) as exc_info:
+            mock_provider.classify_fields_batch(
+                [self._payload("Sheet1"), self._payload("Sheet2")], context="headers"
+            )
+
+        assert "Batch result 1 missing 'headers' key" in exc_info.value.error_details
+
+    def test_batch_invalid_context_raises(self, mock_provider):
+        """Test that an invalid context raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid context"):
+            mock_provider.classify_fields_batch([self._payload("Sheet1")], context="bogus")
+
+    def test_oversized_batch_splits_into_sub_batches(self, mock_provider, monkeypatch):
+        """Test that an over-limit batch is halved until each request fits."""
+        monkeypatch.setattr(base_provider, "MAX_AI_PAYLOAD_BYTES", 600)
+        calls = []
+
+        def capture(system_message, user_message):
+            calls.append(user_message)
+            return json.dumps([{"headers": []}, {"headers": []}])
+
+        mock_provider._call_batch_classify_api = capture
+
+        results = mock_provider.classify_fields_batch(
+            [self._payload(f"Sheet{i}") for i in range(4)], context="headers"
+        )
+
+        assert results == [{"headers": []}] * 4
+        assert len(calls) == 2
+        assert all("2 invoice inputs" in call for call in calls)
+
+
 class TestResponseParsing:
     """Tests for response parsing and validation."""
 
@@ -285,6 +485,151 @@ class TestTranslateText:
             mock_provider.translate_text("text", "ja", "en")
 
 
+class TestTranslateTexts:
+    """Tests for batched translation via translate_texts()."""
+
+    @staticmethod
+    def _echo_translate(calls):
+        """Build a _call_generate_api stub that records calls and echoes inputs."""
+
+        def fake_generate(prompt, system_message, max_tokens, temperature, json_mode):
+            calls.append(prompt)
+            texts = json.loads(prompt)["texts"]
+            return json.dumps({"translations": [f"{t}-en" for t in texts]})
+
+        return fake_generate
+
+    def test_single_request_for_batch(self, mock_provider):
+        """Test that N texts are translated in one API call, in order."""
+        calls = []
+        mock_provider._call_generate_api = self._echo_translate(calls)
+
+        result = mock_provider.translate_texts(["請求書番号", "合計", "数量"], "ja", "en")
+
+        assert result == ["請求書番号-en", "合計-en", "数量-en"]
+        assert len(calls) == 1
+
+    def test_duplicates_sent_once(self, mock_provider):
+        """Test that repeated inputs are deduplicated before the API call."""
+        calls = []
+        mock_provider._call_generate_api = self._echo_translate(calls)
+
+        result = mock_provider.translate_texts(["合計", "数量", "合計"], "ja", "en")
+
+        assert result == ["合計-en", "数量-en", "合計-en"]
+        assert json.loads(calls[0])["texts"] == ["合計", "数量"]
+
+    def test_cached_texts_skip_api(self, mock_provider):
+        """Test that previously translated texts are served from the cache."""
+        calls = []
+        mock_provider._call_generate_api = self._echo_translate(calls)
+        mock_provider.translate_texts(["合計"], "ja", "en")
+
+        result = mock_provider.translate_texts(["合計", "数量"], "ja", "en")
+
+        assert result == ["合計-en", "数量-en"]
+        assert len(calls) == 2
+        assert json.loads(calls[1])["texts"] == ["数量"]
+
+    def test_empty_input_returns_empty_list(self, mock_provider):
+        """Test that an empty batch makes no API call."""
+        calls = []
+        mock_provider._call_generate_api = self._echo_translate(calls)
+
+        assert mock_provider.translate_texts([], "ja", "en") == []
+        assert calls == []
+
+    def test_misaligned_response_splits_batch(self, mock_provider):
+        """Test that a length mismatch splits the batch in half and retries."""
+        calls = []
+
+        def fake_generate(prompt, system_message, max_tokens, temperature, json_mode):
+            calls.append(prompt)
+            texts = json.loads(prompt)["texts"]
+            if len(texts) > 1:
+                return json.dumps({"translations": ["only one"]})
+            return json.dumps({"translations": [f"{texts[0]}-en"]})
+
+        mock_provider._call_generate_api = fake_generate
+
+        result = mock_provider.translate_texts(["合計", "数量"], "ja", "en")
+
+        assert result == ["合計-en", "数量-en"]
+        assert len(calls) == 3  # misaligned pair, then two single retries
+
+    def test_misaligned_single_text_raises(self, mock_provider):
+        """Test that a misaligned single-text batch raises AIProviderError."""
+        mock_provider._call_generate_api = (
+            lambda prompt, system_message, max_tokens, temperature, json_mode: json.dumps(
+                {"translations": []}
+            )
+        )
+
+        with pytest.raises(AIProviderError, match="not aligned"):
+            mock_provider.translate_texts(["合計"], "ja", "en")
+
+
+class TestTranslationCache:
+    """Tests for within-run translation deduplication."""
+
+    def test_exact_duplicates_always_deduped(self, mock_provider):
+        """Test that a byte-identical repeat translation skips the API call."""
+        calls = []
+        mock_provider._call_translate_api = lambda s, u: calls.append(u) or "Invoice Number"
+
+        first = mock_provider.translate_text("請求書番号", "ja", "en")
+        second = mock_provider.translate_text("請求書番号", "ja", "en")
+
+        assert first == second == "Invoice Number"
+        assert len(calls) == 1
+
+    def test_variants_not_conflated_by_default(self, mock_provider):
+        """Test that cosmetic variants are separate entries when normalization is off."""
+        calls = []
+        mock_provider._call_translate_api = lambda s, u: calls.append(u) or "Invoice Number"
+
+        mock_provider.translate_text("請求書番号", "ja", "en")
+        mock_provider.translate_text("請求書番号:", "ja", "en")
+
+        assert len(calls) == 2
+
+    def test_normalized_variants_share_entry(self, mock_provider, monkeypatch):
+        """Test that whitespace/punctuation variants are served from cache."""
+        monkeypatch.setenv(SEMANTIC_CACHE_ENV_VAR, "1")
+        calls = []
+        mock_provider._call_translate_api = lambda s, u: calls.append(u) or "Invoice Number"
+
+        first = mock_provider.translate_text("請求書番号", "ja", "en")
+        second = mock_provider.translate_text("  請求書番号: ", "ja", "en")
+
+        assert first == second == "Invoice Number"
+        assert len(calls) == 1
+
+    def test_different_languages_not_conflated(self, mock_provider, monkeypatch):
+        """Test that the same text in different language pairs is re-fetched."""
+        monkeypatch.setenv(SEMANTIC_CACHE_ENV_VAR, "1")
+        calls = []
+        mock_provider._call_translate_api = lambda s, u: calls.append(u) or "translated"
+
+        mock_provider.translate_text("請求書番号", "ja", "en")
+        mock_provider.translate_text("請求書番号", "zh", "en")
+
+        assert len(calls) == 2
+
+    def test_cache_evicts_oldest_entry(self, mock_provider, monkeypatch):
+        """Test that the cache stays bounded by evicting LRU entries."""
+        monkeypatch.setenv(SEMANTIC_CACHE_ENV_VAR, "1")
+        monkeypatch.setattr(base_provider, "TRANSLATION_CACHE_MAX_ENTRIES", 2)
+        mock_provider._call_translate_api = lambda s, u: f"translated {u}"
+
+        mock_provider.translate_text("one", "ja", "en")
+        mock_provider.translate_text("two", "ja", "en")
+        mock_provider.translate_text("three", "ja", "en")
+
+        assert len(base_provider._translation_cache) == 2
+        assert ("mock-model", "ja", "en", "one") not in base_provider._translation_cache
+
+
 class TestErrorWrapping:
     """Tests for error wrapping and exception mapping."""
 
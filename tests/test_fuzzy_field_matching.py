@@ -15,6 +15,7 @@ import pytest
 
 from template_sense.ai.translation import TranslatedLabel
 from template_sense.mapping.fuzzy_field_matching import (
+    _build_exact_index,
     _calculate_similarity,
     _find_best_match,
     _normalize_text,
@@ -634,3 +635,41 @@ def test_find_best_match_below_threshold_returns_none(sample_field_dictionary):
     assert canonical_key is None
     assert score < 80.0
     assert variant is None
+
+
+def test_build_exact_index_normalizes_and_breaks_ties():
+    """Test _build_exact_index normalizes variants and prefers lexicographic ties."""
+    field_dict = {
+        "zeta_field": ["Common Label"],
+        "alpha_field": ["  COMMON   Label  "],
+        "invoice_number": ["Invoice No"],
+    }
+    index = _build_exact_index(field_dict)
+    assert index["invoice no"] == ("invoice_number", "Invoice No")
+    # Duplicate normalized variant resolves to lexicographically smallest key
+    assert index["common label"][0] == "alpha_field"
+
+
+def test_exact_match_skips_fuzzy_scoring(sample_field_dictionary, monkeypatch):
+    """Test that verbatim dictionary variants bypass the fuzzy scorer entirely."""
+
+    def fail_similarity(text1: str, text2: str) -> float:
+        raise AssertionError("fuzzy scorer should not run for exact matches")
+
+    monkeypatch.setattr(
+        "template_sense.mapping.fuzzy_field_matching._calculate_similarity",
+        fail_similarity,
+    )
+
+    labels = [
+        TranslatedLabel(
+            original_text="請求書番号",
+            translated_text="Invoice No",
+            detected_source_language="ja",
+        )
+    ]
+    results = match_fields(labels, sample_field_dictionary, threshold=80.0)
+
+    assert results[0].canonical_key == "invoice_number"
+    assert results[0].match_score == 100.0
+    assert results[0].matched_variant == "Invoice No"
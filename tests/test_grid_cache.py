@@ -0,0 +1,106 @@
+"""
+Unit tests for the grid extraction disk cache.
+
+Tests cover:
+- Opt-in enablement via environment variable
+- Content-addressed key computation
+- Store/load round-trips
+- Graceful degradation on corrupt or stale entries
+"""
+
+import pickle
+
+import pytest
+
+from template_sense.constants import GRID_CACHE_DIR_ENV_VAR, GRID_CACHE_ENV_VAR
+from template_sense.extraction.grid_cache import (
+    compute_grid_cache_key,
+    grid_cache_enabled,
+    load_cached_extraction,
+    store_cached_extraction,
+)
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache directory at a temporary location."""
+    monkeypatch.setenv(GRID_CACHE_DIR_ENV_VAR, str(tmp_path))
+    return tmp_path
+
+
+# ============================================================
+# Test: Enablement
+# ============================================================
+
+
+def test_cache_disabled_by_default(monkeypatch):
+    """Test that the cache is off unless explicitly enabled."""
+    monkeypatch.delenv(GRID_CACHE_ENV_VAR, raising=False)
+    assert grid_cache_enabled() is False
+
+
+def test_cache_enabled_via_env_var(monkeypatch):
+    """Test that setting the environment variable to 1 enables the cache."""
+    monkeypatch.setenv(GRID_CACHE_ENV_VAR, "1")
+    assert grid_cache_enabled() is True
+
+
+# ============================================================
+# Test: Key Computation
+# ============================================================
+
+
+def test_key_is_content_addressed(tmp_path):
+    """Test that the key depends on file contents, not path."""
+    file_a = tmp_path / "a.xlsx"
+    file_b = tmp_path / "b.xlsx"
+    file_a.write_bytes(b"same content")
+    file_b.write_bytes(b"same content")
+
+    assert compute_grid_cache_key(file_a) == compute_grid_cache_key(file_b)
+
+    file_b.write_bytes(b"different content")
+    assert compute_grid_cache_key(file_a) != compute_grid_cache_key(file_b)
+
+
+def test_key_returns_none_for_missing_file(tmp_path):
+    """Test that an unreadable file yields None instead of raising."""
+    assert compute_grid_cache_key(tmp_path / "missing.xlsx") is None
+
+
+# ============================================================
+# Test: Store/Load Round-Trip
+# ============================================================
+
+
+def test_store_and_load_round_trip(cache_dir):
+    """Test that a stored extraction result loads back identically."""
+    grid = [["Invoice No", "Date"], ["INV-001", "2024-01-01"]]
+    summary = {"header_blocks": [], "table_blocks": []}
+
+    store_cached_extraction("abc123", "Sheet1", grid, summary)
+    cached = load_cached_extraction("abc123")
+
+    assert cached == ("Sheet1", grid, summary)
+
+
+def test_load_miss_returns_none(cache_dir):
+    """Test that a missing entry is a clean miss."""
+    assert load_cached_extraction("does-not-exist") is None
+
+
+def test_corrupt_entry_returns_none(cache_dir):
+    """Test that an unreadable entry degrades to a miss."""
+    (cache_dir / "bad.pkl").write_bytes(b"not a pickle")
+    assert load_cached_extraction("bad") is None
+
+
+def test_stale_format_returns_none(cache_dir):
+    """Test that entries with an unknown format version are ignored."""
+    with (cache_dir / "stale.pkl").open("wb") as f:
+        pickle.dump((999, "Sheet1", [], {}), f)
+    assert load_cached_extraction("stale") is None
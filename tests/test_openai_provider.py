@@ -8,13 +8,20 @@ This module tests the OpenAIProvider class, including:
 - Configuration handling
 """
 
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from template_sense.ai_providers import base_provider, openai_provider, response_cache
 from template_sense.ai_providers.config import AIConfig
-from template_sense.ai_providers.openai_provider import OpenAIProvider
+from template_sense.ai_providers.openai_provider import (
+    OpenAIProvider,
+    _classify_response_budget,
+    _translate_response_budget,
+)
+from template_sense.constants import DEFAULT_CLASSIFY_MAX_TOKENS, DEFAULT_TRANSLATE_MAX_TOKENS
 from template_sense.errors import AIProviderError
 
 
@@ -66,13 +73,50 @@ class TestOpenAIProviderInitialization:
             provider = OpenAIProvider(config)
             assert provider.model == "gpt-3.5-turbo"
 
-    def test_model_property_defaults_to_gpt4(self):
-        """Test model property defaults to gpt-4o when not configured."""
+    def test_model_property_defaults_to_gpt4o_mini(self):
+        """Test model property defaults to gpt-4o-mini when not configured."""
         config = AIConfig(provider="openai", api_key="sk-test-key")
 
         with patch("template_sense.ai_providers.openai_provider.OpenAI"):
             provider = OpenAIProvider(config)
-            assert provider.model == "gpt-4o"
+            assert provider.model == "gpt-4o-mini"
+
+    def test_same_config_reuses_cached_client(self):
+        """Test providers with identical credentials share one client."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI") as mock_client_cls,
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            first = OpenAIProvider(config)
+            second = OpenAIProvider(config)
+
+        assert first.client is second.client
+        assert mock_client_cls.call_count == 1
+
+    def test_different_timeout_gets_distinct_client(self):
+        """Test providers with different timeouts do not share a client."""
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI") as mock_client_cls,
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            OpenAIProvider(AIConfig(provider="openai", api_key="sk-test-key", timeout_seconds=30))
+            OpenAIProvider(AIConfig(provider="openai", api_key="sk-test-key", timeout_seconds=60))
+
+        assert mock_client_cls.call_count == 2
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Clear the module-level caches so tests get fresh mocked clients and no cached responses."""
+    openai_provider._client_cache.clear()
+    response_cache._response_cache.clear()
+    base_provider._translation_cache.clear()
+    yield
+    openai_provider._client_cache.clear()
+    response_cache._response_cache.clear()
+    base_provider._translation_cache.clear()
 
 
 class TestOpenAIProviderClassifyFields:
@@ -315,6 +359,743 @@ class TestOpenAIProviderClassifyFields:
         assert "Unexpected error" in error.error_details
 
 
+class TestOpenAIProviderPromptCacheKey:
+    """Test the prompt_cache_key passed for server-side prompt caching."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked client."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            return OpenAIProvider(config)
+
+    def test_classify_passes_stable_prompt_cache_key(self, provider):
+        """Test that identical system prompts map to one stable cache key."""
+        response = Mock()
+        response.choices = [Mock(message=Mock(content='{"headers": []}'))]
+        provider.client.chat.completions.create = Mock(return_value=response)
+
+        payload = {"sheet_name": "Sheet1", "header_candidates": [], "table_candidates": []}
+        provider.classify_fields(payload)
+        provider.classify_fields(dict(payload, sheet_name="Sheet2"))
+
+        keys = {
+            call.kwargs["prompt_cache_key"]
+            for call in provider.client.chat.completions.create.call_args_list
+        }
+        assert len(keys) == 1
+        (key,) = keys
+        assert key.startswith("template-sense-")
+
+    def test_different_contexts_get_distinct_cache_keys(self, provider):
+        """Test that different system prompts produce different cache keys."""
+        from template_sense.ai_providers.openai_provider import _prompt_cache_key
+
+        headers_key = _prompt_cache_key(provider._build_system_prompt("headers"))
+        columns_key = _prompt_cache_key(provider._build_system_prompt("columns"))
+
+        assert headers_key != columns_key
+
+
+class TestOpenAIProviderRetry:
+    """Test retry-with-backoff behavior for transient API errors."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked clients."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            return OpenAIProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    @staticmethod
+    def _transient_error() -> Exception:
+        """Build an exception that looks like a retryable API error."""
+        error = RuntimeError("Rate limited")
+        error.status_code = 429
+        return error
+
+    @staticmethod
+    def _mock_response(content: str) -> Mock:
+        """Build a chat-completion response mock with the given content."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        return mock_response
+
+    def test_transient_error_is_retried(self, provider, sample_payload):
+        """Test that a 429 is retried and the call eventually succeeds."""
+        provider.client.chat.completions.create = Mock(
+            side_effect=[
+                self._transient_error(),
+                self._transient_error(),
+                self._mock_response(json.dumps({"headers": []})),
+            ]
+        )
+
+        with patch("template_sense.ai_providers.openai_provider.time.sleep") as mock_sleep:
+            result = provider.classify_fields(sample_payload)
+
+        assert result == {"headers": []}
+        assert provider.client.chat.completions.create.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_retry_after_header_overrides_backoff(self, provider, sample_payload):
+        """Test that a server-provided Retry-After delay is honored."""
+        error = self._transient_error()
+        error.response = Mock()
+        error.response.headers = {"retry-after": "7"}
+
+        provider.client.chat.completions.create = Mock(
+            side_effect=[error, self._mock_response(json.dumps({"headers": []}))]
+        )
+
+        with patch("template_sense.ai_providers.openai_provider.time.sleep") as mock_sleep:
+            provider.classify_fields(sample_payload)
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_non_retryable_error_fails_immediately(self, provider, sample_payload):
+        """Test that a 401-style error is not retried."""
+        error = RuntimeError("Invalid key")
+        error.status_code = 401
+        provider.client.chat.completions.create = Mock(side_effect=error)
+
+        with (
+            patch("template_sense.ai_providers.openai_provider.time.sleep") as mock_sleep,
+            pytest.raises(AIProviderError),
+        ):
+            provider.classify_fields(sample_payload)
+
+        assert provider.client.chat.completions.create.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_retries_exhausted_raises_provider_error(self, provider, sample_payload):
+        """Test that persistent transient errors eventually surface."""
+        provider.client.chat.completions.create = Mock(
+            side_effect=[self._transient_error() for _ in range(10)]
+        )
+
+        with (
+            patch("template_sense.ai_providers.openai_provider.time.sleep"),
+            pytest.raises(AIProviderError),
+        ):
+            provider.classify_fields(sample_payload)
+
+        assert provider.client.chat.completions.create.call_count == 5
+
+
+class TestOpenAIProviderRateLimiting:
+    """Test client-side rate limiter wiring."""
+
+    def test_no_limits_disables_limiter(self):
+        """Test that the limiter is not constructed without configured limits."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            provider = OpenAIProvider(config)
+
+        assert provider._rate_limiter is None
+
+    def test_limiter_acquires_before_request(self):
+        """Test that each API call draws from the configured budget."""
+        config = AIConfig(provider="openai", api_key="sk-test-key", requests_per_minute=100)
+
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            provider = OpenAIProvider(config)
+
+        assert provider._rate_limiter is not None
+        provider._rate_limiter = Mock()
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({"headers": []})
+        provider.client.chat.completions.create = Mock(return_value=mock_response)
+
+        provider.classify_fields(
+            {
+                "sheet_name": "Sheet1",
+                "header_candidates": [],
+                "table_candidates": [],
+                "field_dictionary": {},
+            }
+        )
+
+        provider._rate_limiter.acquire.assert_called_once()
+        estimated = provider._rate_limiter.acquire.call_args.args[0]
+        assert estimated > 0
+
+
+class TestOpenAIProviderTokenBudgets:
+    """Test input-derived max_tokens budgets and truncation retry."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked clients."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            return OpenAIProvider(config)
+
+    @staticmethod
+    def _mock_response(content: str, finish_reason: str = "stop") -> Mock:
+        """Build a chat-completion response mock with the given finish reason."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        mock_response.choices[0].finish_reason = finish_reason
+        return mock_response
+
+    def test_classify_budget_scales_with_input(self):
+        """Test that the classification budget grows with payload size."""
+        small = _classify_response_budget("x" * 100)
+        large = _classify_response_budget("x" * 1000)
+
+        assert small < large
+        assert large <= DEFAULT_CLASSIFY_MAX_TOKENS
+
+    def test_classify_budget_is_capped(self):
+        """Test that huge payloads cannot exceed the hard ceiling."""
+        assert _classify_response_budget("x" * 100_000) == DEFAULT_CLASSIFY_MAX_TOKENS
+
+    def test_translate_budget_scales_with_text(self):
+        """Test that the translation budget follows the input length."""
+        assert _translate_response_budget("請求書番号") == 5 // 2 + 64
+        assert _translate_response_budget("x" * 100_000) == DEFAULT_TRANSLATE_MAX_TOKENS
+
+    def test_classification_passes_max_tokens(self, provider):
+        """Test that classification requests carry a bounded max_tokens."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_response(json.dumps({"headers": []}))
+        )
+
+        provider.classify_fields(
+            {
+                "sheet_name": "Sheet1",
+                "header_candidates": [],
+                "table_candidates": [],
+                "field_dictionary": {},
+            }
+        )
+
+        max_tokens = provider.client.chat.completions.create.call_args.kwargs["max_tokens"]
+        assert 0 < max_tokens <= DEFAULT_CLASSIFY_MAX_TOKENS
+
+    def test_truncated_response_retried_with_cap(self, provider):
+        """Test that a length-truncated response is reissued with the full cap."""
+        provider.client.chat.completions.create = Mock(
+            side_effect=[
+                self._mock_response('{"headers": [', finish_reason="length"),
+                self._mock_response(json.dumps({"headers": []})),
+            ]
+        )
+
+        result = provider.classify_fields(
+            {
+                "sheet_name": "Sheet1",
+                "header_candidates": [],
+                "table_candidates": [],
+                "field_dictionary": {},
+            }
+        )
+
+        assert result == {"headers": []}
+        assert provider.client.chat.completions.create.call_count == 2
+        retry_kwargs = provider.client.chat.completions.create.call_args.kwargs
+        assert retry_kwargs["max_tokens"] == DEFAULT_CLASSIFY_MAX_TOKENS
+
+    def test_truncation_at_cap_is_not_retried(self, provider):
+        """Test that a response truncated at the cap is returned as-is."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_response('{"headers": [', finish_reason="length")
+        )
+
+        response = provider._create_with_token_budget(
+            max_tokens=DEFAULT_CLASSIFY_MAX_TOKENS,
+            cap=DEFAULT_CLASSIFY_MAX_TOKENS,
+            model=provider.model,
+            messages=[],
+        )
+
+        assert provider.client.chat.completions.create.call_count == 1
+        assert response.choices[0].finish_reason == "length"
+
+
+class TestOpenAIProviderStructuredOutputs:
+    """Test strict json_schema response formats for classification."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked clients."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            return OpenAIProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    @staticmethod
+    def _mock_response(content: str) -> Mock:
+        """Build a chat-completion response mock with the given content."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        mock_response.choices[0].finish_reason = "stop"
+        return mock_response
+
+    def test_headers_context_uses_strict_schema(self, provider, sample_payload):
+        """Test that headers classification sends a strict json_schema."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_response(json.dumps({"headers": []}))
+        )
+
+        provider.classify_fields(sample_payload, context="headers")
+
+        response_format = provider.client.chat.completions.create.call_args.kwargs[
+            "response_format"
+        ]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+        assert response_format["json_schema"]["schema"]["required"] == ["headers"]
+
+    def test_columns_context_uses_strict_schema(self, provider, sample_payload):
+        """Test that columns classification sends its own strict schema."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_response(json.dumps({"columns": []}))
+        )
+
+        provider.classify_fields(sample_payload, context="columns")
+
+        response_format = provider.client.chat.completions.create.call_args.kwargs[
+            "response_format"
+        ]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["schema"]["required"] == ["columns"]
+
+    def test_line_items_context_falls_back_to_json_object(self, provider, sample_payload):
+        """Test that line_items keeps json_object (free-form columns map)."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_response(json.dumps({"line_items": []}))
+        )
+
+        provider.classify_fields(sample_payload, context="line_items")
+
+        response_format = provider.client.chat.completions.create.call_args.kwargs[
+            "response_format"
+        ]
+        assert response_format == {"type": "json_object"}
+
+    def test_unknown_system_prompt_falls_back_to_json_object(self):
+        """Test that unmapped prompts (e.g., batch prompts) get json_object."""
+        assert openai_provider._response_format_for("some combined batch prompt") == {
+            "type": "json_object"
+        }
+
+
+class TestOpenAIProviderStreaming:
+    """Test streaming of large classification responses."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked clients."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI"),
+        ):
+            return OpenAIProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [
+                {"row": 1, "col": 1, "label": "Invoice", "value": "12345", "score": 0.9}
+            ],
+            "table_candidates": [],
+            "field_dictionary": {"invoice_number": ["Invoice", "Invoice No"]},
+        }
+
+    @staticmethod
+    def _mock_stream(text_chunks: list[str]):
+        """Build an iterator of streaming chunks carrying the given text pieces."""
+        chunks = []
+        for text in text_chunks:
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = text
+            chunks.append(chunk)
+        return iter(chunks)
+
+    @staticmethod
+    def _mock_response(content: str) -> Mock:
+        """Build a non-streaming chat-completion response mock."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        mock_response.choices[0].finish_reason = "stop"
+        return mock_response
+
+    def test_large_payload_streams_response(self, provider, sample_payload):
+        """Test that payloads above the streaming threshold use stream=True."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_stream(['{"headers": [{"raw_label":', ' "Invoice"}]}'])
+        )
+
+        with patch.object(openai_provider, "AI_STREAMING_MIN_PAYLOAD_BYTES", 0):
+            result = provider.classify_fields(sample_payload)
+
+        assert result == {"headers": [{"raw_label": "Invoice"}]}
+        create_kwargs = provider.client.chat.completions.create.call_args.kwargs
+        assert create_kwargs["stream"] is True
+
+    def test_small_payload_does_not_stream(self, provider, sample_payload):
+        """Test that payloads below the streaming threshold use a plain create."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_response(json.dumps({"headers": []}))
+        )
+
+        result = provider.classify_fields(sample_payload)
+
+        assert result == {"headers": []}
+        create_kwargs = provider.client.chat.completions.create.call_args.kwargs
+        assert "stream" not in create_kwargs
+
+    def test_streamed_response_is_cached(self, provider, sample_payload):
+        """Test that a streamed response lands in the deterministic response cache."""
+        provider.client.chat.completions.create = Mock(
+            return_value=self._mock_stream(['{"headers": []}'])
+        )
+
+        with patch.object(openai_provider, "AI_STREAMING_MIN_PAYLOAD_BYTES", 0):
+            provider.classify_fields(sample_payload)
+            provider.classify_fields(sample_payload)
+
+        provider.client.chat.completions.create.assert_called_once()
+
+
+class TestOpenAIProviderClassifyBatch:
+    """Test OpenAIProvider async batch classification."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked clients."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with (
+            patch("template_sense.ai_providers.openai_provider.OpenAI"),
+            patch("template_sense.ai_providers.openai_provider.AsyncOpenAI") as mock_async,
+        ):
+            # classify_batch awaits close() on the loop-bound client
+            mock_async.return_value.close = AsyncMock()
+            return OpenAIProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    @staticmethod
+    def _mock_response(body: dict) -> Mock:
+        """Build a mock chat completion response with the given JSON body."""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content=json.dumps(body)))]
+        return mock_response
+
+    def test_classify_batch_success(self, provider, sample_payload):
+        """Test batch classification returns one result per payload."""
+        response = self._mock_response({"headers": [{"raw_label": "Invoice"}]})
+        create_mock = AsyncMock(return_value=response)
+        provider.async_client.chat.completions.create = create_mock
+
+        payloads = [sample_payload, dict(sample_payload, sheet_name="Sheet2")]
+        results = provider.classify_batch(payloads)
+
+        assert len(results) == 2
+        assert all(result["headers"][0]["raw_label"] == "Invoice" for result in results)
+        assert create_mock.call_count == 2
+
+    def test_classify_batch_rebuilds_async_client_per_run(self, provider, sample_payload):
+        """Test consecutive batches do not reuse a client bound to a dead loop."""
+        response = self._mock_response({"headers": []})
+
+        first_client = provider.async_client
+        first_client.chat.completions.create = AsyncMock(return_value=response)
+        first_results = provider.classify_batch([sample_payload])
+
+        # The loop-bound client must be replaced once its loop is gone
+        second_client = provider.async_client
+        assert second_client is not first_client
+
+        second_client.chat.completions.create = AsyncMock(return_value=response)
+        second_results = provider.classify_batch([dict(sample_payload, sheet_name="Sheet2")])
+
+        assert first_results == [{"headers": []}]
+        assert second_results == [{"headers": []}]
+
+    def test_classify_batch_partial_failure(self, provider, sample_payload):
+        """Test batch classification isolates per-payload failures."""
+        good_response = self._mock_response({"headers": []})
+        provider.async_client.chat.completions.create = AsyncMock(
+            side_effect=[good_response, RuntimeError("Connection dropped")]
+        )
+
+        payloads = [sample_payload, dict(sample_payload, sheet_name="Sheet2")]
+        results = provider.classify_batch(payloads)
+
+        assert len(results) == 2
+        assert results[0] == {"headers": []}
+        assert isinstance(results[1], AIProviderError)
+        assert "Unexpected error" in results[1].error_details
+
+    def test_classify_batch_invalid_context(self, provider, sample_payload):
+        """Test batch classification with invalid context raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid context"):
+            provider.classify_batch([sample_payload], context="invalid_context")
+
+    def test_classify_fields_async_success(self, provider, sample_payload):
+        """Test single async classification mirrors the sync path."""
+        response = self._mock_response({"columns": [{"raw_label": "Item"}]})
+        provider.async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        result = asyncio.run(provider.classify_fields_async(sample_payload, context="columns"))
+
+        assert result["columns"][0]["raw_label"] == "Item"
+
+    def test_translate_text_async_success(self, provider):
+        """Test async translation returns the translated text."""
+        response = Mock()
+        response.choices = [Mock(message=Mock(content="  Invoice Number  "))]
+        provider.async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        result = asyncio.run(provider.translate_text_async("請求書番号", "ja", "en"))
+
+        assert result == "Invoice Number"
+
+    def test_translate_text_async_empty_response(self, provider):
+        """Test async translation with empty response raises AIProviderError."""
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=""))]
+        provider.async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        with pytest.raises(AIProviderError, match="Empty translation response"):
+            asyncio.run(provider.translate_text_async("text", "ja", "en"))
+
+    def test_translate_text_async_uses_shared_cache(self, provider):
+        """Test async translation reuses and refills the sync path's cache."""
+        response = Mock()
+        response.choices = [Mock(message=Mock(content="Invoice Number"))]
+        create_mock = AsyncMock(return_value=response)
+        provider.async_client.chat.completions.create = create_mock
+
+        first = asyncio.run(provider.translate_text_async("請求書番号", "ja", "en"))
+        second = asyncio.run(provider.translate_text_async("請求書番号", "ja", "en"))
+
+        assert first == second == "Invoice Number"
+        create_mock.assert_awaited_once()
+        # The sync path reads the same cache, so it must not hit the API either
+        assert provider.translate_text("請求書番号", "ja", "en") == "Invoice Number"
+
+
+class TestOpenAIProviderClassifyBulk:
+    """Test OpenAIProvider Batch API bulk classification."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked client."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            return OpenAIProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [],
+            "table_candidates": [],
+            "field_dictionary": {},
+        }
+
+    @staticmethod
+    def _output_line(index: int, body: dict) -> str:
+        """Build one Batch API output JSONL line for request cls-{index}."""
+        return json.dumps(
+            {
+                "custom_id": f"cls-{index}",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": json.dumps(body)}}]},
+                },
+            }
+        )
+
+    def test_bulk_success(self, provider, sample_payload):
+        """Test that a completed batch yields aligned per-payload results."""
+        provider.client.files.create = Mock(return_value=Mock(id="file-in"))
+        provider.client.batches.create = Mock(return_value=Mock(id="batch-1", status="validating"))
+        provider.client.batches.retrieve = Mock(
+            side_effect=[
+                Mock(id="batch-1", status="in_progress"),
+                Mock(id="batch-1", status="completed", output_file_id="file-out"),
+            ]
+        )
+        # Output arrives out of order; results must realign by custom_id
+        output_text = "\n".join(
+            [
+                self._output_line(1, {"headers": []}),
+                self._output_line(0, {"headers": [{"raw_label": "Invoice"}]}),
+            ]
+        )
+        provider.client.files.content = Mock(return_value=Mock(text=output_text))
+
+        with patch("template_sense.ai_providers.openai_provider.time.sleep") as mock_sleep:
+            results = provider.classify_fields_bulk(
+                [sample_payload, dict(sample_payload, sheet_name="Sheet2")]
+            )
+
+        assert results[0] == {"headers": [{"raw_label": "Invoice"}]}
+        assert results[1] == {"headers": []}
+        mock_sleep.assert_called_once()
+        provider.client.batches.create.assert_called_once_with(
+            input_file_id="file-in",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+    def test_bulk_failed_batch_raises(self, provider, sample_payload):
+        """Test that a batch ending in a failed state raises AIProviderError."""
+        provider.client.files.create = Mock(return_value=Mock(id="file-in"))
+        provider.client.batches.create = Mock(return_value=Mock(id="batch-1", status="validating"))
+        provider.client.batches.retrieve = Mock(return_value=Mock(id="batch-1", status="failed"))
+
+        with pytest.raises(AIProviderError, match="status 'failed'"):
+            provider.classify_fields_bulk([sample_payload])
+
+    def test_bulk_per_request_error_in_slot(self, provider, sample_payload):
+        """Test that a failed request lands as an error in its result slot."""
+        provider.client.files.create = Mock(return_value=Mock(id="file-in"))
+        provider.client.batches.create = Mock(return_value=Mock(id="batch-1", status="validating"))
+        provider.client.batches.retrieve = Mock(
+            return_value=Mock(id="batch-1", status="completed", output_file_id="file-out")
+        )
+        output_text = "\n".join(
+            [
+                self._output_line(0, {"headers": []}),
+                json.dumps(
+                    {
+                        "custom_id": "cls-1",
+                        "response": {"status_code": 429},
+                        "error": {"message": "Rate limited"},
+                    }
+                ),
+            ]
+        )
+        provider.client.files.content = Mock(return_value=Mock(text=output_text))
+
+        results = provider.classify_fields_bulk(
+            [sample_payload, dict(sample_payload, sheet_name="Sheet2")]
+        )
+
+        assert results[0] == {"headers": []}
+        assert isinstance(results[1], AIProviderError)
+        assert "Rate limited" in results[1].error_details
+
+    def test_bulk_empty_payloads(self, provider):
+        """Test that an empty payload list short-circuits without an upload."""
+        provider.client.files.create = Mock()
+
+        assert provider.classify_fields_bulk([]) == []
+        provider.client.files.create.assert_not_called()
+
+
+class TestOpenAIProviderResponseCache:
+    """Test the deterministic response cache around classification calls."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create OpenAIProvider instance with mocked client."""
+        config = AIConfig(provider="openai", api_key="sk-test-key")
+        with patch("template_sense.ai_providers.openai_provider.OpenAI"):
+            return OpenAIProvider(config)
+
+    @pytest.fixture
+    def sample_payload(self):
+        """Sample AI payload for testing."""
+        return {
+            "sheet_name": "Sheet1",
+            "header_candidates": [
+                {"row": 1, "col": 1, "label": "Invoice", "value": "12345", "score": 0.9}
+            ],
+            "table_candidates": [],
+            "field_dictionary": {"invoice_number": ["Invoice", "Invoice No"]},
+        }
+
+    @staticmethod
+    def _mock_response(body: dict) -> Mock:
+        """Build a mock chat completion response with the given JSON body."""
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=json.dumps(body)))]
+        return response
+
+    def test_identical_payload_served_from_cache(self, provider, sample_payload):
+        """Test that a repeated identical classification skips the API call."""
+        response = self._mock_response({"headers": [{"raw_label": "Invoice"}]})
+        provider.client.chat.completions.create = Mock(return_value=response)
+
+        first = provider.classify_fields(sample_payload)
+        second = provider.classify_fields(sample_payload)
+
+        assert first == second
+        provider.client.chat.completions.create.assert_called_once()
+
+    def test_different_payloads_not_conflated(self, provider, sample_payload):
+        """Test that distinct payloads each trigger their own API call."""
+        response = self._mock_response({"headers": []})
+        provider.client.chat.completions.create = Mock(return_value=response)
+
+        other_payload = dict(sample_payload, sheet_name="Sheet2")
+        provider.classify_fields(sample_payload)
+        provider.classify_fields(other_payload)
+
+        assert provider.client.chat.completions.create.call_count == 2
+
+
 class TestOpenAIProviderTranslateText:
     """Test OpenAIProvider translate_text method."""
 
@@ -10,11 +10,14 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from template_sense.errors import FileValidationError, InvalidFieldDictionaryError
+from template_sense.ai.translation import TranslatedLabel
+from template_sense.errors import AIProviderError, FileValidationError, InvalidFieldDictionaryError
+from template_sense.pipeline.stages.ai_classification import AIClassificationStage
 from template_sense.pipeline.stages.ai_provider_setup import AIProviderSetupStage
 from template_sense.pipeline.stages.base import PipelineContext
 from template_sense.pipeline.stages.file_loading import FileLoadingStage
 from template_sense.pipeline.stages.metadata import MetadataStage
+from template_sense.pipeline.stages.translation import TranslationStage
 from template_sense.pipeline.stages.validation import ValidationStage
 from template_sense.recovery.error_recovery import RecoveryEvent, RecoverySeverity
 
@@ -307,8 +310,8 @@ class TestMetadataStage:
         # Metadata should be set
         assert result.metadata is not None
         assert result.metadata["sheet_name"] == "Sheet1"
-        # Workbook should be closed
-        mock_workbook.close.assert_called_once()
+        # Closing is owned by the pipeline runner, not the stage
+        mock_workbook.close.assert_not_called()
 
     def test_metadata_stage_without_ai_provider(self):
         """MetadataStage works without AI provider."""
@@ -328,5 +331,128 @@ class TestMetadataStage:
         # Metadata should still be set
         assert result.metadata is not None
         assert result.metadata["sheet_name"] == "Sheet1"
-        # Workbook should be closed
-        mock_workbook.close.assert_called_once()
+        # Closing is owned by the pipeline runner, not the stage
+        mock_workbook.close.assert_not_called()
+
+
+class TestAIClassificationStage:
+    """Test AIClassificationStage batch-failure fallback."""
+
+    def _make_context(self):
+        context = PipelineContext(
+            file_path=Path("test.xlsx"),
+            field_dictionary={"headers": {"invoice_number": "Invoice number"}, "columns": {}},
+        )
+        context.ai_provider = Mock()
+        context.ai_provider.classify_all_fields.side_effect = AIProviderError(
+            provider_name="openai",
+            error_details="batch request failed",
+        )
+        context.ai_payload = {"sheet_name": "Sheet1"}
+        return context
+
+    def test_batch_failure_falls_back_to_individual_calls(self):
+        """Batch failure triggers concurrent individual calls and a WARNING event."""
+        context = self._make_context()
+
+        with (
+            patch(
+                "template_sense.pipeline.stages.ai_classification.classify_header_fields"
+            ) as mock_headers,
+            patch(
+                "template_sense.pipeline.stages.ai_classification.classify_table_columns"
+            ) as mock_columns,
+            patch(
+                "template_sense.pipeline.stages.ai_classification.extract_line_items"
+            ) as mock_items,
+        ):
+            mock_headers.return_value = ["header-result"]
+            mock_columns.return_value = ["column-result"]
+            mock_items.return_value = ["item-result"]
+
+            stage = AIClassificationStage()
+            result = stage.execute(context)
+
+        assert result.classified_headers == ["header-result"]
+        assert result.classified_columns == ["column-result"]
+        assert result.extracted_line_items == ["item-result"]
+
+        warning_events = [
+            e for e in result.recovery_events if e.severity == RecoverySeverity.WARNING
+        ]
+        assert len(warning_events) == 1
+        assert "falling back" in warning_events[0].message
+
+    def test_individual_failure_records_error_and_keeps_other_results(self):
+        """One individual call failing leaves its result empty without affecting others."""
+        context = self._make_context()
+
+        with (
+            patch(
+                "template_sense.pipeline.stages.ai_classification.classify_header_fields"
+            ) as mock_headers,
+            patch(
+                "template_sense.pipeline.stages.ai_classification.classify_table_columns"
+            ) as mock_columns,
+            patch(
+                "template_sense.pipeline.stages.ai_classification.extract_line_items"
+            ) as mock_items,
+        ):
+            mock_headers.return_value = ["header-result"]
+            mock_columns.side_effect = AIProviderError(
+                provider_name="openai",
+                error_details="columns request failed",
+            )
+            mock_items.return_value = ["item-result"]
+
+            stage = AIClassificationStage()
+            result = stage.execute(context)
+
+        assert result.classified_headers == ["header-result"]
+        assert result.classified_columns == []
+        assert result.extracted_line_items == ["item-result"]
+
+        error_events = [e for e in result.recovery_events if e.severity == RecoverySeverity.ERROR]
+        assert len(error_events) == 1
+        assert "columns" in error_events[0].message
+
+
+class TestTranslationStage:
+    """Test TranslationStage ASCII fast path."""
+
+    def _make_context(self, labels):
+        context = PipelineContext(
+            file_path=Path("test.xlsx"),
+            field_dictionary={"headers": {}, "columns": {}},
+        )
+        context.ai_provider = Mock()
+        context.classified_headers = [Mock(raw_label=label) for label in labels]
+        return context
+
+    def test_ascii_labels_skip_provider_call(self):
+        """All-ASCII labels map to identity translations with no provider request."""
+        context = self._make_context(["Invoice Number", "Due Date"])
+
+        with patch("template_sense.pipeline.stages.translation.translate_labels") as mock_translate:
+            stage = TranslationStage()
+            result = stage.execute(context)
+
+        mock_translate.assert_not_called()
+        assert result.translation_map["Invoice Number"].translated_text == "Invoice Number"
+        assert result.translation_map["Due Date"].translated_text == "Due Date"
+
+    def test_only_non_ascii_labels_sent_for_translation(self):
+        """Mixed labels send only the non-ASCII bucket to the provider."""
+        context = self._make_context(["Invoice Number", "請求書番号"])
+
+        with patch("template_sense.pipeline.stages.translation.translate_labels") as mock_translate:
+            mock_translate.return_value = [
+                TranslatedLabel(original_text="請求書番号", translated_text="invoice number")
+            ]
+            stage = TranslationStage()
+            result = stage.execute(context)
+
+        mock_translate.assert_called_once()
+        assert mock_translate.call_args[1]["labels"] == ["請求書番号"]
+        assert result.translation_map["Invoice Number"].translated_text == "Invoice Number"
+        assert result.translation_map["請求書番号"].translated_text == "invoice number"
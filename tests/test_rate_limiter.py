@@ -0,0 +1,120 @@
+"""
+Tests for the client-side token-bucket rate limiter.
+
+This module tests the TokenBucket class and token estimation helper,
+including budget accounting, refill over time, and server-feedback clamping.
+"""
+
+from unittest.mock import patch
+
+from template_sense.ai_providers import rate_limiter
+from template_sense.ai_providers.rate_limiter import TokenBucket, estimate_tokens
+
+_MONOTONIC = "template_sense.ai_providers.rate_limiter.time.monotonic"
+_SLEEP = "template_sense.ai_providers.rate_limiter.time.sleep"
+
+
+class TestEstimateTokens:
+    """Tests for the byte-length token estimate."""
+
+    def test_four_bytes_per_token(self):
+        """Test that the estimate follows the 1 token ~= 4 bytes heuristic."""
+        assert estimate_tokens("a" * 400) == 100
+
+    def test_minimum_of_one(self):
+        """Test that even empty text counts as one token."""
+        assert estimate_tokens("") == 1
+
+    def test_multibyte_text_counts_bytes(self):
+        """Test that CJK text is estimated from its UTF-8 byte length."""
+        # 10 chars x 3 bytes each = 30 bytes -> 7 tokens
+        assert estimate_tokens("請" * 10) == 7
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket budget accounting."""
+
+    def test_no_limits_never_waits(self):
+        """Test that an unlimited bucket acquires without sleeping."""
+        bucket = TokenBucket()
+
+        with patch(_SLEEP) as mock_sleep:
+            for _ in range(100):
+                bucket.acquire(10_000)
+
+        mock_sleep.assert_not_called()
+
+    def test_requests_within_budget_do_not_wait(self):
+        """Test that requests under the RPM limit pass through immediately."""
+        with patch(_MONOTONIC, return_value=0.0), patch(_SLEEP) as mock_sleep:
+            bucket = TokenBucket(requests_per_minute=2)
+            bucket.acquire()
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_exhausted_request_budget_waits(self):
+        """Test that exceeding the RPM limit sleeps until budget refills."""
+        with patch(_MONOTONIC, return_value=0.0), patch(_SLEEP) as mock_sleep:
+            bucket = TokenBucket(requests_per_minute=2)
+            bucket.acquire()
+            bucket.acquire()
+            bucket.acquire()
+
+        # One request over budget at 2 req/min = 30s until it refills
+        mock_sleep.assert_called_once_with(30.0)
+
+    def test_exhausted_token_budget_waits(self):
+        """Test that exceeding the TPM limit sleeps proportionally to the overdraft."""
+        with patch(_MONOTONIC, return_value=0.0), patch(_SLEEP) as mock_sleep:
+            bucket = TokenBucket(tokens_per_minute=600)
+            bucket.acquire(400)
+            bucket.acquire(400)
+
+        # 200 tokens over budget at 600 tok/min = 20s until they refill
+        mock_sleep.assert_called_once_with(20.0)
+
+    def test_budget_refills_over_time(self):
+        """Test that elapsed time restores budget up to the configured limit."""
+        with patch(_MONOTONIC) as mock_monotonic, patch(_SLEEP) as mock_sleep:
+            mock_monotonic.return_value = 0.0
+            bucket = TokenBucket(requests_per_minute=2)
+            bucket.acquire()
+            bucket.acquire()
+            # 30 seconds later, one request of budget has refilled
+            mock_monotonic.return_value = 30.0
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_update_from_headers_clamps_budget(self):
+        """Test that server-advertised remaining quota lowers the local budget."""
+        with patch(_MONOTONIC, return_value=0.0), patch(_SLEEP) as mock_sleep:
+            bucket = TokenBucket(requests_per_minute=10)
+            bucket.update_from_headers({"x-ratelimit-remaining-requests": "1"})
+            bucket.acquire()
+            bucket.acquire()
+
+        # Second request exceeds the clamped budget of 1 -> must wait
+        assert mock_sleep.call_count == 1
+
+    def test_update_from_headers_ignores_missing_headers(self):
+        """Test that None or header-less responses leave the budget unchanged."""
+        bucket = TokenBucket(requests_per_minute=10)
+
+        bucket.update_from_headers(None)
+        bucket.update_from_headers({"unrelated": "header"})
+
+        assert bucket._request_budget == 10.0
+
+    def test_update_from_headers_never_raises_budget(self):
+        """Test that a higher server quota does not inflate the local budget."""
+        bucket = TokenBucket(requests_per_minute=10)
+
+        bucket.update_from_headers({"x-ratelimit-remaining-requests": "500"})
+
+        assert bucket._request_budget == 10.0
+
+    def test_module_exports(self):
+        """Test that the public names are exported."""
+        assert set(rate_limiter.__all__) == {"TokenBucket", "estimate_tokens"}
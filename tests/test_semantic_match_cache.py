@@ -0,0 +1,158 @@
+"""
+Unit tests for the semantic-match disk cache.
+
+Tests cover:
+- Opt-in enablement via environment variable
+- Dictionary fingerprint stability and sensitivity
+- Store/load round-trips
+- Graceful degradation on corrupt or stale entries
+- match_fields integration: cache hits skip the AI provider
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from template_sense.ai.translation import TranslatedLabel
+from template_sense.constants import (
+    SEMANTIC_MATCH_CACHE_DIR_ENV_VAR,
+    SEMANTIC_MATCH_CACHE_ENV_VAR,
+)
+from template_sense.mapping.fuzzy_field_matching import match_fields
+from template_sense.mapping.semantic_match_cache import (
+    compute_dictionary_fingerprint,
+    compute_semantic_cache_key,
+    load_cached_semantic_match,
+    semantic_match_cache_enabled,
+    store_cached_semantic_match,
+)
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the cache and point it at a temporary location."""
+    monkeypatch.setenv(SEMANTIC_MATCH_CACHE_ENV_VAR, "1")
+    monkeypatch.setenv(SEMANTIC_MATCH_CACHE_DIR_ENV_VAR, str(tmp_path))
+    return tmp_path
+
+
+# ============================================================
+# Test: Enablement
+# ============================================================
+
+
+def test_cache_disabled_by_default(monkeypatch):
+    """Test that the cache is off unless explicitly enabled."""
+    monkeypatch.delenv(SEMANTIC_MATCH_CACHE_ENV_VAR, raising=False)
+    assert semantic_match_cache_enabled() is False
+
+
+def test_cache_enabled_via_env_var(monkeypatch):
+    """Test that setting the environment variable to 1 enables the cache."""
+    monkeypatch.setenv(SEMANTIC_MATCH_CACHE_ENV_VAR, "1")
+    assert semantic_match_cache_enabled() is True
+
+
+# ============================================================
+# Test: Fingerprint and Key Computation
+# ============================================================
+
+
+def test_fingerprint_insensitive_to_key_order():
+    """Test that dictionary insertion order does not change the fingerprint."""
+    dict_a = {"shipper": ["Shipper", "From"], "consignee": ["Consignee", "To"]}
+    dict_b = {"consignee": ["Consignee", "To"], "shipper": ["Shipper", "From"]}
+    assert compute_dictionary_fingerprint(dict_a) == compute_dictionary_fingerprint(dict_b)
+
+
+def test_fingerprint_changes_with_contents():
+    """Test that adding a variant produces a different fingerprint."""
+    dict_a = {"shipper": ["Shipper", "From"]}
+    dict_b = {"shipper": ["Shipper", "From", "Sender"]}
+    assert compute_dictionary_fingerprint(dict_a) != compute_dictionary_fingerprint(dict_b)
+
+
+def test_cache_key_varies_by_label_and_fingerprint():
+    """Test that the cache key depends on both the label and the fingerprint."""
+    assert compute_semantic_cache_key("FROM", "fp1") != compute_semantic_cache_key("TO", "fp1")
+    assert compute_semantic_cache_key("FROM", "fp1") != compute_semantic_cache_key("FROM", "fp2")
+
+
+# ============================================================
+# Test: Store/Load Round-Trip
+# ============================================================
+
+
+def test_store_and_load_round_trip(cache_dir):
+    """Test that a stored semantic match loads back identically."""
+    store_cached_semantic_match("abc123", "shipper", 0.95, "FROM indicates sender")
+    assert load_cached_semantic_match("abc123") == ("shipper", 0.95, "FROM indicates sender")
+
+
+def test_load_miss_returns_none(cache_dir):
+    """Test that a missing entry is a clean miss."""
+    assert load_cached_semantic_match("does-not-exist") is None
+
+
+def test_corrupt_entry_returns_none(cache_dir):
+    """Test that an unreadable entry degrades to a miss."""
+    (cache_dir / "sem-bad.json").write_text("not json", encoding="utf-8")
+    assert load_cached_semantic_match("bad") is None
+
+
+def test_stale_format_returns_none(cache_dir):
+    """Test that entries with an unknown format version are ignored."""
+    entry = {"version": 999, "canonical_key": "shipper", "confidence": 0.9, "reasoning": None}
+    (cache_dir / "sem-stale.json").write_text(json.dumps(entry), encoding="utf-8")
+    assert load_cached_semantic_match("stale") is None
+
+
+# ============================================================
+# Test: match_fields Integration
+# ============================================================
+
+
+def test_match_fields_cache_hit_skips_ai_provider(cache_dir):
+    """Test that a cached semantic match resolves without calling the provider."""
+    field_dict = {"shipper": ["Shipper"]}
+    fingerprint = compute_dictionary_fingerprint(field_dict)
+    key = compute_semantic_cache_key("SHIP FROM", fingerprint)
+    store_cached_semantic_match(key, "shipper", 0.95, "ship-from indicates sender")
+
+    ai_provider = Mock()
+    results = match_fields(
+        translated_labels=[TranslatedLabel(original_text="出荷元", translated_text="SHIP FROM")],
+        field_dictionary=field_dict,
+        ai_provider=ai_provider,
+        enable_semantic_matching=True,
+    )
+
+    assert results[0].canonical_key == "shipper"
+    assert results[0].match_score == 95.0
+    ai_provider.generate_text.assert_not_called()
+
+
+def test_match_fields_stores_accepted_semantic_match(cache_dir):
+    """Test that an accepted semantic match is persisted for future runs."""
+    field_dict = {"shipper": ["Shipper"]}
+    ai_response = json.dumps(
+        {"canonical_key": "shipper", "confidence": 0.9, "reasoning": "sender field"}
+    )
+    ai_provider = Mock()
+    ai_provider.generate_text.return_value = ai_response
+
+    match_fields(
+        translated_labels=[TranslatedLabel(original_text="出荷元", translated_text="SHIP FROM")],
+        field_dictionary=field_dict,
+        ai_provider=ai_provider,
+        enable_semantic_matching=True,
+    )
+
+    fingerprint = compute_dictionary_fingerprint(field_dict)
+    key = compute_semantic_cache_key("SHIP FROM", fingerprint)
+    assert load_cached_semantic_match(key) == ("shipper", 0.9, "sender field")
@@ -7,8 +7,11 @@ Created: 2025-12-05
 import datetime
 import json
 
+import pytest
+
 from template_sense.serialization import (
     _serialize_value,
+    deserialize_from_json,
     make_json_serializable,
     serialize_to_json,
 )
@@ -166,7 +169,7 @@ class TestSerializeToJson:
         result = serialize_to_json(obj)
         # Should be compact (no newlines)
         assert "\n" not in result
-        assert result == '{"date": "2024-05-08"}'
+        assert json.loads(result) == {"date": "2024-05-08"}
 
     def test_complex_payload(self):
         """Test complex nested payload serialization."""
@@ -184,3 +187,31 @@ class TestSerializeToJson:
             "items": [{"date": "2024-05-01"}, {"date": "2024-05-02"}],
         }
         assert parsed == expected
+
+    def test_non_ascii_text_not_escaped(self):
+        """Test that CJK text stays as raw UTF-8 instead of \\uXXXX escapes."""
+        result = serialize_to_json({"label": "請求書番号"})
+        assert "請求書番号" in result
+
+    def test_non_ascii_text_not_escaped_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback also emits raw UTF-8."""
+        from template_sense import serialization
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        result = serialize_to_json({"label": "請求書番号"})
+        assert "請求書番号" in result
+
+
+class TestDeserializeFromJson:
+    """Test deserialize_from_json function."""
+
+    def test_round_trip(self):
+        """Test that serialized payloads parse back to equivalent objects."""
+        obj = {"date": datetime.date(2024, 5, 8), "items": [1, 2.5, "three", None, True]}
+        parsed = deserialize_from_json(serialize_to_json(obj))
+        assert parsed == {"date": "2024-05-08", "items": [1, 2.5, "three", None, True]}
+
+    def test_invalid_json_raises_stdlib_decode_error(self):
+        """Test that invalid JSON raises an error catchable as json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            deserialize_from_json("{not valid json")
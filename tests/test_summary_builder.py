@@ -708,3 +708,16 @@ class TestBuildSheetSummary:
 
         # Results should be identical
         assert result1 == result2
+
+    def test_pre_extracted_grid_skips_extraction(self):
+        """Test passing a pre-extracted grid avoids a second workbook traversal."""
+        mock_workbook = Mock(spec=ExcelWorkbook)
+        mock_workbook.get_sheet_names.return_value = ["Sheet1"]
+
+        with patch("template_sense.extraction.summary_builder.extract_raw_grid") as mock_extract:
+            result = build_sheet_summary(
+                mock_workbook, sheet_name="Sheet1", grid=[["test", "data"]]
+            )
+
+            mock_extract.assert_not_called()
+            assert result["sheet_name"] == "Sheet1"
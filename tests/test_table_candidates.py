@@ -290,6 +290,90 @@ def test_cluster_block_bounding_box():
     assert block.col_end == 4
 
 
+def test_cluster_with_row_summaries_matches_rescan():
+    """Test that cached row summaries yield the same blocks as a grid re-scan."""
+    from template_sense.extraction.table_candidates import _find_table_candidate_rows_summarized
+
+    grid = [
+        ["Invoice No: 123", None, None],  # Row 1: metadata
+        [None, "Item", "Price"],  # Row 2: table header
+        ["Widget A", 10, 25.50],  # Row 3: data
+        ["Widget B", 5, 40.00],  # Row 4: data
+    ]
+
+    scored_rows, summaries = _find_table_candidate_rows_summarized(grid, min_score=0.5)
+    blocks_cached = cluster_table_blocks(
+        grid, scored_rows, min_consecutive=3, row_summaries=summaries
+    )
+    blocks_rescanned = cluster_table_blocks(grid, scored_rows, min_consecutive=3)
+
+    assert blocks_cached == blocks_rescanned
+
+
+def test_boolean_cells_score_as_text_not_numeric():
+    """Test that boolean cells are treated as text flags, not numeric amounts."""
+    bool_row = ["Widget", True, 10]
+    text_row = ["Widget", "flag", 10]
+
+    assert score_row_as_table_candidate(bool_row, 1) == score_row_as_table_candidate(text_row, 1)
+
+
+def test_row_memoization_distinguishes_bool_from_int():
+    """Test that memoized scoring does not alias bool rows with equal int rows."""
+    from template_sense.extraction.table_candidates import _score_rows
+
+    # True == 1 as a dict key, but booleans scan as text while ints scan as
+    # typed numerics; the memo must not reuse the first row's summary
+    rows = [["Widget", True, True], ["Widget", 1, 1]]
+
+    _, summaries = _score_rows(rows, first_row_idx=1, min_score=0.0)
+
+    assert summaries[0].typed_numeric == 0
+    assert summaries[1].typed_numeric == 2
+
+
+def test_parallel_scoring_matches_serial(monkeypatch):
+    """Test that the opt-in parallel scoring path matches serial results."""
+    from template_sense.extraction import table_candidates
+    from template_sense.extraction.table_candidates import _find_table_candidate_rows_summarized
+
+    grid = [
+        ["Invoice No: 123", None, None],
+        [None, "Item", "Price"],
+        ["Widget A", 10, 25.50],
+        ["Widget B", 5, 40.00],
+        [None, None, None],
+    ] * 4
+
+    serial_candidates, serial_summaries = _find_table_candidate_rows_summarized(grid, min_score=0.5)
+
+    monkeypatch.setenv("TEMPLATE_SENSE_PARALLEL_SCORING", "1")
+    monkeypatch.setattr(table_candidates, "PARALLEL_SCORING_MIN_ROWS", 1)
+    parallel_candidates, parallel_summaries = _find_table_candidate_rows_summarized(
+        grid, min_score=0.5
+    )
+
+    assert parallel_candidates == serial_candidates
+    assert parallel_summaries == serial_summaries
+
+
+def test_repeated_and_unhashable_rows_score_consistently():
+    """Test that memoized repeated rows and unhashable rows score like fresh scans."""
+    from template_sense.extraction.table_candidates import _find_table_candidate_rows_summarized
+
+    repeated_row = ["Widget A", 10, 25.50]
+    unhashable_row = [["nested"], 10, 25.50]  # list cell cannot be hashed
+    grid = [repeated_row, repeated_row, repeated_row, unhashable_row, unhashable_row]
+
+    scored_rows, summaries = _find_table_candidate_rows_summarized(grid, min_score=0.0)
+
+    assert len(summaries) == len(grid)
+    for row_idx, row in enumerate(grid, start=1):
+        expected = score_row_as_table_candidate(row, row_idx)
+        score = next(s for idx, s in scored_rows if idx == row_idx)
+        assert score == expected
+
+
 # ============================================================================
 # Test: detect_table_candidate_blocks (main entry point)
 # ============================================================================
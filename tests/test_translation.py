@@ -574,3 +574,76 @@ class TestTranslateLabelsEdgeCases:
         mock_provider.translate_text.assert_called_once()
         call_kwargs = mock_provider.translate_text.call_args[1]
         assert call_kwargs["target_lang"] == DEFAULT_TARGET_LANGUAGE
+
+
+# ============================================================
+# Test: Batch Translation Path
+# ============================================================
+
+
+class TestTranslateLabelsBatchPath:
+    """Tests for the translate_texts() batch fast path."""
+
+    @pytest.fixture
+    def batch_provider(self):
+        """Mock provider that also exposes translate_texts()."""
+        provider = Mock()
+        provider.provider_name = "test-provider"
+        provider.model = "test-model"
+        return provider
+
+    def test_batch_path_used_when_available(self, batch_provider):
+        """Test that translate_texts() handles all labels in one call."""
+        batch_provider.translate_texts.return_value = ["invoice number", "issue date"]
+
+        result = translate_labels(
+            ai_provider=batch_provider,
+            labels=["請求書番号", "発行日"],
+            source_language="ja",
+            target_language="en",
+        )
+
+        assert [t.translated_text for t in result] == ["invoice number", "issue date"]
+        batch_provider.translate_texts.assert_called_once_with(["請求書番号", "発行日"], "ja", "en")
+        batch_provider.translate_text.assert_not_called()
+
+    def test_batch_failure_falls_back_to_per_label(self, batch_provider):
+        """Test that a failed batch call falls back to per-label requests."""
+        batch_provider.translate_texts.side_effect = AIProviderError(
+            provider_name="test-provider",
+            error_details="batch failed",
+            request_type="translate_texts",
+        )
+        batch_provider.translate_text.return_value = "invoice number"
+
+        result = translate_labels(
+            ai_provider=batch_provider,
+            labels=["請求書番号"],
+            source_language="ja",
+        )
+
+        assert result[0].translated_text == "invoice number"
+        batch_provider.translate_text.assert_called_once()
+
+    def test_batch_length_mismatch_falls_back(self, batch_provider):
+        """Test that a misaligned batch response falls back to per-label requests."""
+        batch_provider.translate_texts.return_value = ["only one"]
+        batch_provider.translate_text.side_effect = ["invoice number", "issue date"]
+
+        result = translate_labels(
+            ai_provider=batch_provider,
+            labels=["請求書番号", "発行日"],
+            source_language="ja",
+        )
+
+        assert [t.translated_text for t in result] == ["invoice number", "issue date"]
+        assert batch_provider.translate_text.call_count == 2
+
+    def test_provider_without_batch_method_uses_per_label(self, mock_provider):
+        """Test that spec'd providers without translate_texts() use the loop."""
+        mock_provider.translate_text.return_value = "invoice number"
+
+        result = translate_labels(ai_provider=mock_provider, labels=["請求書番号"])
+
+        assert result[0].translated_text == "invoice number"
+        mock_provider.translate_text.assert_called_once()